@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-file zipapp: the archive holds the code and template,
+scaffolds from it match scaffolds from the checkout, and the CLI runs from an
+empty directory with nothing but the .pyz.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+sys.path.insert(0, str(TEMPLATE_ROOT / 'dev_tools'))
+
+from mvp_quickstart.bundle import ASSET_PACKAGE, BUNDLE_INFO, build_zipapp
+from quick_start import scaffold
+from test_render_cache import tree, without_timestamps
+
+# Scaffold from the bundled template in a fresh interpreter that has only the archive on its path
+SCAFFOLD_FROM_PYZ = '''
+import json, sys
+sys.path.insert(0, {pyz!r})
+from mvp_quickstart.bundle import bundled_root
+from quick_start import scaffold
+result = scaffold(bundled_root(), {target!r}, {key!r}, 'Bundled App', rule_output='sharded',
+                  cache_dir={cache!r})
+print(json.dumps({{'success': result.success, 'error': result.error, 'steps': result.steps,
+                  'rules': result.rules, 'cache': result.metrics.get('render_cache'),
+                  'modules': sorted(m for m in sys.modules if m.startswith(('quick_start', 'mvp_quickstart')))}}))
+'''
+
+
+def run_pyz_scaffold(pyz: Path, target: Path, key: str, cache=None) -> dict:
+    code = SCAFFOLD_FROM_PYZ.format(pyz=str(pyz), target=str(target), key=key, cache=cache and str(cache))
+    output = subprocess.run([sys.executable, '-c', code], cwd=target.parent, capture_output=True, text=True,
+                            check=True, timeout=120).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_archive_contents():
+    with tempfile.TemporaryDirectory(prefix='mvp-bundle-') as tmp:
+        first = build_zipapp(TEMPLATE_ROOT, Path(tmp) / 'first.pyz')
+        second = build_zipapp(TEMPLATE_ROOT, Path(tmp) / 'second.pyz')
+        assert first['template'] == second['template']
+        assert zipfile.ZipFile(first['path']).namelist() == zipfile.ZipFile(second['path']).namelist()
+        assert first['path'].read_bytes().startswith(b'#!/usr/bin/env python3\n')
+        names = set(zipfile.ZipFile(first['path']).namelist())
+        assert {'__main__.py', 'quick_start.py', 'quick_start.pyc', 'mvp_quickstart/bundle.pyc',
+                f'{ASSET_PACKAGE}/architectures.json', f'{ASSET_PACKAGE}/{BUNDLE_INFO}'} <= names
+        rules = {path.name for path in (TEMPLATE_ROOT / '.cursor' / 'rules').glob('*.mdc')}
+        assert {f'{ASSET_PACKAGE}/.cursor/rules/{rule}' for rule in rules} <= names
+        assert not any('__pycache__' in name for name in names)
+
+
+def test_bundled_scaffold_matches_checkout():
+    with tempfile.TemporaryDirectory(prefix='mvp-bundle-') as tmp:
+        pyz = build_zipapp(TEMPLATE_ROOT, Path(tmp) / 'mvp.pyz')['path']
+        for key in ('django', 'react'):
+            bundled = run_pyz_scaffold(pyz, Path(tmp) / f'{key}-pyz', key)
+            assert bundled['success'], bundled['error']
+            assert all(str(TEMPLATE_ROOT) not in module for module in bundled['modules'])
+            checkout = scaffold(TEMPLATE_ROOT, Path(tmp) / f'{key}-checkout', key, 'Bundled App',
+                                rule_output='sharded')
+            assert (bundled['steps'], bundled['rules']) == (checkout.steps, checkout.rules), key
+            assert without_timestamps(tree(Path(tmp) / f'{key}-pyz')) == without_timestamps(
+                tree(checkout.project_root)), key
+
+        cache = Path(tmp) / 'cache'
+        assert run_pyz_scaffold(pyz, Path(tmp) / 'cached-1', 'vue', cache)['cache'] == 'miss'
+        assert run_pyz_scaffold(pyz, Path(tmp) / 'cached-2', 'vue', cache)['cache'] == 'hit'
+
+
+def test_cli_runs_from_archive_alone():
+    with tempfile.TemporaryDirectory(prefix='mvp-bundle-') as tmp:
+        build = subprocess.run([sys.executable, str(TEMPLATE_ROOT / 'quick_start.py'), '--build-pyz',
+                                str(Path(tmp) / 'dist' / 'mvp.pyz')], cwd=TEMPLATE_ROOT, capture_output=True,
+                               text=True, timeout=120)
+        assert build.returncode == 0 and '📦 Built' in build.stdout, build.stderr
+        project = Path(tmp) / 'project'
+        project.mkdir()
+        result = subprocess.run([sys.executable, str(Path(tmp) / 'dist' / 'mvp.pyz'), '--architecture', 'fastapi',
+                                 '--name', 'Zip App', '--skip-taskmaster'], cwd=project, capture_output=True,
+                                text=True, timeout=120)
+        assert result.returncode == 0, result.stderr
+        assert '🎉 Zip App is ready' in result.stdout
+        config = json.loads((project / '.mvp-config.json').read_text(encoding='utf-8'))
+        assert config['primary_architecture'] == 'fastapi' and config['active_rules']
+        assert (project / '.cursorrules').stat().st_size > 0 and (project / 'main.py').is_file()
+        assert not (project / 'architectures.json').exists() and not (project / 'mvp_quickstart').exists()
+
+
+if __name__ == '__main__':
+    test_archive_contents()
+    test_bundled_scaffold_matches_checkout()
+    test_cli_runs_from_archive_alone()
+    print('✅ Zipapp bundle tests passed')
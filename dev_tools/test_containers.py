@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the generated Dockerfiles and .dockerignore files: layer order that
+keeps dependency installs cached, cache mounts, slim non-root runtime stages
+and start commands, across every catalog architecture.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart.containers import dockerfile, dockerignore
+from quick_start import MVPQuickStart, scaffold
+
+MANIFESTS = ('COPY package.json', 'COPY requirements.txt', 'COPY go.mod', 'COPY mvnw pom.xml')
+
+
+def stages(text: str) -> list:
+    return [block for block in text.split('\nFROM ')[1:]]
+
+
+def test_dockerfiles_for_catalog():
+    catalog = MVPQuickStart(source_root=TEMPLATE_ROOT, quiet=True).architectures
+    generated = {}
+    for key, config in catalog.items():
+        text = dockerfile(key, config, 'Container Test')
+        if text is None:
+            continue
+        generated[key] = text
+        assert text.startswith('# syntax=docker/dockerfile:1\n'), key
+        assert len(stages(text)) >= 2, key
+        assert '--mount=type=cache' in text, key
+
+        # Dependency manifests are copied and installed before the sources
+        if 'COPY . .' in text and any(manifest in text for manifest in MANIFESTS):
+            first_manifest = min(text.index(m) for m in MANIFESTS if m in text)
+            assert first_manifest < text.index('COPY . .'), key
+
+        runtime = stages(text)[-1]
+        assert 'AS runtime' in runtime.splitlines()[0], key
+        assert ('USER ' in runtime or 'nonroot' in runtime or 'unprivileged' in runtime), key
+        command = [line for line in runtime.splitlines() if line.startswith(('CMD ', 'ENTRYPOINT '))]
+        if command:
+            assert isinstance(json.loads(command[0].split(' ', 1)[1]), list), key
+
+    assert {'fastapi', 'django', 'flask', 'mern', 'nextjs', 'react', 'go', 'django-react'} <= set(generated)
+    assert 'react-native' not in generated and 'aws-lambda' not in generated
+    assert 'CMD ["node", "server.js"]' in generated['mern']  # nodemon is a dev tool
+    assert 'nginx' in stages(generated['react'])[-1] and 'node_modules' not in stages(generated['react'])[-1]
+    assert 'pip install -r requirements.txt gunicorn' in generated['django']
+    assert 'COPY --from=frontend' in generated['django-react']
+
+    performance = dockerfile('fastapi', catalog['fastapi'], 'Container Test', profile='performance')
+    assert 'CMD ["gunicorn", "-c", "gunicorn.conf.py", "main:app"]' in performance
+
+
+def test_python_start_commands_have_their_module():
+    """The default CMD's module:app target is a file the scaffold wrote"""
+    with tempfile.TemporaryDirectory(prefix='mvp-containers-') as tmp:
+        for key in ('fastapi', 'flask'):
+            project = Path(tmp) / key
+            assert scaffold(TEMPLATE_ROOT, project, key, 'Container Test').success, key
+            runtime = stages((project / 'Dockerfile').read_text(encoding='utf-8'))[-1]
+            command = json.loads(next(line for line in runtime.splitlines() if line.startswith('CMD '))[4:])
+            module, attribute = next(arg for arg in command if arg.endswith(':app')).split(':')
+            assert f'\n{attribute} = ' in (project / f'{module}.py').read_text(encoding='utf-8'), key
+
+
+def test_dockerignore():
+    catalog = MVPQuickStart(source_root=TEMPLATE_ROOT, quiet=True).architectures
+    ignored = dockerignore('django-react', catalog['django-react']).splitlines()
+    assert {'.git', '.env', '!.env.example', 'archive', 'node_modules', '__pycache__'} <= set(ignored)
+    assert 'node_modules' not in dockerignore('fastapi', catalog['fastapi']).splitlines()
+
+
+if __name__ == '__main__':
+    test_dockerfiles_for_catalog()
+    test_python_start_commands_have_their_module()
+    test_dockerignore()
+    print('✅ Container build tests passed')
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the frontend build configuration: which architectures get Vite or
+Next.js configs, the package.json wiring, and the bundle budget check (run
+with Node against a fake build output when Node is installed).
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart.frontend import BUDGET_PATH, BUDGET_SCRIPT_PATH, JS_CHUNK_KB, build_files, build_tool
+from quick_start import MVPQuickStart, scaffold
+
+
+def test_build_configs_for_catalog():
+    catalog = MVPQuickStart(source_root=TEMPLATE_ROOT, quiet=True).architectures
+    tools = {key: build_tool(config) for key, config in catalog.items()}
+    assert {tools[key] for key in ('react', 'vue', 'mern', 'django-react')} == {'vite'}
+    assert {tools[key] for key in ('nextjs', 'jamstack', 't3-stack')} == {'next'}
+    assert tools['svelte'] == 'sveltekit'
+    assert tools['angular'] is None and tools['expressjs'] is None and tools['fastapi'] is None
+
+    react = build_files('react', catalog['react'], 'Web App')
+    assert "output: { manualChunks }" in react['vite.config.ts']
+    assert "compression({ algorithm: 'brotliCompress' })" in react['vite.config.ts']
+    assert "lazy(() => import('./pages/Home'))" in react['src/routes.tsx']
+    assert '<h1>Web App</h1>' in react['src/pages/Home.tsx']
+    assert "import('./pages/Home.vue')" in build_files('vue', catalog['vue'], 'Web App')['src/routes.ts']
+    assert 'manualChunks' not in build_files('svelte', catalog['svelte'], 'Web App')['vite.config.ts']
+    assert 'src/routes.jsx' in build_files('mern', catalog['mern'], 'Web App')
+
+    assert "formats: ['image/avif', 'image/webp']" in build_files('nextjs', catalog['nextjs'], 'X')['next.config.mjs']
+    assert "output: 'export'" in build_files('jamstack', catalog['jamstack'], 'X')['next.config.mjs']
+
+
+def test_scaffold_wires_budget_into_build():
+    with tempfile.TemporaryDirectory(prefix='mvp-frontend-') as tmp:
+        project = Path(tmp) / 'react'
+        assert scaffold(TEMPLATE_ROOT, project, 'react', 'Web App').success
+        package = json.loads((project / 'package.json').read_text(encoding='utf-8'))
+        assert package['scripts']['postbuild'] == 'npm run size'
+        assert package['scripts']['build'] == 'tsc && vite build'
+        assert {'vite', '@vitejs/plugin-react', 'vite-plugin-compression2'} <= set(package['devDependencies'])
+        budget = json.loads((project / BUDGET_PATH).read_text(encoding='utf-8'))
+        assert budget['directory'] == 'dist/assets'
+
+        project = Path(tmp) / 'jamstack'
+        assert scaffold(TEMPLATE_ROOT, project, 'jamstack', 'Static').success
+        package = json.loads((project / 'package.json').read_text(encoding='utf-8'))
+        assert package['scripts']['build'] == 'next build' and package['devDependencies'] == {}
+
+
+def run_budget(project: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(['node', BUDGET_SCRIPT_PATH], cwd=project, capture_output=True, text=True, timeout=60)
+
+
+def test_budget_script_fails_oversized_chunks():
+    if shutil.which('node') is None:
+        print('⚠️  node not installed - skipping the bundle budget run')
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-frontend-') as tmp:
+        project = Path(tmp) / 'vue'
+        assert scaffold(TEMPLATE_ROOT, project, 'vue', 'Budget').success
+        assert run_budget(project).returncode == 1
+
+        assets = project / 'dist' / 'assets'
+        assets.mkdir(parents=True)
+        (assets / 'index-abc123.js').write_text('export const app = 1;\n' * 2000, encoding='utf-8')
+        (assets / 'index-abc123.js.br').write_bytes(os.urandom(400 * 1024))
+        result = run_budget(project)
+        assert result.returncode == 0, result.stderr
+        assert '📦 JavaScript: 1 files' in result.stdout
+
+        # Random bytes do not compress: gzip size stays above the chunk limit
+        (assets / 'vendor-vue-def456.js').write_bytes(os.urandom((JS_CHUNK_KB + 10) * 1024))
+        result = run_budget(project)
+        assert result.returncode == 1 and 'vendor-vue-def456.js' in result.stderr
+
+
+if __name__ == '__main__':
+    test_build_configs_for_catalog()
+    test_scaffold_wires_budget_into_build()
+    test_budget_script_fails_oversized_chunks()
+    print('✅ Frontend build config tests passed')
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the architecture generator plugins: importing the scaffolder loads
+none of them, scaffolding loads only the selected one, and plugins outside the
+package can be registered.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from types import MappingProxyType
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart import generators
+from quick_start import MVPQuickStart, scaffold
+
+LOADED_PLUGINS = '''
+import sys
+sys.path.insert(0, {root!r})
+import quick_start
+{action}
+print(sorted(name for name in sys.modules if name.startswith('mvp_quickstart.generators.')))
+'''
+
+
+def loaded_plugins(action: str = '') -> list:
+    code = LOADED_PLUGINS.format(root=str(TEMPLATE_ROOT), action=action)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return eval(output.strip().splitlines()[-1])
+
+
+def test_plugins_load_lazily():
+    assert loaded_plugins() == []
+    with tempfile.TemporaryDirectory(prefix='mvp-generators-') as tmp:
+        action = f"quick_start.scaffold({str(TEMPLATE_ROOT)!r}, {tmp + '/react'!r}, 'react', 'Lazy')"
+        assert loaded_plugins(action) == ['mvp_quickstart.generators.react']
+
+
+def test_builtin_plugins():
+    for key in generators.GENERATORS:
+        plugin = generators.load(key)
+        for name, value in getattr(plugin, 'ENV_VARS', {}).items():
+            assert isinstance(value, str) and (value == '') == name.startswith('#'), (key, name)
+        assert isinstance(getattr(plugin, 'CATEGORY', {}), dict), key
+    assert generators.load('custom') is None
+
+    with tempfile.TemporaryDirectory(prefix='mvp-generators-') as tmp:
+        project = Path(tmp) / 'nestjs'
+        assert scaffold(TEMPLATE_ROOT, project, 'nestjs', 'Plugin Test').success
+        assert 'JWT_SECRET=your-jwt-secret-here' in (project / '.env.example').read_text(encoding='utf-8')
+        config = json.loads((project / '.mvp-config.json').read_text(encoding='utf-8'))
+        assert config['category']['framework'] == 'NestJS'
+
+
+def test_legacy_starter_keys():
+    with tempfile.TemporaryDirectory(prefix='mvp-generators-') as tmp:
+        quick_start = MVPQuickStart(project_root=Path(tmp) / 'flask-api', source_root=TEMPLATE_ROOT, quiet=True)
+        flask = quick_start.architectures['flask']
+        quick_start.architectures = MappingProxyType(dict(quick_start.architectures, **{'flask-api': flask}))
+        assert quick_start.scaffold('flask-api', 'Legacy').success
+        app = (Path(tmp) / 'flask-api' / 'app.py').read_text(encoding='utf-8')
+        assert app == MVPQuickStart.default_starter('flask', 'Legacy')[1]
+
+
+def test_registered_plugin():
+    with tempfile.TemporaryDirectory(prefix='mvp-generators-') as tmp:
+        (Path(tmp) / 'internal_stack.py').write_text('''
+CATEGORY = {'type': 'backend', 'framework': 'Internal'}
+ENV_VARS = {'# Internal': '', 'INTERNAL_TOKEN': 'your-token-here'}
+
+def create_structure(scaffolder, project_name):
+    scaffolder.write_file(scaffolder.project_root / 'service.toml', f'name = "{project_name}"\\n')
+''', encoding='utf-8')
+        sys.path.insert(0, tmp)
+        generators.register('custom', 'internal_stack')
+        try:
+            project = Path(tmp) / 'custom'
+            assert scaffold(TEMPLATE_ROOT, project, 'custom', 'Internal').success
+        finally:
+            del generators.GENERATORS['custom']
+            sys.path.remove(tmp)
+        assert (project / 'service.toml').read_text(encoding='utf-8') == 'name = "Internal"\n'
+        assert 'INTERNAL_TOKEN=your-token-here' in (project / '.env.example').read_text(encoding='utf-8')
+        config = json.loads((project / '.mvp-config.json').read_text(encoding='utf-8'))
+        assert config['category'] == {'type': 'backend', 'framework': 'Internal'}
+
+
+if __name__ == '__main__':
+    test_plugins_load_lazily()
+    test_builtin_plugins()
+    test_legacy_starter_keys()
+    test_registered_plugin()
+    print('✅ Generator plugin tests passed')
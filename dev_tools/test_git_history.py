@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for the initial git commit: the repository written in-process matches
+what git add and git commit would record, passes fsck, and starts with a clean
+working tree.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+sys.path.insert(0, str(TEMPLATE_ROOT / 'dev_tools'))
+
+from mvp_quickstart.git_history import commit_with_git, initial_commit, plain_format
+from quick_start import scaffold
+from test_matrix import copy_template
+
+IDENT = {'GIT_AUTHOR_NAME': 'Test', 'GIT_AUTHOR_EMAIL': 'test@example.com',
+         'GIT_COMMITTER_NAME': 'Test', 'GIT_COMMITTER_EMAIL': 'test@example.com'}
+
+
+def git(project: Path, *args: str) -> str:
+    return subprocess.run(['git', *args], cwd=project, capture_output=True, text=True, check=True,
+                          env=dict(os.environ, **IDENT)).stdout.strip()
+
+
+def git_tree_of(project: Path, scratch: Path) -> str:
+    """Tree id git itself records for the project's files"""
+    copy = scratch / project.name
+    shutil.copytree(project, copy, ignore=shutil.ignore_patterns('.git'))
+    git(copy, 'init', '--quiet')
+    git(copy, 'add', '-A')
+    return git(copy, 'write-tree')
+
+
+def test_initial_commit_matches_git():
+    if shutil.which('git') is None:
+        print('⚠️  git not installed - skipping the initial commit tests')
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-git-') as tmp:
+        for key in ('nextjs', 'django'):
+            result = scaffold(TEMPLATE_ROOT, Path(tmp) / key, key, 'Git Test', rule_output='sharded', git_init=True)
+            project = result.project_root
+            assert result.success and result.steps[-1] == 'Git repository initialized', key
+            assert git(project, 'status', '--porcelain') == ''
+            git(project, 'fsck', '--strict', '--full')
+            assert git(project, 'rev-parse', 'HEAD^{tree}') == git_tree_of(project, Path(tmp) / 'scratch')
+            assert git(project, 'log', '--format=%s') == 'Initial commit: Git Test from MVP Quick-Start'
+            assert git(project, 'ls-files', '-s', 'add_architecture.py').startswith('100755')
+            assert '.mvp-manifest' in git(project, 'ls-files').splitlines()
+
+
+def test_identity_and_reflog():
+    if shutil.which('git') is None:
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-git-') as tmp:
+        project = Path(tmp) / 'plain'
+        (project / 'src').mkdir(parents=True)
+        (project / 'src' / 'same-a.txt').write_text('shared\n', encoding='utf-8')
+        (project / 'src' / 'same-b.txt').write_text('shared\n', encoding='utf-8')
+        (project / 'untracked.txt').write_text('not listed\n', encoding='utf-8')
+        commit = initial_commit(project, [project / 'src' / 'same-a.txt', project / 'src' / 'same-b.txt'],
+                                'First\n\nBody\n', ident='Jo Dev <jo@example.com>')
+        assert git(project, 'rev-parse', 'HEAD') == commit
+        ident = 'Jo Dev <jo@example.com>'
+        assert git(project, 'log', '--format=%an <%ae>|%cn <%ce>|%B') == f'{ident}|{ident}|First\n\nBody'
+        assert git(project, 'reflog', '--format=%gs') == 'commit (initial): First'
+        assert git(project, 'status', '--porcelain') == '?? untracked.txt'
+
+
+def test_only_git_processes_are_timed():
+    if shutil.which('git') is None:
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-git-') as tmp:
+        project = Path(tmp) / 'timed'
+        project.mkdir()
+        (project / 'README.md').write_text('# Timed\n', encoding='utf-8')
+        started = []
+
+        def run(args, **kwargs):
+            started.append(args[1:])
+            return subprocess.run(args, **kwargs)
+
+        initial_commit(project, [project / 'README.md'], 'First\n', ident='Jo Dev <jo@example.com>', run=run)
+        assert [args[-3] for args in started] == ['init']
+
+        # The step's subprocess time is what run_subprocess measured around git init, not the whole commit
+        result = scaffold(TEMPLATE_ROOT, Path(tmp) / 'project', 'fastapi', 'Timed', git_init=True)
+        step = next(step for step in result.metrics['steps'] if step['step'] == 'create_git_history')
+        assert 0 < step['subprocess_seconds'] < step['duration_seconds']
+
+
+def test_default_hash_override():
+    if shutil.which('git') is None:
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-git-') as tmp:
+        project = Path(tmp) / 'sha256-default'
+        project.mkdir()
+        (project / 'README.md').write_text('# Hash\n', encoding='utf-8')
+        previous = os.environ.get('GIT_DEFAULT_HASH')
+        os.environ['GIT_DEFAULT_HASH'] = 'sha256'
+        try:
+            commit = initial_commit(project, [project / 'README.md'], 'First\n', ident='Jo Dev <jo@example.com>')
+        finally:
+            if previous is None:
+                del os.environ['GIT_DEFAULT_HASH']
+            else:
+                os.environ['GIT_DEFAULT_HASH'] = previous
+        assert git(project, 'rev-parse', '--show-object-format') == 'sha1' and len(commit) == 40
+        git(project, 'fsck', '--strict', '--full')
+        assert git(project, 'status', '--porcelain') == ''
+
+        # A repository in a format this module does not write is committed by git itself
+        project = Path(tmp) / 'sha256'
+        project.mkdir()
+        (project / 'README.md').write_text('# Hash\n', encoding='utf-8')
+        git(project, 'init', '--quiet', '--object-format=sha256')
+        assert not plain_format(project / '.git')
+        commit = commit_with_git(project, [project / 'README.md'], 'First\n', 'Jo Dev <jo@example.com>')
+        assert len(commit) == 64 and git(project, 'log', '--format=%an <%ae>|%s') == 'Jo Dev <jo@example.com>|First'
+        assert git(project, 'status', '--porcelain') == ''
+
+
+def test_existing_repository_is_left_alone():
+    if shutil.which('git') is None:
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-git-') as tmp:
+        result = scaffold(TEMPLATE_ROOT, Path(tmp) / 'first', 'vue', 'First', git_init=True)
+        try:
+            initial_commit(result.project_root, [result.project_root / 'README.md'], 'Again\n')
+        except RuntimeError as e:
+            assert 'already a git repository' in str(e)
+        else:
+            raise AssertionError('a second initial commit was written')
+        assert git(result.project_root, 'rev-list', '--count', 'HEAD') == '1'
+
+
+def test_command_line_refuses_existing_repository():
+    if shutil.which('git') is None:
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-git-') as tmp:
+        # A cloned template checkout: running in place, with the template's .git
+        checkout = Path(tmp) / 'checkout'
+        checkout.mkdir()
+        copy_template(checkout)
+        shutil.copy2(TEMPLATE_ROOT / 'quick_start.py', checkout)
+        shutil.copytree(TEMPLATE_ROOT / 'mvp_quickstart', checkout / 'mvp_quickstart',
+                        ignore=shutil.ignore_patterns('__pycache__'))
+        git(checkout, 'init', '--quiet')
+        result = subprocess.run([sys.executable, 'quick_start.py', '--architecture', 'fastapi', '--name', 'Api',
+                                 '--skip-taskmaster', '--git-init'],
+                                cwd=checkout, capture_output=True, text=True, timeout=300)
+        assert result.returncode == 2 and 'already is one' in result.stderr, result.stdout + result.stderr
+        # Refused before anything was generated or archived
+        assert not (checkout / '.mvp-config.json').exists() and (checkout / 'mvp_quickstart').is_dir()
+
+
+def test_render_cache_hits_commit_too():
+    if shutil.which('git') is None:
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-git-') as tmp:
+        cache = Path(tmp) / 'cache'
+        scaffold(TEMPLATE_ROOT, Path(tmp) / 'golden', 'fastapi', 'Warm', cache_dir=cache)
+        result = scaffold(TEMPLATE_ROOT, Path(tmp) / 'hit', 'fastapi', 'Cached', cache_dir=cache, git_init=True)
+        assert result.metrics['render_cache'] == 'hit'
+        assert [step['step'] for step in result.metrics['steps']] == ['instantiate_snapshot', 'create_git_history']
+        assert git(result.project_root, 'status', '--porcelain') == ''
+        assert result.messages[-1].startswith('✅ Initial git commit ')
+
+
+if __name__ == '__main__':
+    test_initial_commit_matches_git()
+    test_identity_and_reflog()
+    test_only_git_processes_are_timed()
+    test_default_hash_override()
+    test_existing_repository_is_left_alone()
+    test_command_line_refuses_existing_repository()
+    test_render_cache_hits_commit_too()
+    print('✅ Git history tests passed')
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the generated lint setup: cached lint scripts, ruff in place of
+flake8, the pre-commit hooks, and (when ruff is installed) that freshly
+generated Python projects pass their own lint.
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import tomllib
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart.linting import (ESLINT_CACHE, PRE_COMMIT_CONFIG_PATH, RUFF_CONFIG_PATH, lint_files,
+                                    lint_scripts, linters)
+from quick_start import ARCHITECTURES, MVPQuickStart, scaffold
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+def test_lint_scripts():
+    catalog = MVPQuickStart(source_root=TEMPLATE_ROOT, quiet=True).architectures
+    assert lint_scripts('fastapi', catalog['fastapi']) == {'lint': 'ruff check .'}
+    assert lint_scripts('vercel-api', ARCHITECTURES['vercel-api']) == {'lint': 'ruff check api/'}
+    assert lint_scripts('react-native', ARCHITECTURES['react-native'])['lint'] == \
+        f'eslint . --ext .js,.jsx,.ts,.tsx {ESLINT_CACHE}'
+    # next lint caches on its own; projects without a lint script do not get one
+    assert 'lint' not in lint_scripts('nextjs', catalog['nextjs'])
+    assert lint_scripts('react', catalog['react']) == {'format': 'prettier --write --cache .',
+                                                       'format:check': 'prettier --check --cache .'}
+    assert linters('django-react', catalog['django-react']) == ['ruff']
+    assert linters('go', catalog['go']) == [] and lint_files('go', catalog['go']) == {}
+
+
+def test_pre_commit_hooks():
+    catalog = MVPQuickStart(source_root=TEMPLATE_ROOT, quiet=True).architectures
+    config = dict(catalog['react'], scripts=dict(catalog['react']['scripts'], lint='eslint .'),
+                  requirements=['fastapi'])
+    files = lint_files('fullstack', config)
+    ruff = tomllib.loads(files[RUFF_CONFIG_PATH])
+    assert ruff['lint']['select'] == ['E', 'F', 'W'] and 'archive' in ruff['extend-exclude']
+
+    text = files[PRE_COMMIT_CONFIG_PATH]
+    # Parallel hook processes would race on one cache file
+    assert 'npx eslint --fix\n' in text and 'npx prettier --write --ignore-unknown\n' in text
+    if yaml is not None:
+        pre_commit = yaml.safe_load(text)
+        assert pre_commit['exclude'] == '^(archive|node_modules|dist|build)/'
+        hooks = [hook['id'] for repo in pre_commit['repos'] for hook in repo['hooks']]
+        assert hooks == ['ruff', 'ruff-format', 'eslint', 'prettier']
+        assert not any(hook.get('require_serial') for repo in pre_commit['repos'] for hook in repo['hooks'])
+
+
+def test_scaffold_writes_lint_config():
+    with tempfile.TemporaryDirectory(prefix='mvp-linting-') as tmp:
+        project = Path(tmp) / 'flask'
+        assert scaffold(TEMPLATE_ROOT, project, 'flask', 'Api').success
+        assert (project / RUFF_CONFIG_PATH).is_file() and (project / PRE_COMMIT_CONFIG_PATH).is_file()
+
+        project = Path(tmp) / 'react'
+        assert scaffold(TEMPLATE_ROOT, project, 'react', 'Web App').success
+        package = json.loads((project / 'package.json').read_text(encoding='utf-8'))
+        assert package['scripts']['format'] == 'prettier --write --cache .'
+        assert not (project / RUFF_CONFIG_PATH).exists()
+
+
+def test_generated_python_passes_ruff():
+    ruff = shutil.which('ruff')
+    if ruff is None:
+        print('⚠️  ruff not installed - skipping the lint run on generated projects')
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-linting-') as tmp:
+        for key in ('fastapi', 'flask', 'django'):
+            project = Path(tmp) / key
+            assert scaffold(TEMPLATE_ROOT, project, key, 'Lint App', profile='performance').success
+            result = subprocess.run([ruff, 'check', '.', '--no-cache'], cwd=project, capture_output=True, text=True,
+                                    timeout=60)
+            assert result.returncode == 0, f'{key}: {result.stdout}'
+
+
+if __name__ == '__main__':
+    test_lint_scripts()
+    test_pre_commit_hooks()
+    test_scaffold_writes_lint_config()
+    test_generated_python_passes_ruff()
+    print('✅ Lint config tests passed')
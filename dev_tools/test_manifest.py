@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the generated-file manifest: every generated file is listed with
+its hash, verify re-hashes only files whose stat data changed, and upgrades
+keep the manifest current.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+sys.path.insert(0, str(TEMPLATE_ROOT / 'dev_tools'))
+
+from mvp_quickstart.manifest import MANIFEST_NAME, file_hash, verify
+from quick_start import scaffold, upgrade
+from test_matrix import copy_template
+
+CLEAN = {'modified': [], 'missing': [], 'rehashed': []}
+
+
+def test_manifest_lists_generated_files():
+    with tempfile.TemporaryDirectory(prefix='mvp-manifest-') as tmp:
+        result = scaffold(TEMPLATE_ROOT, Path(tmp) / 'react', 'react', 'Manifest Test')
+        assert result.success and 'write_manifest' in [step['step'] for step in result.metrics['steps']]
+        manifest = json.loads((result.project_root / MANIFEST_NAME).read_text(encoding='utf-8'))
+        on_disk = {path.relative_to(result.project_root).as_posix()
+                   for path in result.project_root.rglob('*') if path.is_file()}
+        assert set(manifest['files']) == on_disk - {MANIFEST_NAME}
+        for rel_path, entry in manifest['files'].items():
+            path = result.project_root / rel_path
+            assert entry['size'] == path.stat().st_size and entry['sha256'] == file_hash(path), rel_path
+
+
+def test_verify_rehashes_only_changed_stat():
+    with tempfile.TemporaryDirectory(prefix='mvp-manifest-') as tmp:
+        project = scaffold(TEMPLATE_ROOT, Path(tmp) / 'fastapi', 'fastapi', 'Drift').project_root
+        # Files written in the manifest's own timestamp tick are racily clean and always re-hashed;
+        # age the manifest as if that tick had passed
+        manifest = project / MANIFEST_NAME
+        os.utime(manifest, ns=(manifest.stat().st_atime_ns, manifest.stat().st_mtime_ns + 10 ** 9))
+        assert verify(project) == CLEAN
+
+        # Touched but unchanged: re-hashed once, then back on the stat-only path
+        readme = project / 'README.md'
+        os.utime(readme, ns=(readme.stat().st_atime_ns, readme.stat().st_mtime_ns - 10 ** 9))
+        assert verify(project) == dict(CLEAN, rehashed=['README.md'])
+        assert verify(project) == CLEAN
+
+        # Same size, different content: caught by the hash
+        main = project / 'main.py'
+        content = main.read_text(encoding='utf-8')
+        main.write_text(content.replace('Hello', 'Howdy'), encoding='utf-8')
+        (project / 'requirements.txt').write_text('fastapi\n', encoding='utf-8')
+        (project / 'Dockerfile').unlink()
+        report = verify(project)
+        assert sorted(report['modified']) == ['main.py', 'requirements.txt']
+        assert report['missing'] == ['Dockerfile'] and report['rehashed'] == ['main.py']
+
+        # Drift is never refreshed away
+        assert verify(project)['modified'] == report['modified']
+
+
+def test_verify_command():
+    with tempfile.TemporaryDirectory(prefix='mvp-manifest-') as tmp:
+        clean = scaffold(TEMPLATE_ROOT, Path(tmp) / 'clean', 'vue', 'Clean').project_root
+        edited = scaffold(TEMPLATE_ROOT, Path(tmp) / 'edited', 'vue', 'Edited').project_root
+        (edited / 'README.md').write_text('# Edited\n', encoding='utf-8')
+
+        def run(*roots):
+            return subprocess.run([sys.executable, str(TEMPLATE_ROOT / 'quick_start.py'), '--verify', *map(str, roots)],
+                                  cwd=tmp, capture_output=True, text=True, timeout=60)
+
+        result = run(clean)
+        assert result.returncode == 0 and '1 projects: 0 drifted' in result.stdout
+        result = run(clean, edited, Path(tmp) / 'missing')
+        assert result.returncode == 1 and '3 projects: 2 drifted' in result.stdout
+        assert 'modified  README.md' in result.stdout and 'no readable .mvp-manifest' in result.stdout
+
+
+def test_upgrade_updates_manifest():
+    with tempfile.TemporaryDirectory(prefix='mvp-manifest-') as tmp:
+        source, project = Path(tmp) / 'source', Path(tmp) / 'project'
+        source.mkdir()
+        copy_template(source)
+        result = scaffold(source, project, 'fastapi', 'Upgrade Test', rule_output='sharded')
+        rule = source / '.cursor' / 'rules' / result.rules[0]
+        rule.write_text(rule.read_text(encoding='utf-8') + '\nUpgraded guidance.\n', encoding='utf-8')
+
+        changes = {c['path']: c['status'] for c in upgrade(source, project)}
+        assert set(changes.values()) == {'updated'}
+        assert verify(project)['modified'] == []
+
+
+if __name__ == '__main__':
+    test_manifest_lists_generated_files()
+    test_verify_rehashes_only_changed_stat()
+    test_verify_command()
+    test_upgrade_updates_manifest()
+    print('✅ Manifest tests passed')
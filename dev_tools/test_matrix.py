@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+End-to-end test matrix for MVP Quick-Start setup
+Scaffolds every architecture key into its own temporary directory, concurrently
+from one shared template source, and checks the generated file set and file
+contents against architectures.json.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart.ci import ci_workflow
+from mvp_quickstart.containers import dockerfile
+from mvp_quickstart.database import database_files, database_requirements, database_scripts
+from mvp_quickstart.frontend import build_files, build_scripts
+from mvp_quickstart.linting import lint_files, lint_scripts
+from mvp_quickstart.rules import rule_graph
+from mvp_quickstart.testing import runner_files, runner_requirements, runner_scripts
+from quick_start import AWESOME_RULE_MAPPINGS, MVPQuickStart, scaffold
+
+PROJECT_NAME = 'Matrix Test'
+
+# Every finished setup leaves these
+BASE_TOP_LEVEL = {'.cursor', '.cursorrules', '.env.example', '.mvp-base.json', '.mvp-config.json', '.mvp-manifest',
+                  'README.md', 'add_architecture.py', 'archive', 'src'}
+
+# Written out by hand for representative architectures, so the generators under
+# test are checked against something they didn't compute themselves
+PINNED_TOP_LEVEL = {
+    'fastapi': BASE_TOP_LEVEL | {'.dockerignore', '.github', '.pre-commit-config.yaml', 'Dockerfile', 'main.py',
+                                 'pytest.ini', 'requirements.txt', 'ruff.toml'},
+    'react': BASE_TOP_LEVEL | {'.dockerignore', '.github', '.pre-commit-config.yaml', 'Dockerfile',
+                               'bundle-budget.json', 'jest.config.cjs', 'package.json', 'scripts', 'vite.config.ts'},
+    'django-react': BASE_TOP_LEVEL | {'.dockerignore', '.github', '.pre-commit-config.yaml', 'Dockerfile', 'bench',
+                                      'bundle-budget.json', 'compose.db.yaml', 'database.py', 'jest.config.cjs',
+                                      'package.json', 'requirements.txt', 'ruff.toml', 'scripts', 'vite.config.js'},
+    'go': BASE_TOP_LEVEL | {'.dockerignore', '.github', 'Dockerfile'},
+    'custom': BASE_TOP_LEVEL,
+}
+
+# Always-apply rules and their dependencies, activated for every architecture.
+# index.mdc only lists the other rules, so it pulls none of them in
+ALWAYS_RULES = ['ci-monitor.mdc', 'dev_workflow.mdc', 'taskmaster.mdc', 'context-first-workflow.mdc',
+                'cursor_rules.mdc', 'debug-first-implement-later.mdc', 'feature-scoping.mdc', 'index.mdc',
+                'mdc-format.mdc', 'rules-location.mdc', 'scoped-conversations.mdc', 'self_improve.mdc',
+                'taskmaster-tag-usage.mdc']
+
+PINNED_LOCAL_RULES = {
+    'fastapi': ['environment-variables.mdc', 'security.mdc', 'testing.mdc', 'code-writing-standards.mdc']
+               + ALWAYS_RULES,
+    'react': ['ui-components.mdc', 'data-fetching.mdc', 'hooks.mdc', 'testing.mdc', 'code-writing-standards.mdc']
+             + ALWAYS_RULES,
+    'go': ['code-writing-standards.mdc', 'testing.mdc'] + ALWAYS_RULES,
+    'custom': ALWAYS_RULES,
+}
+
+PINNED_SCRIPTS = {
+    'react': {'dev': 'vite', 'build': 'tsc && vite build', 'preview': 'vite preview', 'test': 'jest',
+              'size': 'node scripts/check-bundle-size.mjs', 'postbuild': 'npm run size',
+              'test:changed': 'jest --onlyChanged', 'format': 'prettier --write --cache .',
+              'format:check': 'prettier --check --cache .'},
+    'django-react': {'dev': 'concurrently "python manage.py runserver" "vite"', 'build': 'vite build',
+                     'test': 'jest && python manage.py test', 'size': 'node scripts/check-bundle-size.mjs',
+                     'postbuild': 'npm run size', 'test:changed': 'jest --onlyChanged'},
+}
+
+PINNED_REQUIREMENTS = {
+    'fastapi': ['fastapi', 'uvicorn', 'python-multipart', 'python-dotenv', 'pytest', 'httpx', 'pytest-xdist'],
+    'django-react': ['django', 'djangorestframework', 'django-cors-headers', 'python-dotenv', 'psycopg[binary,pool]'],
+}
+
+
+def copy_template(target: Path):
+    """Copy the template inputs quick_start.py reads into target"""
+    ignore = shutil.ignore_patterns('__pycache__', '.validate-cache.json')
+    shutil.copy2(TEMPLATE_ROOT / 'architectures.json', target)
+    shutil.copytree(TEMPLATE_ROOT / '.cursor' / 'rules', target / '.cursor' / 'rules', ignore=ignore)
+    shutil.copytree(TEMPLATE_ROOT / 'dev_tools' / 'prompts', target / 'dev_tools' / 'prompts', ignore=ignore)
+
+    # Stub awesome-rules so setup never clones from GitHub
+    awesome_dir = target / '.cursor' / 'awesome-rules'
+    for rule_key, rule_path in AWESOME_RULE_MAPPINGS.items():
+        stub = awesome_dir / rule_path
+        stub.parent.mkdir(parents=True, exist_ok=True)
+        stub.write_text(f'# stub awesome rule: {rule_key}\n', encoding='utf-8')
+
+
+def expected_top_level(arch_key: str, config: Dict, prompts: List[str]) -> set:
+    """Top-level entries a finished setup should leave in the project"""
+    if arch_key in PINNED_TOP_LEVEL:
+        return PINNED_TOP_LEVEL[arch_key]
+    expected = set(BASE_TOP_LEVEL)
+    if prompts:
+        expected.add('active_prompts')
+    if config.get('packages') or config.get('dev_dependencies'):
+        expected.add('package.json')
+    if config.get('requirements'):
+        expected.add('requirements.txt')
+    if arch_key == 'fastapi':
+        expected.add('main.py')
+    elif arch_key in ('flask', 'flask-api'):
+        expected.add('app.py')
+    if dockerfile(arch_key, config, PROJECT_NAME) is not None:
+        expected |= {'Dockerfile', '.dockerignore'}
+    if ci_workflow(arch_key, config) is not None:
+        expected.add('.github')
+    expected |= {rel_path.split('/')[0] for rel_path in build_files(arch_key, config, PROJECT_NAME)}
+    expected |= {rel_path.split('/')[0] for rel_path in runner_files(arch_key, config, PROJECT_NAME)}
+    expected |= set(lint_files(arch_key, config))
+    expected |= {rel_path.split('/')[0] for rel_path in database_files(arch_key, config)}
+    return expected
+
+
+def check_project(project: Path, arch_key: str, config: Dict, result) -> List[str]:
+    """Return a list of failure messages for a scaffolded project"""
+    failures = []
+    template_rules = TEMPLATE_ROOT / '.cursor' / 'rules'
+    graph = rule_graph(template_rules)
+    always = sorted(rule for rule in graph.always_apply if '/' not in rule)
+    local_rules = PINNED_LOCAL_RULES.get(arch_key) or list(graph.closure(list(config.get('local_rules', [])) + always))
+    awesome_rules = [f"{rule.replace('-', '_')}.mdc" for rule in config.get('awesome_rules', [])
+                     if rule in AWESOME_RULE_MAPPINGS]
+    all_rules = local_rules + awesome_rules
+    prompts = [p for p in config.get('prompts', []) if (TEMPLATE_ROOT / 'dev_tools' / 'prompts' / p).exists()]
+    slug = PROJECT_NAME.lower().replace(' ', '-')
+
+    if not result.success:
+        failures.append(f'setup reported an error: {result.error}')
+    if result.rules != all_rules:
+        failures.append('result.rules do not match the activated rules')
+
+    # File set
+    actual = {p.name for p in project.iterdir()}
+    expected = expected_top_level(arch_key, config, prompts)
+    if actual != expected:
+        failures.append(f'file set: missing {sorted(expected - actual)}, unexpected {sorted(actual - expected)}')
+    if (project / '.cursor').exists() and [p.name for p in (project / '.cursor').iterdir()] != ['rules']:
+        failures.append('.cursor should only contain the recreated rules/ directory')
+
+    archived = [p.name.split('_', 2)[-1] for p in (project / 'archive').iterdir()] if (project / 'archive').exists() else []
+    if 'archive_info.json' not in archived:
+        failures.append('archive/ is missing archive_info.json')
+
+    # .cursorrules: every rule in order, with its content
+    cursorrules_path = project / '.cursorrules'
+    if cursorrules_path.exists():
+        cursorrules = cursorrules_path.read_text(encoding='utf-8')
+        positions = [cursorrules.find(f'\n# === {rule} ===\n') for rule in all_rules]
+        if -1 in positions or positions != sorted(positions):
+            failures.append('.cursorrules does not contain every rule header in order')
+        for rule in local_rules:
+            if (template_rules / rule).read_text(encoding='utf-8') not in cursorrules:
+                failures.append(f'.cursorrules is missing the content of {rule}')
+        for rule in config.get('awesome_rules', []):
+            if rule in AWESOME_RULE_MAPPINGS and f'# stub awesome rule: {rule}\n' not in cursorrules:
+                failures.append(f'.cursorrules is missing awesome rule {rule}')
+
+    if config.get('packages') and (project / 'package.json').exists():
+        package = json.loads((project / 'package.json').read_text(encoding='utf-8'))
+        if package.get('name') != slug:
+            failures.append(f'package.json name is {package.get("name")!r}, expected {slug!r}')
+        scripts = PINNED_SCRIPTS.get(arch_key) or {
+            **config.get('scripts', {}), **build_scripts(config), **runner_scripts(config),
+            **lint_scripts(arch_key, config), **database_scripts(arch_key, config)}
+        if package.get('scripts') != scripts:
+            failures.append('package.json scripts do not match architectures.json')
+
+    if config.get('requirements') and (project / 'requirements.txt').exists():
+        expected_requirements = PINNED_REQUIREMENTS.get(arch_key) or (
+            list(config['requirements']) + runner_requirements(config) + database_requirements(arch_key, config))
+        if (project / 'requirements.txt').read_text(encoding='utf-8') != '\n'.join(expected_requirements):
+            failures.append('requirements.txt does not match architectures.json')
+
+    if (project / '.env.example').exists():
+        env_lines = (project / '.env.example').read_text(encoding='utf-8').splitlines()
+        for line in ('NODE_ENV=development', 'OPENAI_API_KEY=your-openai-key-here'):
+            if line not in env_lines:
+                failures.append(f'.env.example is missing {line}')
+
+    if (project / 'README.md').exists():
+        readme = (project / 'README.md').read_text(encoding='utf-8')
+        if not readme.startswith(f'# {PROJECT_NAME}\n') or f"**{config['name']}**" not in readme:
+            failures.append('README.md does not name the project and architecture')
+        for rule in all_rules:
+            if f"- {rule.replace('.mdc', '').replace('-', ' ').title()}\n" not in readme:
+                failures.append(f'README.md does not list rule {rule}')
+
+    if (project / '.mvp-config.json').exists():
+        mvp_config = json.loads((project / '.mvp-config.json').read_text(encoding='utf-8'))
+        if (mvp_config.get('project_name'), mvp_config.get('primary_architecture')) != (PROJECT_NAME, arch_key):
+            failures.append('.mvp-config.json has the wrong project name or architecture')
+        if mvp_config.get('architecture_details') != config:
+            failures.append('.mvp-config.json architecture_details do not match architectures.json')
+        if mvp_config.get('active_rules') != all_rules:
+            failures.append('.mvp-config.json active_rules do not match the activated rules')
+
+    for prompt in prompts:
+        copied = project / 'active_prompts' / Path(prompt).name
+        source = TEMPLATE_ROOT / 'dev_tools' / 'prompts' / prompt
+        if not copied.exists() or copied.read_bytes() != source.read_bytes():
+            failures.append(f'active_prompts/ is missing or has a stale copy of {prompt}')
+
+    for script in ('add_architecture.py', 'main.py', 'app.py'):
+        if (project / script).exists():
+            try:
+                compile((project / script).read_text(encoding='utf-8'), script, 'exec')
+            except SyntaxError as e:
+                failures.append(f'{script} does not compile: {e}')
+
+    return failures
+
+
+def scaffold_architecture(source: Path, arch_key: str, config: Dict) -> Dict:
+    """Scaffold one architecture into a fresh temporary directory and check it"""
+    start_time = time.time()
+    with tempfile.TemporaryDirectory(prefix=f'mvp-{arch_key}-') as tmp:
+        project = Path(tmp)
+        result = scaffold(source, project, arch_key, PROJECT_NAME)
+        failures = check_project(project, arch_key, config, result)
+
+    return {
+        'architecture': arch_key,
+        'passed': not failures,
+        'failures': failures,
+        'duration': time.time() - start_time,
+    }
+
+
+def load_architectures() -> Dict:
+    """All architectures, flattened the same way quick_start.py reads them"""
+    with open(TEMPLATE_ROOT / 'architectures.json', 'r') as f:
+        return MVPQuickStart.flatten_architectures(json.load(f))
+
+
+def run_matrix(max_workers: int = None) -> List[Dict]:
+    """Scaffold every architecture concurrently from one shared template source"""
+    architectures = load_architectures()
+    with tempfile.TemporaryDirectory(prefix='mvp-template-') as source:
+        copy_template(Path(source))
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) * 4)) as pool:
+            futures = [pool.submit(scaffold_architecture, Path(source), key, config)
+                       for key, config in architectures.items()]
+            return [future.result() for future in futures]
+
+
+def test_architecture_matrix():
+    results = run_matrix()
+    assert set(PINNED_TOP_LEVEL) | set(PINNED_LOCAL_RULES) | set(PINNED_SCRIPTS) | set(PINNED_REQUIREMENTS) <= {
+        r['architecture'] for r in results}
+    failures = [f"{r['architecture']}: {failure}" for r in results for failure in r['failures']]
+    assert not failures, '\n'.join(failures)
+
+
+def test_store_shares_prompt_files():
+    """With a content store, two projects share prompt objects but match a plain scaffold"""
+    with tempfile.TemporaryDirectory(prefix='mvp-store-') as tmp:
+        tmp = Path(tmp)
+        (tmp / 'source').mkdir()
+        copy_template(tmp / 'source')
+        catalog_path = tmp / 'source' / 'architectures.json'
+        catalog = json.loads(catalog_path.read_text(encoding='utf-8'))
+        catalog['popular_stacks']['stacks']['mern']['prompts'] = ['workflow/execution_prompt.md', 'workflow/debugging.md']
+        catalog_path.write_text(json.dumps(catalog), encoding='utf-8')
+
+        results = {name: scaffold(tmp / 'source', tmp / name, 'mern', PROJECT_NAME,
+                                  store_dir=None if name == 'plain' else tmp / 'store')
+                   for name in ('plain', 'one', 'two')}
+        assert all(result.success for result in results.values())
+
+        def prompt_files(name):
+            return {p.name: p for p in (tmp / name / 'active_prompts').iterdir()}
+
+        plain, one, two = prompt_files('plain'), prompt_files('one'), prompt_files('two')
+        assert sorted(plain) == sorted(one) == sorted(two) == ['debugging.md', 'execution_prompt.md']
+        for name in plain:
+            assert plain[name].read_bytes() == one[name].read_bytes() == two[name].read_bytes()
+        assert (tmp / 'plain' / '.cursorrules').read_bytes() == (tmp / 'one' / '.cursorrules').read_bytes()
+
+        shared = [p for p in one.values() if p.stat().st_nlink > 1]
+        if shared:  # hardlinks: objects are read-only until detached
+            assert not os.access(shared[0], os.W_OK) or os.geteuid() == 0
+            from mvp_quickstart.store import detach
+            assert detach(shared[0]) and shared[0].stat().st_nlink == 1
+
+
+def test_store_repairs_objects_written_through_links():
+    """An in-place write through a hardlink is caught by the hash check and never linked again"""
+    from mvp_quickstart.store import ContentStore
+
+    with tempfile.TemporaryDirectory(prefix='mvp-store-') as tmp:
+        tmp = Path(tmp)
+        store = ContentStore(tmp / 'store')
+        store.reflinks = False
+        if store.materialize(b'original\n', tmp / 'one' / 'rule.mdc') != 'hardlink':
+            return
+        digest = store.put(b'original\n').name
+
+        # What root, or a tool that chmods before writing in place, does to a linked file
+        linked = tmp / 'one' / 'rule.mdc'
+        os.chmod(linked, 0o644)
+        linked.write_bytes(b'edited\n')
+        assert store.verify() == [store.object_path(digest)]
+
+        fresh = ContentStore(tmp / 'store')
+        fresh.reflinks = False
+        try:
+            fresh.link(digest, tmp / 'two' / 'rule.mdc')
+            assert False, 'linked a corrupted object'
+        except ValueError:
+            pass
+        fresh.materialize(b'original\n', tmp / 'three' / 'rule.mdc')
+        assert (tmp / 'three' / 'rule.mdc').read_bytes() == b'original\n'
+        assert fresh.verify() == [] and not os.path.samefile(linked, tmp / 'three' / 'rule.mdc')
+        assert linked.read_bytes() == b'edited\n'
+
+
+def test_sharded_rule_output():
+    """Sharded output writes one scoped .cursor/rules entry per rule instead of .cursorrules"""
+    from mvp_quickstart.validate import check_rule
+
+    with tempfile.TemporaryDirectory(prefix='mvp-sharded-') as tmp:
+        tmp = Path(tmp)
+        (tmp / 'source').mkdir()
+        copy_template(tmp / 'source')
+        project = tmp / 'project'
+        result = scaffold(tmp / 'source', project, 'react', PROJECT_NAME, rule_output='sharded')
+        assert result.success, result.error
+
+        assert not (project / '.cursorrules').exists()
+        rules_dir = project / '.cursor' / 'rules'
+        written = sorted(p.relative_to(rules_dir).as_posix() for p in rules_dir.rglob('*.mdc'))
+        assert written == sorted(result.rules)
+        assert json.loads((project / '.mvp-config.json').read_text(encoding='utf-8'))['rule_output'] == 'sharded'
+
+        awesome = (rules_dir / 'react_typescript_cursorrules.mdc').read_text(encoding='utf-8')
+        assert '\nglobs: **/*.jsx, **/*.tsx, **/*.ts\nalwaysApply: false\n' in awesome
+        assert not [d for d in check_rule('react_typescript_cursorrules.mdc', awesome.encode('utf-8'))
+                    if d['severity'] == 'error']
+
+
+if __name__ == '__main__':
+    print("🧪 MVP Template Architecture Matrix")
+    print("=" * 60)
+
+    overall_start = time.time()
+    results = run_matrix()
+    total_duration = time.time() - overall_start
+
+    for result in results:
+        status = "✅" if result['passed'] else "❌"
+        print(f"  {status} {result['architecture']:<20} ({result['duration']:.2f}s)")
+        for failure in result['failures']:
+            print(f"      - {failure}")
+
+    passed = sum(1 for r in results if r['passed'])
+    print(f"\n📊 {passed}/{len(results)} architectures passed in {total_duration:.2f} seconds")
+
+    if passed != len(results):
+        sys.exit(1)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tests for the metrics export: JSON-lines events, the cumulative OpenMetrics
+text file (counters, histogram buckets and sums, label escaping, # EOF) and its
+locked state sidecar.
+"""
+
+import json
+import re
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart.metrics import (DURATION_BUCKETS, STATE_VERSION, jsonl_events, record_run,
+                                    render_openmetrics, update_openmetrics, update_state)
+from quick_start import scaffold
+
+SAMPLE = re.compile(r'^([a-z_]+)\{((?:[a-z_]+="(?:[^"\\]|\\.)*",?)*)\} (\S+)$')
+LABEL = re.compile(r'([a-z_]+)="((?:[^"\\]|\\.)*)"')
+
+
+def make_run(architecture: str, duration: float, success: bool = True, steps=()) -> dict:
+    return {'run_id': f'{architecture}-{duration}', 'timestamp': '2026-01-01T00:00:00', 'architecture': architecture,
+            'project_name': 'Metrics', 'success': success, 'error': None if success else 'boom',
+            'duration_seconds': duration, 'bytes_written': 100, 'files_written': 2, 'subprocess_seconds': 0.5,
+            'rules': {'local': 3, 'awesome': 1, 'total': 4},
+            'steps': [{'step': name, 'duration_seconds': seconds, 'success': ok, 'bytes_written': 50,
+                       'files_written': 1, 'subprocess_seconds': 0.0} for name, seconds, ok in steps]}
+
+
+def unescape(value: str) -> str:
+    return re.sub(r'\\(.)', lambda m: '\n' if m.group(1) == 'n' else m.group(1), value)
+
+
+def parse_samples(text: str) -> dict:
+    """{(name, ((label, value), ...)): value} for every sample line"""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith('#'):
+            continue
+        match = SAMPLE.match(line)
+        assert match, line
+        labels = tuple((name, unescape(value)) for name, value in LABEL.findall(match.group(2)))
+        samples[match.group(1), labels] = float(match.group(3))
+    return samples
+
+
+def test_jsonl_events():
+    run = make_run('react', 1.5, steps=[('copy', 0.25, True), ('readme', 0.5, False)])
+    events = jsonl_events(run)
+    assert [event['event'] for event in events] == ['step', 'step', 'run']
+    assert events[0]['step'] == 'copy' and events[1]['success'] is False
+    assert all(event['run_id'] == run['run_id'] and event['architecture'] == 'react' for event in events)
+    assert 'steps' not in events[-1] and events[-1]['duration_seconds'] == 1.5
+
+
+def test_update_state():
+    state = {}
+    update_state(state, make_run('react', 0.2, steps=[('copy', 0.01, True)]))
+    update_state(state, make_run('react', 3.0, success=False, steps=[('copy', 0.02, False)]))
+    assert state['runs'] == {'["react", "success"]': 1, '["react", "failure"]': 1}
+    assert state['bytes_written'] == {'["react"]': 200} and state['subprocess_seconds'] == {'["react"]': 1.0}
+    assert state['step_failures'] == {'["react", "copy"]': 1}
+    histogram = state['run_duration']['["react"]']
+    assert histogram['count'] == 2 and histogram['sum'] == 3.2
+    # Buckets are cumulative: each counts every observation at or below its bound
+    assert histogram['buckets'] == [(0.2 <= bound) + (3.0 <= bound) for bound in DURATION_BUCKETS]
+    # Rule counts are a gauge of the latest run
+    assert state['rules']['["react", "total"]'] == 4
+
+
+def test_render_openmetrics():
+    state = update_state({}, make_run('we"ird\\arch\nname', 0.3))
+    text = render_openmetrics(state)
+    assert text.endswith('\n# EOF\n') and text.count('# EOF') == 1
+    assert 'architecture="we\\"ird\\\\arch\\nname"' in text
+    samples = parse_samples(text)
+    assert samples['mvp_scaffold_runs_total', (('architecture', 'we"ird\\arch\nname'), ('result', 'success'))] == 1
+    # Counter families are declared without the _total suffix every one of their samples carries
+    counters = {line.split()[2] for line in text.splitlines()
+                if line.startswith('# TYPE') and line.endswith(' counter')}
+    assert 'mvp_scaffold_runs' in counters and not any(name.endswith('_total') for name in counters)
+    for name, _ in samples:
+        assert (name[:-len('_total')] in counters) == name.endswith('_total'), name
+
+
+def test_textfile_accumulates_runs():
+    with tempfile.TemporaryDirectory(prefix='mvp-metrics-') as tmp:
+        textfile = Path(tmp) / 'collector' / 'mvp.prom'
+        update_openmetrics(textfile, make_run('react', 0.04, steps=[('copy', 0.004, True)]))
+        update_openmetrics(textfile, make_run('react', 0.7, success=False, steps=[('copy', 0.02, False)]))
+        text = textfile.read_text(encoding='utf-8')
+        assert text.endswith('# EOF\n')
+        samples = parse_samples(text)
+
+        react = (('architecture', 'react'),)
+        assert samples['mvp_scaffold_runs_total', react + (('result', 'success'),)] == 1
+        assert samples['mvp_scaffold_runs_total', react + (('result', 'failure'),)] == 1
+        assert samples['mvp_scaffold_written_bytes_total', react] == 200
+        assert samples['mvp_scaffold_step_failures_total', react + (('step', 'copy'),)] == 1
+        assert samples['mvp_scaffold_duration_seconds_sum', react] == 0.74
+        assert samples['mvp_scaffold_duration_seconds_count', react] == 2
+
+        buckets = [samples['mvp_scaffold_duration_seconds_bucket', react + (('le', repr(bound)),)]
+                   for bound in DURATION_BUCKETS]
+        assert buckets == [(0.04 <= bound) + (0.7 <= bound) for bound in DURATION_BUCKETS]
+        assert buckets == sorted(buckets)
+        assert samples['mvp_scaffold_duration_seconds_bucket', react + (('le', '+Inf'),)] == 2
+        step = react + (('step', 'copy'),)
+        assert samples['mvp_scaffold_step_duration_seconds_bucket', step + (('le', '0.005'),)] == 1
+        assert samples['mvp_scaffold_step_duration_seconds_sum', step] == 0.024
+
+        # The aggregates live in the sidecar, next to the lock file
+        state = json.loads((textfile.parent / 'mvp.prom.state.json').read_text(encoding='utf-8'))
+        assert state['version'] == STATE_VERSION and state['run_duration']['["react"]']['count'] == 2
+        assert (textfile.parent / 'mvp.prom.lock').exists()
+        assert sorted(path.name for path in textfile.parent.iterdir()) == [
+            'mvp.prom', 'mvp.prom.lock', 'mvp.prom.state.json']
+
+        # A sidecar from another version starts the aggregates over
+        (textfile.parent / 'mvp.prom.state.json').write_text('{"version": 0}', encoding='utf-8')
+        update_openmetrics(textfile, make_run('react', 0.1))
+        assert parse_samples(textfile.read_text(encoding='utf-8'))['mvp_scaffold_duration_seconds_count', react] == 1
+
+
+def test_concurrent_updates_are_not_lost():
+    with tempfile.TemporaryDirectory(prefix='mvp-metrics-') as tmp:
+        textfile = Path(tmp) / 'mvp.prom'
+        threads = [threading.Thread(target=update_openmetrics, args=(textfile, make_run('go', 0.01 * index)))
+                   for index in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        samples = parse_samples(textfile.read_text(encoding='utf-8'))
+        assert samples['mvp_scaffold_runs_total', (('architecture', 'go'), ('result', 'success'))] == 16
+        assert samples['mvp_scaffold_written_files_total', (('architecture', 'go'),)] == 32
+
+
+def test_record_scaffold_run():
+    with tempfile.TemporaryDirectory(prefix='mvp-metrics-') as tmp:
+        jsonl, textfile = Path(tmp) / 'runs.jsonl', Path(tmp) / 'mvp.prom'
+        for name in ('first', 'second'):
+            result = scaffold(TEMPLATE_ROOT, Path(tmp) / name, 'react', 'Metrics App')
+            assert result.success
+            record_run(result.metrics, jsonl, textfile)
+
+        events = [json.loads(line) for line in jsonl.read_text(encoding='utf-8').splitlines()]
+        runs = [event for event in events if event['event'] == 'run']
+        assert len(runs) == 2 and all(run['success'] for run in runs)
+        assert len(events) == 2 + 2 * len(result.metrics['steps'])
+
+        samples = parse_samples(textfile.read_text(encoding='utf-8'))
+        react = (('architecture', 'react'),)
+        assert samples['mvp_scaffold_runs_total', react + (('result', 'success'),)] == 2
+        assert samples['mvp_scaffold_duration_seconds_count', react] == 2
+        assert samples['mvp_scaffold_duration_seconds_sum', react] == sum(run['duration_seconds'] for run in runs)
+        assert samples['mvp_scaffold_written_files_total', react] == sum(run['files_written'] for run in runs)
+
+
+if __name__ == '__main__':
+    test_jsonl_events()
+    test_update_state()
+    test_render_openmetrics()
+    test_textfile_accumulates_runs()
+    test_concurrent_updates_are_not_lost()
+    test_record_scaffold_run()
+    print('✅ Metrics tests passed')
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the archive pack: deduplication, compression, indexed reads and
+restore, plus in-place setups: add_architecture.py reads the catalog back
+out of the pack, and a command-line run imports the scaffolder's modules
+lazily until it ends, after its own code has been archived.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+sys.path.insert(0, str(TEMPLATE_ROOT / 'dev_tools'))
+
+from mvp_quickstart.pack import ArchivePack
+from quick_start import MVPQuickStart
+from test_matrix import copy_template
+
+
+def test_pack_roundtrip():
+    with tempfile.TemporaryDirectory(prefix='mvp-pack-') as tmp:
+        tmp = Path(tmp)
+        tree = tmp / 'rules'
+        (tree / 'nested').mkdir(parents=True)
+        (tree / 'a.mdc').write_text('same content\n' * 500, encoding='utf-8')
+        (tree / 'nested' / 'b.mdc').write_text('same content\n' * 500, encoding='utf-8')
+        (tmp / 'small.json').write_text('{"x": 1}', encoding='utf-8')
+
+        pack = ArchivePack(tmp / 'archive')
+        pack.add_tree(tree, 'rules')
+        pack.add_file(tmp / 'small.json', 'small.json')
+        pack.commit(archived_at='1')
+
+        # Identical files are stored once, and compressed
+        assert len(pack.objects) == 2
+        stats = pack.stats()
+        assert stats['packed_bytes'] < stats['original_bytes'] // 10
+
+        # A second run of unchanged files adds no objects
+        pack = ArchivePack(tmp / 'archive')
+        pack.add_file(tmp / 'small.json', 'small.json')
+        size_before = pack.pack_path.stat().st_size
+        pack.commit(archived_at='2')
+        assert pack.pack_path.stat().st_size == size_before
+        assert len(pack.snapshots) == 2
+
+        assert pack.read_path('rules/nested/b.mdc') == (tree / 'nested' / 'b.mdc').read_bytes()
+        assert pack.read_path('missing') is None
+
+        restored = pack.restore(tmp / 'out', ['rules/nested'])
+        assert restored == ['rules/nested/b.mdc']
+        assert not (tmp / 'out' / 'rules' / 'a.mdc').exists()
+
+
+def test_in_place_setup_archives_into_pack():
+    with tempfile.TemporaryDirectory(prefix='mvp-pack-project-') as tmp:
+        project = Path(tmp)
+        copy_template(project)
+        shutil.copy2(TEMPLATE_ROOT / 'quick_start.py', project)
+        shutil.copytree(TEMPLATE_ROOT / 'mvp_quickstart', project / 'mvp_quickstart',
+                        ignore=shutil.ignore_patterns('__pycache__'))
+
+        result = MVPQuickStart(project_root=project, quiet=True).scaffold('mern', 'Pack Test')
+        assert result.success, result.error
+
+        archive = project / 'archive'
+        assert (archive / 'archive.pack').exists() and (archive / 'manifest.json').exists()
+        assert not (project / 'quick_start.py').exists() and not (project / 'mvp_quickstart').exists()
+        assert not list(archive.glob('*_architectures.json'))
+
+        pack = ArchivePack(archive)
+        assert pack.read_path('architectures.json') == (TEMPLATE_ROOT / 'architectures.json').read_bytes()
+
+        # add_architecture.py is standalone: it reads the pack without mvp_quickstart
+        output = subprocess.run(
+            [sys.executable, '-c',
+             'import json, add_architecture; '
+             'print(json.dumps(sorted(add_architecture.ArchitectureAdder().get_archived_architectures())))'],
+            cwd=project, capture_output=True, text=True, check=True).stdout
+        architectures = json.loads(output)
+        assert 'react' in architectures and 'fastapi' in architectures
+
+
+def test_in_place_command_line_setup():
+    if shutil.which('git') is None:
+        print('⚠️  git not installed - skipping the in-place command-line setup')
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-pack-project-') as tmp:
+        project = Path(tmp) / 'template'
+        project.mkdir()
+        copy_template(project)
+        shutil.copy2(TEMPLATE_ROOT / 'quick_start.py', project)
+        shutil.copytree(TEMPLATE_ROOT / 'mvp_quickstart', project / 'mvp_quickstart',
+                        ignore=shutil.ignore_patterns('__pycache__'))
+        metrics = Path(tmp) / 'metrics.jsonl'
+        env = dict(os.environ, GIT_COMMITTER_NAME='Test', GIT_COMMITTER_EMAIL='test@example.com',
+                   GIT_AUTHOR_NAME='Test', GIT_AUTHOR_EMAIL='test@example.com')
+
+        # A fresh interpreter: nothing is imported ahead of the steps that need it
+        result = subprocess.run([sys.executable, 'quick_start.py', '--architecture', 'fastapi-react', '--name',
+                                 'In Place', '--skip-taskmaster', '--git-init', '--metrics-jsonl', str(metrics)],
+                                cwd=project, env=env, capture_output=True, text=True, timeout=300)
+        assert result.returncode == 0 and 'Error during setup' not in result.stdout, result.stdout + result.stderr
+        assert not (project / 'mvp_quickstart').exists() and not (project / 'quick_start.py').exists()
+        assert 'mvp_quickstart/tuning.py' in ArchivePack(project / 'archive').latest_files()
+        runs = [json.loads(line) for line in metrics.read_text(encoding='utf-8').splitlines()]
+        assert [run['success'] for run in runs if run['event'] == 'run'] == [True]
+        status = subprocess.run(['git', 'status', '--porcelain'], cwd=project, capture_output=True, text=True,
+                                check=True).stdout
+        assert status == '', status
+
+
+if __name__ == '__main__':
+    test_pack_roundtrip()
+    test_in_place_setup_archives_into_pack()
+    test_in_place_command_line_setup()
+    print('✅ Archive pack tests passed')
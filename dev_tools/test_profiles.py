@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for the performance profile: the tuned Python backend starters, their
+requirements, gunicorn settings and environment overrides, the Dockerfile
+command that serves them, and the smoke benchmark's load generator (driven
+against a stdlib server, so no web framework is needed).
+"""
+
+import importlib.util
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from quick_start import MVPQuickStart, scaffold
+
+EXPECTED_FILES = {
+    'fastapi': ['main.py', 'db.py', 'gunicorn.conf.py', 'bench/baseline_main.py', 'bench/smoke_benchmark.py'],
+    'flask': ['app.py', 'db.py', 'gunicorn.conf.py', 'bench/baseline_app.py', 'bench/smoke_benchmark.py'],
+    'django': ['manage.py', 'perf_test/settings.py', 'perf_test/urls.py', 'perf_test/wsgi.py',
+               'perf_test/asgi.py', 'gunicorn.conf.py', 'bench/baseline_settings.py', 'bench/smoke_benchmark.py'],
+}
+
+
+def load_module(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+GUNICORN_ENV = ('BIND', 'PORT', 'WEB_CONCURRENCY', 'GUNICORN_THREADS', 'KEEPALIVE_SECONDS',
+                'REQUEST_TIMEOUT_SECONDS', 'MAX_REQUESTS', 'ACCESS_LOG')
+
+
+def gunicorn_settings(path: Path, env: dict = None) -> dict:
+    """Execute gunicorn.conf.py with only env set among the variables it reads"""
+    settings = {}
+    saved = {name: os.environ.pop(name) for name in GUNICORN_ENV if name in os.environ}
+    os.environ.update(env or {})
+    try:
+        exec(compile(path.read_text(encoding='utf-8'), str(path), 'exec'), settings)
+    finally:
+        for name in GUNICORN_ENV:
+            os.environ.pop(name, None)
+        os.environ.update(saved)
+    return settings
+
+
+def dockerfile_command(project: Path) -> list:
+    cmd = [line for line in (project / 'Dockerfile').read_text(encoding='utf-8').splitlines()
+           if line.startswith('CMD ')]
+    assert len(cmd) == 1, cmd
+    return json.loads(cmd[0][len('CMD '):])
+
+
+def test_performance_starters():
+    cpus = multiprocessing.cpu_count()
+    with tempfile.TemporaryDirectory(prefix='mvp-profile-') as tmp:
+        for architecture, kind in (('fastapi', 'fastapi'), ('flask', 'flask'), ('django', 'django')):
+            project = Path(tmp) / architecture
+            result = scaffold(TEMPLATE_ROOT, project, architecture, 'Perf Test', profile='performance')
+            assert result.success, result.error
+
+            for rel_path in EXPECTED_FILES[kind]:
+                assert (project / rel_path).exists(), (architecture, rel_path)
+            for path in project.rglob('*.py'):
+                compile(path.read_text(encoding='utf-8'), str(path), 'exec')
+
+            settings = gunicorn_settings(project / 'gunicorn.conf.py')
+            assert settings['keepalive'] == 5 and settings['preload_app']
+            assert settings['workers'] == (cpus if kind == 'fastapi' else cpus * 2 + 1)
+            assert settings['threads'] == (1 if kind == 'fastapi' else 4)
+            assert settings['timeout'] == settings['graceful_timeout'] == 30
+            assert settings['bind'] == '0.0.0.0:8000'
+            settings = gunicorn_settings(project / 'gunicorn.conf.py', {
+                'WEB_CONCURRENCY': '7', 'GUNICORN_THREADS': '3', 'REQUEST_TIMEOUT_SECONDS': '12',
+                'KEEPALIVE_SECONDS': '75', 'PORT': '9000'})
+            assert (settings['workers'], settings['threads'], settings['timeout']) == (7, 3, 12)
+            assert settings['graceful_timeout'] == 12 and settings['keepalive'] == 75
+            assert settings['bind'] == '0.0.0.0:9000'
+
+            requirements = (project / 'requirements.txt').read_text(encoding='utf-8').splitlines()
+            assert 'gunicorn' in requirements
+            config = json.loads((project / '.mvp-config.json').read_text(encoding='utf-8'))
+            assert config['profile'] == 'performance'
+
+        fastapi = Path(tmp) / 'fastapi'
+        assert 'default_response_class=ORJSONResponse' in (fastapi / 'main.py').read_text(encoding='utf-8')
+        assert 'allow_origins=["*"]' in (fastapi / 'bench' / 'baseline_main.py').read_text(encoding='utf-8')
+        requirements = (fastapi / 'requirements.txt').read_text(encoding='utf-8').splitlines()
+        assert 'uvicorn[standard]' in requirements and 'uvicorn' not in requirements
+        settings = (Path(tmp) / 'django' / 'perf_test' / 'settings.py').read_text(encoding='utf-8')
+        assert "'CONN_MAX_AGE'" in settings and 'cached.Loader' in settings
+
+        for rel_path in ('manage.py', 'perf_test/wsgi.py', 'perf_test/asgi.py'):
+            text = (Path(tmp) / 'django' / rel_path).read_text(encoding='utf-8')
+            assert "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'perf_test.settings')" in text, rel_path
+
+        benchmark = load_module(Path(tmp) / 'django' / 'bench' / 'smoke_benchmark.py', 'django_smoke_benchmark')
+        assert benchmark.SERVERS['default']['env'] == {'DJANGO_SETTINGS_MODULE': 'bench.baseline_settings'}
+        assert benchmark.SERVERS['performance']['command'][-1] == 'perf_test.wsgi:application'
+
+
+def test_dockerfile_serves_the_tuned_starter():
+    apps = {'fastapi': ('main:app', 'main.py', 'app = FastAPI('),
+            'flask': ('app:app', 'app.py', 'app = Flask('),
+            'django': ('shop_app.wsgi:application', 'shop_app/wsgi.py', 'application = get_wsgi_application()')}
+    with tempfile.TemporaryDirectory(prefix='mvp-profile-') as tmp:
+        for architecture, (app, module_path, definition) in apps.items():
+            project = Path(tmp) / architecture
+            assert scaffold(TEMPLATE_ROOT, project, architecture, 'Shop App', profile='performance').success
+            assert dockerfile_command(project) == ['gunicorn', '-c', 'gunicorn.conf.py', app]
+            # The module the CMD names is one the starter wrote, and it defines the app object
+            module, attribute = app.split(':')
+            assert module.replace('.', '/') + '.py' == module_path
+            text = (project / module_path).read_text(encoding='utf-8')
+            assert definition in text and definition.startswith(f'{attribute} = ')
+            assert (project / 'gunicorn.conf.py').is_file()
+        settings = (Path(tmp) / 'django' / 'shop_app' / 'wsgi.py').read_text(encoding='utf-8')
+        assert "'DJANGO_SETTINGS_MODULE', 'shop_app.settings'" in settings
+        assert (Path(tmp) / 'django' / 'shop_app' / 'settings.py').is_file()
+
+
+def test_default_profile_is_unchanged():
+    with tempfile.TemporaryDirectory(prefix='mvp-profile-') as tmp:
+        project = Path(tmp) / 'fastapi'
+        assert scaffold(TEMPLATE_ROOT, project, 'fastapi', 'Plain').success
+        assert not (project / 'gunicorn.conf.py').exists() and not (project / 'bench').exists()
+        assert (project / 'main.py').read_text(encoding='utf-8') == MVPQuickStart.default_starter('fastapi', 'Plain')[1]
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{"status": "healthy"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_smoke_benchmark_load_generator():
+    with tempfile.TemporaryDirectory(prefix='mvp-profile-') as tmp:
+        project = Path(tmp) / 'fastapi'
+        assert scaffold(TEMPLATE_ROOT, project, 'fastapi', 'Bench', profile='performance').success
+        benchmark = load_module(project / 'bench' / 'smoke_benchmark.py', 'fastapi_smoke_benchmark')
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), HealthHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            port = server.server_address[1]
+            result = benchmark.load(port, duration=0.3, concurrency=4, processes=2)
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert result['requests'] > 0 and result['errors'] == 0
+        assert result['rps'] > 0 and result['p99_ms'] >= result['p50_ms']
+
+
+if __name__ == '__main__':
+    test_performance_starters()
+    test_dockerfile_serves_the_tuned_starter()
+    test_default_profile_is_unchanged()
+    test_smoke_benchmark_load_generator()
+    print('✅ Performance profile tests passed')
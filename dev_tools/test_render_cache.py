@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests for the golden-snapshot render cache: instantiated projects match a full
+render apart from timestamps, template edits invalidate snapshots, and
+scaffolds the cache cannot reproduce fall back to a full render.
+"""
+
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart.manifest import MANIFEST_NAME, verify
+from mvp_quickstart.render_cache import GOLDEN_NAME, cacheable, template_fingerprint
+from quick_start import scaffold
+
+TIMESTAMP_FILES = ('.mvp-config.json',)
+# Keyed by path: the golden name sorts differently, so only the key order may differ
+UNORDERED_FILES = ('.mvp-base.json',)
+
+
+def tree(root: Path) -> dict:
+    files = {}
+    for path in sorted(root.rglob('*')):
+        if path.is_file():
+            files[path.relative_to(root).as_posix()] = path.read_bytes()
+    return files
+
+
+def archive_info_name(path: str) -> str:
+    """The archive info file is named after the second it was written in"""
+    return re.sub(r'^archive/\d{8}_\d{6}_archive_info\.json$', 'archive/archive_info.json', path)
+
+
+def without_timestamps(files: dict) -> dict:
+    files = {archive_info_name(path): data for path, data in files.items()}
+    info = json.loads(files['archive/archive_info.json'])
+    info.pop('archived_at')
+    files['archive/archive_info.json'] = info
+    for name in TIMESTAMP_FILES:
+        config = json.loads(files[name])
+        config.pop('created_at'), config.pop('last_modified')
+        files[name] = config
+    for name in UNORDERED_FILES:
+        files[name] = json.loads(files[name])
+    # Stat data differs, and so do the hashes of the files normalized above
+    manifest = json.loads(files[MANIFEST_NAME])['files']
+    files[MANIFEST_NAME] = {archive_info_name(path): entry['size'] if path in TIMESTAMP_FILES + UNORDERED_FILES
+                            else entry['sha256'] for path, entry in manifest.items()
+                            if archive_info_name(path) != 'archive/archive_info.json'}
+    return files
+
+
+def test_snapshot_matches_full_render():
+    with tempfile.TemporaryDirectory(prefix='mvp-render-cache-') as tmp:
+        cache = Path(tmp) / 'cache'
+        for key in ('react', 'django', 'rust'):
+            full = scaffold(TEMPLATE_ROOT, Path(tmp) / f'{key}-full', key, 'Shop App', profile='performance')
+            miss = scaffold(TEMPLATE_ROOT, Path(tmp) / f'{key}-miss', key, 'Other App', profile='performance',
+                            cache_dir=cache)
+            hit = scaffold(TEMPLATE_ROOT, Path(tmp) / f'{key}-hit', key, 'Shop App', profile='performance',
+                           cache_dir=cache)
+            assert full.success and miss.success and hit.success, key
+            assert (miss.metrics['render_cache'], hit.metrics['render_cache']) == ('miss', 'hit'), key
+            assert 'render_cache' not in full.metrics
+            assert without_timestamps(tree(full.project_root)) == without_timestamps(tree(hit.project_root)), key
+            assert (hit.steps, hit.rules, hit.messages) == (full.steps, full.rules, full.messages), key
+            assert hit.metrics['files_written'] == len(tree(hit.project_root))
+            assert verify(hit.project_root) == {'modified': [], 'missing': [], 'rehashed': []}
+            assert not any(GOLDEN_NAME in path.name for path in hit.project_root.rglob('*'))
+
+
+def test_shared_files_are_linked():
+    with tempfile.TemporaryDirectory(prefix='mvp-render-cache-') as tmp:
+        cache = Path(tmp) / 'cache'
+        first = scaffold(TEMPLATE_ROOT, Path(tmp) / 'first', 'fastapi', 'Alpha App', rule_output='sharded',
+                         cache_dir=cache)
+        second = scaffold(TEMPLATE_ROOT, Path(tmp) / 'second', 'fastapi', 'Beta App', rule_output='sharded',
+                          cache_dir=cache)
+        rules = sorted((second.project_root / '.cursor' / 'rules').rglob('*.mdc'))
+        assert rules and all(os.stat(path).st_nlink >= 3 for path in rules)
+        readme = (second.project_root / 'README.md').read_text(encoding='utf-8')
+        assert 'Beta App' in readme and 'Alpha App' not in readme
+        assert os.stat(second.project_root / 'README.md').st_nlink == 1
+        assert first.success and second.success
+
+
+def test_edits_stay_in_their_project():
+    with tempfile.TemporaryDirectory(prefix='mvp-render-cache-') as tmp:
+        cache = Path(tmp) / 'cache'
+        first, second = (scaffold(TEMPLATE_ROOT, Path(tmp) / name, 'fastapi', f'{name.title()} App', cache_dir=cache)
+                         for name in ('first', 'second'))
+        assert second.metrics['render_cache'] == 'hit'
+        for rel_path in ('requirements.txt', 'Dockerfile', '.env.example', '.cursorrules'):
+            path = second.project_root / rel_path
+            assert os.stat(path).st_nlink == 1 and os.stat(path).st_mode & 0o200, rel_path
+        original = (first.project_root / 'requirements.txt').read_text(encoding='utf-8')
+        # Editors and tools that write in place must not reach the cache or a sibling
+        with open(second.project_root / 'requirements.txt', 'a', encoding='utf-8') as f:
+            f.write('\nhttpx\n')
+        third = scaffold(TEMPLATE_ROOT, Path(tmp) / 'third', 'fastapi', 'Third App', cache_dir=cache)
+        assert third.metrics['render_cache'] == 'hit'
+        for project in (first, third):
+            assert (project.project_root / 'requirements.txt').read_text(encoding='utf-8') == original
+
+
+def test_written_through_link_is_a_miss():
+    with tempfile.TemporaryDirectory(prefix='mvp-render-cache-') as tmp:
+        cache = Path(tmp) / 'cache'
+        first, second = (scaffold(TEMPLATE_ROOT, Path(tmp) / name, 'fastapi', f'{name.title()} App',
+                                  rule_output='sharded', cache_dir=cache) for name in ('first', 'second'))
+        rule = sorted((second.project_root / '.cursor' / 'rules').rglob('*.mdc'))[0]
+        if os.stat(rule).st_nlink < 3:
+            return
+        original = rule.read_bytes()
+        # Root, or a tool that chmods before writing in place, reaches the shared object
+        os.chmod(rule, 0o644)
+        rule.write_bytes(b'edited\n')
+        third = scaffold(TEMPLATE_ROOT, Path(tmp) / 'third', 'fastapi', 'Third App', rule_output='sharded',
+                         cache_dir=cache)
+        assert third.metrics['render_cache'] == 'miss'
+        assert (third.project_root / rule.relative_to(second.project_root)).read_bytes() == original
+
+
+def test_template_edit_invalidates():
+    with tempfile.TemporaryDirectory(prefix='mvp-render-cache-') as tmp:
+        template = Path(tmp) / 'template'
+        shutil.copytree(TEMPLATE_ROOT, template, ignore=shutil.ignore_patterns('.git', '__pycache__'))
+        cache = Path(tmp) / 'cache'
+        before = template_fingerprint(template)
+        assert scaffold(template, Path(tmp) / 'a', 'vue', 'A', cache_dir=cache).metrics['render_cache'] == 'miss'
+        assert scaffold(template, Path(tmp) / 'b', 'vue', 'B', cache_dir=cache).metrics['render_cache'] == 'hit'
+
+        catalog_path = template / 'architectures.json'
+        catalog = json.loads(catalog_path.read_text(encoding='utf-8'))
+        catalog['categories']['frontend']['architectures']['vue']['name'] = 'Edited Vue'
+        catalog_path.write_text(json.dumps(catalog, indent=2), encoding='utf-8')
+        assert template_fingerprint(template) != before
+        result = scaffold(template, Path(tmp) / 'c', 'vue', 'C', cache_dir=cache)
+        assert result.metrics['render_cache'] == 'miss'
+        assert 'Edited Vue' in (result.project_root / 'README.md').read_text(encoding='utf-8')
+
+
+def test_ineligible_scaffolds_render_in_full():
+    assert cacheable('My App_2') and not cacheable('Café') and not cacheable('a "quoted" name')
+    with tempfile.TemporaryDirectory(prefix='mvp-render-cache-') as tmp:
+        cache = Path(tmp) / 'cache'
+        result = scaffold(TEMPLATE_ROOT, Path(tmp) / 'quoted', 'fastapi', 'a "quoted" name', cache_dir=cache)
+        assert result.success and 'render_cache' not in result.metrics
+
+        occupied = Path(tmp) / 'occupied'
+        occupied.mkdir()
+        (occupied / 'notes.txt').write_text('keep\n', encoding='utf-8')
+        result = scaffold(TEMPLATE_ROOT, occupied, 'fastapi', 'Occupied', cache_dir=cache)
+        assert result.success and 'render_cache' not in result.metrics
+        assert (occupied / 'notes.txt').read_text(encoding='utf-8') == 'keep\n'
+
+        result = scaffold(TEMPLATE_ROOT, Path(tmp) / 'unknown', 'no-such-stack', 'X', cache_dir=cache)
+        assert not result.success
+
+
+if __name__ == '__main__':
+    test_snapshot_matches_full_render()
+    test_shared_files_are_linked()
+    test_edits_stay_in_their_project()
+    test_written_through_link_is_a_miss()
+    test_template_edit_invalidates()
+    test_ineligible_scaffolds_render_in_full()
+    print('✅ Render cache tests passed')
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the rule dependency graph: reference parsing, transitive closure in
+dependency order, cycles, and cache invalidation when a rule changes.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart.rules import parse_references, rule_graph
+
+
+def write_rule(rules_dir: Path, name: str, body: str, always: bool = False):
+    path = rules_dir / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f'---\ndescription: {name}\nglobs:\nalwaysApply: {str(always).lower()}\n---\n{body}\n',
+                    encoding='utf-8')
+
+
+def test_parse_references():
+    text = ('See [git](mdc:.cursor/rules/git.mdc), @index.mdc and [again](mdc:.cursor/rules/git.mdc). '
+            'Mentions like `plain.mdc` and emails like a@b.mdc are not references.')
+    assert parse_references(text) == ['.cursor/rules/git.mdc', 'index.mdc']
+
+
+def test_closure_order_and_cache():
+    with tempfile.TemporaryDirectory(prefix='mvp-rule-graph-') as tmp:
+        rules_dir = Path(tmp)
+        write_rule(rules_dir, 'app.mdc', 'Uses [api](mdc:.cursor/rules/api.mdc) and @style.mdc')
+        write_rule(rules_dir, 'api.mdc', 'Follows [style](mdc:style.mdc) and [db](mdc:.cursor/rules/db/schema.mdc)')
+        write_rule(rules_dir, 'style.mdc', 'No references')
+        write_rule(rules_dir, 'db/schema.mdc', 'See [migrations](mdc:migrations.mdc)')
+        write_rule(rules_dir, 'db/migrations.mdc', 'Back to [schema](mdc:schema.mdc)')  # cycle
+        write_rule(rules_dir, 'unused.mdc', 'Nobody references me')
+        write_rule(rules_dir, 'always.mdc', 'Refers to [missing](mdc:.cursor/rules/missing.mdc)', always=True)
+
+        graph = rule_graph(rules_dir)
+        assert graph.always_apply == {'always.mdc'}
+        assert graph.edges['db/migrations.mdc'] == ('db/schema.mdc',)
+
+        closure = graph.closure(['app.mdc'])
+        assert set(closure) == {'app.mdc', 'api.mdc', 'style.mdc', 'db/schema.mdc', 'db/migrations.mdc'}
+        for rule in closure:
+            for dependency in graph.edges[rule]:
+                if rule != 'db/migrations.mdc':  # the edge that closes the cycle
+                    assert closure.index(dependency) < closure.index(rule), (dependency, rule)
+
+        # Unchanged files: the same graph object and cached closures
+        assert rule_graph(rules_dir) is graph
+        assert graph.closure(['app.mdc']) is closure
+
+        # Editing a rule invalidates the graph
+        write_rule(rules_dir, 'style.mdc', 'Now needs @unused.mdc')
+        os.utime(rules_dir / 'style.mdc', ns=(0, 0))
+        updated = rule_graph(rules_dir)
+        assert updated is not graph
+        assert updated.closure(['style.mdc']) == ('unused.mdc', 'style.mdc')
+
+
+def test_catalog_rules_list_without_depending():
+    with tempfile.TemporaryDirectory(prefix='mvp-rule-graph-') as tmp:
+        rules_dir = Path(tmp)
+        write_rule(rules_dir, 'index.mdc', '| @api.mdc | API |\n| @ui.mdc | UI |', always=True)
+        write_rule(rules_dir, 'api.mdc', 'Follows [style](mdc:style.mdc)')
+        write_rule(rules_dir, 'ui.mdc', 'Components')
+        write_rule(rules_dir, 'style.mdc', 'No references')
+
+        graph = rule_graph(rules_dir)
+        assert graph.edges['index.mdc'] == ()
+        assert graph.closure(['index.mdc']) == ('index.mdc',)
+        assert graph.closure(['api.mdc', 'index.mdc']) == ('style.mdc', 'api.mdc', 'index.mdc')
+
+
+def test_template_rules_closure_is_complete():
+    graph = rule_graph(TEMPLATE_ROOT / '.cursor' / 'rules')
+    closure = graph.closure(['testing.mdc', 'pr-workflow-mandatory.mdc'])
+    for rule in closure:
+        assert set(graph.edges[rule]) <= set(closure)
+    assert 'git-automation.mdc' in closure and 'pr-title-validation.mdc' in closure
+
+    # A backend's rules stay free of the frontend rules index.mdc lists
+    always = sorted(rule for rule in graph.always_apply if '/' not in rule)
+    backend = graph.closure(['environment-variables.mdc', 'security.mdc', 'testing.mdc'] + always)
+    assert not {'ui-components.mdc', 'form-handling.mdc', 'hooks.mdc', 'data-fetching.mdc',
+                'gmail-api.mdc'} & set(backend)
+
+
+if __name__ == '__main__':
+    test_parse_references()
+    test_closure_order_and_cache()
+    test_catalog_rules_list_without_depending()
+    test_template_rules_closure_is_complete()
+    print('✅ Rule graph tests passed')
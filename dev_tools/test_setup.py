@@ -9,11 +9,10 @@ import sys
 import time
 import shutil
 from pathlib import Path
-from unittest.mock import patch
-from io import StringIO
 
-# Add the current directory to the path to import our module
-sys.path.insert(0, str(Path.cwd()))
+# Add the template root to the path to import our module
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
 
 # Import the quick start module
 from quick_start import MVPQuickStart
@@ -26,50 +25,39 @@ def test_setup():
     start_time = time.time()
     
     # Create a test directory
-    test_dir = Path.cwd() / 'test_mvp_project'
+    test_dir = TEMPLATE_ROOT / 'test_mvp_project'
     if test_dir.exists():
         shutil.rmtree(test_dir)
     test_dir.mkdir()
     
     try:
-        # Copy required files from parent directory FIRST
-        original_cwd = os.getcwd()
-        print(f"📄 Copying architectures.json from {Path(original_cwd) / 'architectures.json'} to {test_dir}")
-        shutil.copy(Path(original_cwd) / 'architectures.json', test_dir)
+        # Copy required files from the template root FIRST
+        print(f"📄 Copying architectures.json from {TEMPLATE_ROOT / 'architectures.json'} to {test_dir}")
+        shutil.copy(TEMPLATE_ROOT / 'architectures.json', test_dir)
         
         # Copy .cursor directory
-        source_cursor_dir = Path(original_cwd) / '.cursor'
+        source_cursor_dir = TEMPLATE_ROOT / '.cursor'
         dest_cursor_dir = test_dir / '.cursor'
         if source_cursor_dir.exists() and not dest_cursor_dir.exists():
             shutil.copytree(source_cursor_dir, dest_cursor_dir)
         
         # Copy dev_tools directory
-        source_dev_dir = Path(original_cwd) / 'dev_tools'
+        source_dev_dir = TEMPLATE_ROOT / 'dev_tools'
         dest_dev_dir = test_dir / 'dev_tools'
         if source_dev_dir.exists() and not dest_dev_dir.exists():
             shutil.copytree(source_dev_dir, dest_dev_dir)
         
-        # Change to test directory
-        os.chdir(test_dir)
-        
         # Verify the file was copied
-        if (Path.cwd() / 'architectures.json').exists():
+        if (test_dir / 'architectures.json').exists():
             print("✅ architectures.json copied successfully")
         else:
             print("❌ Failed to copy architectures.json")
         
-        # Initialize the quick start AFTER changing directory
-        quick_start = MVPQuickStart()
-        
-        # Mock user inputs
-        inputs = [
-            '35',  # MERN Stack selection  
-            'test-mvp'  # Project name
-        ]
+        # Initialize the quick start against the test directory
+        quick_start = MVPQuickStart(project_root=test_dir)
         
-        with patch('builtins.input', side_effect=inputs):
-            # Run the setup
-            quick_start.run_setup()
+        # Select the MERN stack by key so catalog reordering can't break the test
+        quick_start.run_setup('mern', 'test-mvp')
         
         end_time = time.time()
         setup_duration = end_time - start_time
@@ -141,10 +129,6 @@ def test_setup():
         import traceback
         traceback.print_exc()
         return False, 0
-    
-    finally:
-        # Return to original directory
-        os.chdir(original_cwd)
 
 def test_node_setup():
     """Test the Node.js setup script"""
@@ -153,13 +137,13 @@ def test_node_setup():
     
     try:
         # Check if Node.js script exists and is executable
-        node_script = Path.cwd() / 'quick-start.js'
+        node_script = TEMPLATE_ROOT / 'quick-start.js'
         if not node_script.exists():
             print("❌ quick-start.js not found")
             return False
         
         # Try to run with --help or version check
-        result = os.system('node quick-start.js --version 2>/dev/null')
+        result = os.system(f'node "{node_script}" --version 2>/dev/null')
         if result == 0:
             print("✅ Node.js script is executable")
         else:
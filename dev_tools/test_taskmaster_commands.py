@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for the generated taskmaster_commands.py helper, run against a
+synthetic Taskmaster tasks file (no Node or task-master CLI needed).
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from quick_start import MVPQuickStart
+
+
+def make_project(root: Path, tasks, tagged: bool = False):
+    """Write taskmaster_commands.py, the context template and a tasks file into root"""
+    MVPQuickStart(project_root=root, source_root=TEMPLATE_ROOT, quiet=True).create_taskmaster_commands_script()
+    (root / '.taskmaster' / 'templates').mkdir(parents=True)
+    shutil.copy2(TEMPLATE_ROOT / 'dev_tools' / 'templates' / 'task_context_template.md',
+                 root / '.taskmaster' / 'templates')
+    write_tasks(root, tasks, tagged)
+
+    spec = importlib.util.spec_from_file_location(f'taskmaster_commands_{id(root)}', root / 'taskmaster_commands.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_tasks(root: Path, tasks, tagged: bool = False):
+    tasks_file = root / '.taskmaster' / 'tasks' / 'tasks.json'
+    tasks_file.parent.mkdir(parents=True, exist_ok=True)
+    data = {'master': {'tasks': tasks, 'metadata': {}}} if tagged else {'tasks': tasks}
+    tasks_file.write_text(json.dumps(data), encoding='utf-8')
+
+
+def sample_tasks(count: int):
+    return [{
+        'id': task_id, 'title': f'Task {task_id}', 'description': f'Build part {task_id}',
+        'details': 'Implementation notes', 'testStrategy': 'Unit tests', 'status': 'pending',
+        'priority': 'medium', 'dependencies': [task_id - 1] if task_id > 1 else [],
+        'subtasks': [{'id': sub_id, 'title': f'Step {sub_id}', 'description': 'Do it', 'status': 'pending',
+                      'dependencies': []} for sub_id in (1, 2)],
+    } for task_id in range(1, count + 1)]
+
+
+def test_context_generation_is_incremental():
+    with tempfile.TemporaryDirectory(prefix='mvp-taskmaster-') as tmp:
+        root = Path(tmp)
+        tasks = sample_tasks(3)
+        commands = make_project(root, tasks, tagged=True)
+
+        assert commands.generate_contexts(root) == {'written': 9, 'unchanged': 0, 'removed': 0}
+        context_dir = root / '.taskmaster' / 'context'
+        document = (context_dir / 'task_02_context.md').read_text(encoding='utf-8')
+        assert document.startswith('# Task 2: Task 2 - Context Document\n')
+        assert '- **Dependencies**: 1' in document and '## Testing Strategy' in document
+        subtask = (context_dir / 'task_02_subtask_01_context.md').read_text(encoding='utf-8')
+        assert subtask.startswith('# Task 2.1: Step 1') and '- **Parent Task**: 2 - Task 2' in subtask
+
+        assert commands.generate_contexts(root) == {'written': 0, 'unchanged': 9, 'removed': 0}
+
+        # One subtask changes, one task (and its subtasks) is deleted
+        tasks[0]['subtasks'][1]['status'] = 'done'
+        del tasks[2]
+        write_tasks(root, tasks, tagged=True)
+        assert commands.generate_contexts(root) == {'written': 1, 'unchanged': 5, 'removed': 3}
+        assert not (context_dir / 'task_03_context.md').exists()
+
+        assert commands.generate_contexts(root, force=True)['written'] == 6
+
+
+def test_context_generation_scales():
+    with tempfile.TemporaryDirectory(prefix='mvp-taskmaster-') as tmp:
+        root = Path(tmp)
+        tasks = sample_tasks(300)
+        commands = make_project(root, tasks)
+        commands.generate_contexts(root)
+
+        tasks[150]['title'] = 'Renamed'  # the task and both subtasks name it
+        write_tasks(root, tasks)
+        start = time.perf_counter()
+        counts = commands.generate_contexts(root)
+        assert counts == {'written': 3, 'unchanged': 897, 'removed': 0}
+        assert time.perf_counter() - start < 1.0
+
+
+def test_native_queries_and_cache():
+    with tempfile.TemporaryDirectory(prefix='mvp-taskmaster-') as tmp:
+        root = Path(tmp)
+        tasks = sample_tasks(4)
+        tasks[2]['priority'] = 'high'
+        tasks[2]['dependencies'] = []
+        commands = make_project(root, tasks, tagged=True)
+
+        index = commands.load_index(root)
+        assert index.show('2.1')['title'] == 'Step 1'
+        assert index.list() == ['1', '2', '3', '4'] and len(index.list(with_subtasks=True)) == 12
+        assert index.dependents['3'] == ['4']
+        assert index.next_task() == '3'  # high priority, no dependencies
+        assert commands.load_index(root) is index
+
+        # Subtasks of an in-progress task come first; done dependencies unblock tasks
+        tasks[0]['status'] = 'in-progress'
+        tasks[0]['subtasks'][0]['status'] = 'done'
+        tasks[0]['subtasks'][1]['dependencies'] = [1]
+        write_tasks(root, tasks, tagged=True)
+        updated = commands.load_index(root)
+        assert updated is not index
+        assert updated.next_task() == '1.2'
+        assert updated.list(status='in-progress,done', with_subtasks=True) == ['1', '1.1']
+
+        for task in tasks:
+            task['status'] = 'done'
+        write_tasks(root, tasks, tagged=True)
+        assert commands.load_index(root).next_task() is None
+
+
+FAKE_CLI = """#!{python}
+import json, sys, time
+from pathlib import Path
+start = time.time()
+time.sleep(0.2)
+args = sys.argv[1:]
+if args[0] == 'set-status':
+    ids = next(a for a in args if a.startswith('--id=')).split('=', 1)[1].split(',')
+    status = next(a for a in args if a.startswith('--status=')).split('=', 1)[1]
+    tasks_file = Path('.taskmaster/tasks/tasks.json')
+    data = json.loads(tasks_file.read_text())
+    for task in data['tasks']:
+        if str(task['id']) in ids:
+            task['status'] = status
+    tasks_file.write_text(json.dumps(data))
+with open({log!r}, 'a') as log:
+    log.write(json.dumps([str(Path.cwd().name), args, start, time.time()]) + '\\n')
+print('ok', ' '.join(args))
+"""
+
+
+def test_batch_serializes_writers_per_tasks_file():
+    with tempfile.TemporaryDirectory(prefix='mvp-taskmaster-') as tmp:
+        tmp = Path(tmp)
+        (tmp / 'a').mkdir()
+        (tmp / 'b').mkdir()
+        commands = make_project(tmp / 'a', sample_tasks(4))
+        write_tasks(tmp / 'b', sample_tasks(2))
+
+        bin_dir = tmp / 'bin'
+        bin_dir.mkdir()
+        log = tmp / 'calls.jsonl'
+        (bin_dir / 'task-master').write_text(FAKE_CLI.format(python=sys.executable, log=str(log)))
+        (bin_dir / 'task-master').chmod(0o755)
+        old_path = os.environ['PATH']
+        os.environ['PATH'] = f'{bin_dir}{os.pathsep}{old_path}'
+        try:
+            script = ['# mark the first three done, then ask what is next',
+                      *(f'set-status --id={task_id} --status=done' for task_id in (1, 2, 3)),
+                      'next',
+                      'expand --id=4',
+                      '-C ../b expand --id=1',
+                      '-C ../b show 7']
+            results = commands.run_batch(commands.parse_batch(script, tmp / 'a'), jobs=4)
+        finally:
+            os.environ['PATH'] = old_path
+
+        assert [result['index'] for result in results] == list(range(7))
+        assert [result['returncode'] for result in results] == [0] * 6 + [1]
+        # The three status updates become one CLI call
+        assert [result['merged'] for result in results[:3]] == [3, 3, 3]
+        assert 'set-status --id=1,2,3 --status=done' in results[0]['stdout']
+        # The read after the writes sees them
+        assert results[3]['stdout'].startswith('🎯 Next: 4 ')
+
+        calls = [json.loads(line) for line in log.read_text().splitlines()]
+        project_a = [call for call in calls if call[0] == 'a']
+        assert [call[1][0] for call in project_a] == ['set-status', 'expand']
+        assert project_a[0][3] <= project_a[1][2]  # serialized, in order
+        project_b = next(call for call in calls if call[0] == 'b')
+        assert project_b[2] < project_a[0][3]  # the other project ran alongside
+
+
+if __name__ == '__main__':
+    test_context_generation_is_incremental()
+    test_context_generation_scales()
+    test_native_queries_and_cache()
+    test_batch_serializes_writers_per_tasks_file()
+    print('✅ Taskmaster helper tests passed')
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the generated test runner configs: which architectures get Jest,
+pytest, Playwright or Cypress config, their package.json and requirements
+wiring, and the Jest worker count (evaluated with Node when it is installed).
+"""
+
+import configparser
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart.testing import (CYPRESS_CONFIG_PATH, CYPRESS_TIMINGS_PATH, JEST_CONFIG_PATH,
+                                    PLAYWRIGHT_CONFIG_PATH, PYTEST_CONFIG_PATH, runner_files, runners)
+from quick_start import MVPQuickStart, scaffold
+
+
+def test_runners_for_catalog():
+    catalog = MVPQuickStart(source_root=TEMPLATE_ROOT, quiet=True).architectures
+    found = {key: runners(config) for key, config in catalog.items()}
+    assert found['react'] == found['nestjs'] == found['mern'] == ['jest']
+    assert found['fastapi'] == found['django'] == found['python-general'] == ['pytest']
+    assert found['fastapi-react'] == ['jest', 'pytest']
+    # manage.py test is Django's own runner, not pytest
+    assert found['django-react'] == ['jest']
+    assert found['playwright'] == ['playwright'] and found['cypress'] == ['cypress']
+    assert found['go'] == found['flutter'] == found['custom'] == []
+
+    files = runner_files('fastapi', catalog['fastapi'], 'Api')
+    pytest_ini = configparser.ConfigParser()
+    pytest_ini.read_string(files[PYTEST_CONFIG_PATH])
+    assert pytest_ini['pytest']['addopts'] == '-n auto --dist worksteal --ff'
+    assert 'archive' in pytest_ini['pytest']['norecursedirs'].split()
+    assert 'DJANGO_SETTINGS_MODULE' not in files[PYTEST_CONFIG_PATH]
+    django = runner_files('django', catalog['django'], 'Shop Api', 'performance')[PYTEST_CONFIG_PATH]
+    assert 'DJANGO_SETTINGS_MODULE = shop_api.settings' in django
+
+    assert "fullyParallel: true" in runner_files('playwright', catalog['playwright'], 'E2E')[PLAYWRIGHT_CONFIG_PATH]
+    cypress = runner_files('cypress', catalog['cypress'], 'E2E')
+    assert 'cypressSplit(on, config)' in cypress[CYPRESS_CONFIG_PATH]
+    assert json.loads(cypress[CYPRESS_TIMINGS_PATH]) == {'durations': []}
+
+
+def test_scaffold_wires_runners():
+    with tempfile.TemporaryDirectory(prefix='mvp-testing-') as tmp:
+        project = Path(tmp) / 'fastapi'
+        assert scaffold(TEMPLATE_ROOT, project, 'fastapi', 'Api').success
+        assert 'pytest-xdist' in (project / 'requirements.txt').read_text(encoding='utf-8').split()
+        assert (project / PYTEST_CONFIG_PATH).is_file()
+
+        project = Path(tmp) / 'react'
+        assert scaffold(TEMPLATE_ROOT, project, 'react', 'Web App').success
+        package = json.loads((project / 'package.json').read_text(encoding='utf-8'))
+        assert package['scripts']['test:changed'] == 'jest --onlyChanged'
+        assert (project / JEST_CONFIG_PATH).is_file()
+
+        # E2E architectures have only dev dependencies, and still get a package.json to run from
+        project = Path(tmp) / 'cypress'
+        assert scaffold(TEMPLATE_ROOT, project, 'cypress', 'E2E').success
+        package = json.loads((project / 'package.json').read_text(encoding='utf-8'))
+        assert package['scripts']['test:e2e'] == 'cypress run' and 'cypress-split' in package['devDependencies']
+        assert (project / CYPRESS_TIMINGS_PATH).is_file()
+
+        project = Path(tmp) / 'playwright'
+        assert scaffold(TEMPLATE_ROOT, project, 'playwright', 'E2E').success
+        package = json.loads((project / 'package.json').read_text(encoding='utf-8'))
+        assert package['scripts']['test:e2e:failed'] == 'playwright test --last-failed'
+
+
+def jest_workers(project: Path, ci: bool) -> int:
+    env = {key: value for key, value in os.environ.items() if key != 'CI'}
+    if ci:
+        env['CI'] = 'true'
+    result = subprocess.run(['node', '-e', f"console.log(require('./{JEST_CONFIG_PATH}').maxWorkers)"],
+                            cwd=project, env=env, capture_output=True, text=True, timeout=60, check=True)
+    return int(result.stdout)
+
+
+def test_jest_workers_follow_cores():
+    if shutil.which('node') is None:
+        print('⚠️  node not installed - skipping the Jest config evaluation')
+        return
+    with tempfile.TemporaryDirectory(prefix='mvp-testing-') as tmp:
+        project = Path(tmp) / 'expressjs'
+        assert scaffold(TEMPLATE_ROOT, project, 'expressjs', 'Server').success
+        cores = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+        assert jest_workers(project, ci=True) == cores
+        assert jest_workers(project, ci=False) == max(1, cores - 1)
+
+
+if __name__ == '__main__':
+    test_runners_for_catalog()
+    test_scaffold_wires_runners()
+    test_jest_workers_follow_cores()
+    print('✅ Test runner config tests passed')
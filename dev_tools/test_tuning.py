@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the .env.example performance variables: target size parsing, host
+detection, per-runtime values and their round trip through upgrades.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+sys.path.insert(0, str(TEMPLATE_ROOT / 'dev_tools'))
+
+from mvp_quickstart.tuning import DB_CONNECTION_BUDGET, detect_host, parse_size, performance_env, runtimes
+from quick_start import MVPQuickStart, scaffold, upgrade
+from test_matrix import copy_template
+
+
+def read_env(path: Path) -> dict:
+    return dict(line.split('=', 1) for line in path.read_text(encoding='utf-8').splitlines()
+                if '=' in line and not line.startswith('#'))
+
+
+def test_parse_size():
+    assert (parse_size('2x4g').cpus, parse_size('2x4g').memory_mb) == (2, 4096)
+    assert parse_size('4 x 1536m').memory_mb == 1536
+    assert parse_size('8x0.5GB').memory_mb == 512
+    assert parse_size('large').source == 'large'
+    assert parse_size(parse_size('3x6g').spec) == parse_size('3x6g')
+    for bad in ('0x4g', 'four', '2x', '2x4t'):
+        try:
+            parse_size(bad)
+        except ValueError:
+            continue
+        raise AssertionError(bad)
+    host = detect_host()
+    assert host.cpus >= 1 and host.memory_mb >= 256
+
+
+def test_values_per_runtime():
+    catalog = MVPQuickStart(source_root=TEMPLATE_ROOT, quiet=True).architectures
+    large = parse_size('large')
+    assert runtimes('django-react', catalog['django-react']) == ['python-sync', 'node-build']
+    assert runtimes('vercel-functions', catalog['vercel-functions']) == ['serverless']
+    assert runtimes('flutter', catalog['flutter']) == []
+
+    fastapi = performance_env('fastapi', catalog['fastapi'], large)
+    assert fastapi['WEB_CONCURRENCY'] == '4' and fastapi['DB_POOL_SIZE'] == '10'
+    django = performance_env('django', catalog['django'], large)
+    assert django['WEB_CONCURRENCY'] == '9' and django['CONN_MAX_AGE'] == '600'
+    # Every process's pool and overflow together stay within the database's connections
+    for env in (fastapi, django):
+        workers = int(env['WEB_CONCURRENCY'])
+        assert workers * (int(env['DB_POOL_SIZE']) + int(env['DB_MAX_OVERFLOW'])) <= DB_CONNECTION_BUDGET
+
+    mern = performance_env('mern', catalog['mern'], large)
+    assert mern['NODE_OPTIONS'] == '--max-old-space-size=1536' and mern['UV_THREADPOOL_SIZE'] == '8'
+    assert performance_env('react', catalog['react'], large) == {
+        '# Performance tuning (sized for 4 CPUs / 8192 MB; see --target-size)': '',
+        'NODE_OPTIONS': '--max-old-space-size=4096'}
+    assert '# Performance tuning (sized for 1 CPU / 1024 MB; see --target-size)' in performance_env(
+        'react', catalog['react'], parse_size('1x1g'))
+    # Memory caps worker counts on small machines
+    assert performance_env('django', catalog['django'], parse_size('4x512m'))['WEB_CONCURRENCY'] == '2'
+
+
+def test_target_size_is_recorded_and_kept_on_upgrade():
+    with tempfile.TemporaryDirectory(prefix='mvp-tuning-') as tmp:
+        source, project = Path(tmp) / 'source', Path(tmp) / 'project'
+        source.mkdir()
+        copy_template(source)
+        assert scaffold(source, project, 'fastapi', 'Sized', target_size='2x4g').success
+
+        assert read_env(project / '.env.example')['WEB_CONCURRENCY'] == '2'
+        config = json.loads((project / '.mvp-config.json').read_text(encoding='utf-8'))
+        assert config['deployment_size'] == {'cpus': 2, 'memory_mb': 4096, 'source': 'target'}
+        assert upgrade(source, project) == []
+
+
+if __name__ == '__main__':
+    test_parse_size()
+    test_values_per_runtime()
+    test_target_size_is_recorded_and_kept_on_upgrade()
+    print('✅ Tuning tests passed')
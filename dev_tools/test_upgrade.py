@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for template upgrades: the three-way merge and an end-to-end upgrade of a
+generated project after both the user and the template changed it.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+sys.path.insert(0, str(TEMPLATE_ROOT / 'dev_tools'))
+
+from mvp_quickstart.upgrade import merge3
+from quick_start import BASE_SNAPSHOT, scaffold, upgrade
+from test_matrix import copy_template
+
+
+def test_merge3():
+    base = 'a\nb\nc\nd\ne\n'
+    # Non-overlapping edits from both sides combine
+    assert merge3(base, 'A\nb\nc\nd\ne\n', 'a\nb\nc\nd\nE\n') == ('A\nb\nc\nd\nE\n', 0)
+    # Identical edits are not conflicts
+    assert merge3(base, 'a\nB\nc\nd\ne\n', 'a\nB\nc\nd\ne\n') == ('a\nB\nc\nd\ne\n', 0)
+    # Appends on one side and edits on the other
+    assert merge3(base, base + 'f\n', 'a\nb\nC\nd\ne\n') == ('a\nb\nC\nd\ne\nf\n', 0)
+    # Overlapping edits conflict with markers
+    merged, conflicts = merge3(base, 'a\nX\nc\nd\ne\n', 'a\nY\nc\nd\ne\n')
+    assert conflicts == 1
+    assert merged == 'a\n<<<<<<< local\nX\n=======\nY\n>>>>>>> template\nc\nd\ne\n'
+
+
+def test_upgrade_merges_user_and_template_changes():
+    with tempfile.TemporaryDirectory(prefix='mvp-upgrade-test-') as tmp:
+        source, project = Path(tmp) / 'source', Path(tmp) / 'project'
+        source.mkdir()
+        copy_template(source)
+        result = scaffold(source, project, 'fastapi', 'Upgrade Test')
+        assert result.success
+        assert (project / BASE_SNAPSHOT).exists()
+
+        # Nothing changed: nothing to do
+        assert upgrade(source, project) == []
+
+        # The user edits README.md and .cursorrules; the template changes a local rule
+        readme = project / 'README.md'
+        readme.write_text(readme.read_text(encoding='utf-8') + '\n## Team notes\n', encoding='utf-8')
+        cursorrules = project / '.cursorrules'
+        cursorrules.write_text('# house rules\n' + cursorrules.read_text(encoding='utf-8'), encoding='utf-8')
+        env_mtime = (project / '.env.example').stat().st_mtime_ns
+
+        rule = source / '.cursor' / 'rules' / result.rules[0]
+        rule.write_text(rule.read_text(encoding='utf-8') + '\nUpgraded guidance.\n', encoding='utf-8')
+
+        changes = {c['path']: c['status'] for c in upgrade(source, project)}
+        assert changes == {'.cursorrules': 'merged'}
+
+        merged = cursorrules.read_text(encoding='utf-8')
+        assert merged.startswith('# house rules\n') and 'Upgraded guidance.\n' in merged
+        assert readme.read_text(encoding='utf-8').endswith('## Team notes\n')
+        assert (project / '.env.example').stat().st_mtime_ns == env_mtime
+
+        # The new output is the next merge base
+        assert upgrade(source, project) == []
+        config = json.loads((project / '.mvp-config.json').read_text(encoding='utf-8'))
+        assert config['primary_architecture'] == 'fastapi'
+
+
+
+def test_upgrade_keeps_custom_rules():
+    with tempfile.TemporaryDirectory(prefix='mvp-upgrade-test-') as tmp:
+        source, project = Path(tmp) / 'source', Path(tmp) / 'project'
+        source.mkdir()
+        copy_template(source)
+        selected = ['ci-debugging.mdc', 'code-splitting.mdc']
+        assert scaffold(source, project, 'custom', 'Custom Rules', selected_rules=selected).success
+        assert upgrade(source, project) == []
+
+        rule = source / '.cursor' / 'rules' / 'code-splitting.mdc'
+        rule.write_text(rule.read_text(encoding='utf-8') + '\nUpgraded guidance.\n', encoding='utf-8')
+        assert upgrade(source, project) == [{'path': '.cursorrules', 'status': 'updated', 'conflicts': 0}]
+
+        cursorrules = (project / '.cursorrules').read_text(encoding='utf-8')
+        assert all(f'# === {name} ===' in cursorrules for name in selected)
+        assert 'Upgraded guidance.\n' in cursorrules
+        config = json.loads((project / '.mvp-config.json').read_text(encoding='utf-8'))
+        assert config['selected_rules'] == selected and set(selected) <= set(config['active_rules'])
+
+
+if __name__ == '__main__':
+    test_merge3()
+    test_upgrade_merges_user_and_template_changes()
+    test_upgrade_keeps_custom_rules()
+    print('✅ Upgrade tests passed')
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for the rule and catalog validator: a passing and a failing input for
+every diagnostic code, the .validate-cache.json hits and invalidation, and rule
+files being checked concurrently on the thread pool.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TEMPLATE_ROOT))
+
+from mvp_quickstart import validate
+from mvp_quickstart.validate import CACHE_FILENAME, check_catalog, check_rule, validate_template
+
+GOOD_RULE = b'---\ndescription: Good rule\nglobs: **/*.py\nalwaysApply: false\n---\n\nBody\n'
+
+# One failing rule per code, with the line each diagnostic points at
+BAD_RULES = {
+    'MDC001': (b'# Heading without frontmatter\n', 1),
+    'MDC002': (b'---\ndescription: Unclosed\nglobs: *.py\n', 1),
+    'MDC003': (b'---\ndescription: ""\nglobs: *.py\n---\n', 2),
+    'MDC004': (b'---\ndescription: No scope\nglobs:\nalwaysApply: false\n---\n', 3),
+    'MDC005': (b'---\ndescription: Quoted\nglobs: ["*.py"]\n---\n', 3),
+    'MDC006': (b'---\ndescription: Bad flag\nglobs: *.py\nalwaysApply: yes\n---\n', 4),
+    'MDC007': (GOOD_RULE.rstrip(b'\n'), 7),
+    'MDC008': (b'\n', 1),
+}
+
+MAPPINGS = {'python': 'python/.cursorrules', 'gone': 'gone/.cursorrules'}
+
+
+def catalog(**architectures) -> str:
+    return json.dumps({'categories': {'backend': {'architectures': architectures}}}, indent=2)
+
+
+GOOD_ENTRY = {'name': 'Good', 'local_rules': ['good.mdc'], 'awesome_rules': ['python'], 'prompts': ['setup.md']}
+
+# One failing catalog per code
+BAD_CATALOGS = {
+    'CAT001': '{"categories": {',
+    'CAT002': catalog(api=dict(GOOD_ENTRY, name='')),
+    'CAT003': catalog(api=dict(GOOD_ENTRY, local_rules=['missing.mdc'])),
+    'CAT004': catalog(api=dict(GOOD_ENTRY, awesome_rules=['unmapped'])),
+    'CAT005': catalog(api=dict(GOOD_ENTRY, prompts=['missing.md'])),
+    'CAT006': json.dumps({'categories': {'backend': {'architectures': {'api': GOOD_ENTRY}}},
+                          'presets': {'api': GOOD_ENTRY}}, indent=2),
+    'CAT007': catalog(api=dict(GOOD_ENTRY, awesome_rules=['gone'])),
+}
+
+
+def make_template(root: Path, rules: dict, arch_text: str):
+    rules_dir = root / '.cursor' / 'rules'
+    rules_dir.mkdir(parents=True)
+    for name, data in rules.items():
+        (rules_dir / name).write_bytes(data)
+    (root / 'dev_tools' / 'prompts').mkdir(parents=True)
+    (root / 'dev_tools' / 'prompts' / 'setup.md').write_text('# Setup\n', encoding='utf-8')
+    (root / '.cursor' / 'awesome-rules' / 'python').mkdir(parents=True)
+    (root / '.cursor' / 'awesome-rules' / 'python' / '.cursorrules').write_text('Python\n', encoding='utf-8')
+    (root / 'architectures.json').write_text(arch_text, encoding='utf-8')
+
+
+class CallCounter:
+    """Wraps a validate module function so tests can count how often it really ran"""
+
+    def __init__(self, name: str):
+        self.name, self.original, self.calls = name, getattr(validate, name), []
+
+    def __enter__(self):
+        def counted(*args):
+            self.calls.append(args[0])
+            return self.original(*args)
+        setattr(validate, self.name, counted)
+        return self
+
+    def __exit__(self, *exc):
+        setattr(validate, self.name, self.original)
+
+
+def test_rule_codes():
+    assert check_rule('good.mdc', GOOD_RULE) == []
+    # alwaysApply: true needs no globs
+    assert check_rule('always.mdc', b'---\ndescription: Always\nalwaysApply: true\n---\n') == []
+    for code, (data, line) in BAD_RULES.items():
+        diagnostics = check_rule('bad.mdc', data)
+        assert [(d['code'], d['line']) for d in diagnostics] == [(code, line)], (code, diagnostics)
+        assert diagnostics[0]['severity'] == ('warning' if code == 'MDC007' else 'error')
+
+
+def test_catalog_codes():
+    with tempfile.TemporaryDirectory(prefix='mvp-validate-') as tmp:
+        root = Path(tmp)
+        make_template(root, {'good.mdc': GOOD_RULE}, catalog(api=GOOD_ENTRY))
+        assert check_catalog(root, catalog(api=GOOD_ENTRY), MAPPINGS) == []
+        for code, arch_text in BAD_CATALOGS.items():
+            diagnostics = check_catalog(root, arch_text, MAPPINGS)
+            assert [d['code'] for d in diagnostics] == [code], (code, diagnostics)
+            assert diagnostics[0]['severity'] == ('warning' if code in ('CAT006', 'CAT007') else 'error')
+        # The duplicate points at its own entry, not the first one
+        assert check_catalog(root, BAD_CATALOGS['CAT006'], MAPPINGS)[0]['line'] > 5
+
+
+def test_cache_hits_and_invalidation():
+    with tempfile.TemporaryDirectory(prefix='mvp-validate-') as tmp:
+        root = Path(tmp)
+        make_template(root, {'good.mdc': GOOD_RULE, 'bad.mdc': BAD_RULES['MDC004'][0]}, catalog(api=GOOD_ENTRY))
+        cache_path = root / '.cursor' / CACHE_FILENAME
+        first = validate_template(root, MAPPINGS)
+        assert [d['code'] for d in first] == ['MDC004'] and cache_path.is_file()
+
+        # Unchanged tree: nothing is checked again
+        with CallCounter('check_rule') as rules, CallCounter('check_catalog') as catalogs:
+            assert validate_template(root, MAPPINGS) == first
+        assert rules.calls == [] and catalogs.calls == []
+
+        # A touched but unchanged rule matches by hash and only refreshes its stat
+        good = root / '.cursor' / 'rules' / 'good.mdc'
+        os.utime(good, ns=(good.stat().st_atime_ns, good.stat().st_mtime_ns + 10 ** 9))
+        with CallCounter('check_rule') as rules:
+            assert validate_template(root, MAPPINGS) == first
+        assert rules.calls == []
+        cached = json.loads(cache_path.read_text(encoding='utf-8'))['rules']['.cursor/rules/good.mdc']
+        assert cached['stat'][0] == good.stat().st_mtime_ns
+
+        # An edited rule is checked again; the others stay cached
+        (root / '.cursor' / 'rules' / 'bad.mdc').write_bytes(GOOD_RULE)
+        with CallCounter('check_rule') as rules, CallCounter('check_catalog') as catalogs:
+            assert validate_template(root, MAPPINGS) == []
+        assert len(rules.calls) == 1 and catalogs.calls == []
+
+        # Adding a rule the catalog refers to invalidates the catalog result
+        (root / 'architectures.json').write_text(
+            catalog(api=dict(GOOD_ENTRY, local_rules=['good.mdc', 'new.mdc'])), encoding='utf-8')
+        assert [d['code'] for d in validate_template(root, MAPPINGS)] == ['CAT003']
+        (root / '.cursor' / 'rules' / 'new.mdc').write_bytes(GOOD_RULE)
+        with CallCounter('check_catalog') as catalogs:
+            assert validate_template(root, MAPPINGS) == []
+        assert len(catalogs.calls) == 1
+
+        # A cache from another version is ignored, and use_cache=False never writes one
+        cache_path.write_text(json.dumps({'version': 0, 'rules': {}, 'catalog': {}}), encoding='utf-8')
+        with CallCounter('check_rule') as rules:
+            assert validate_template(root, MAPPINGS) == []
+        assert len(rules.calls) == 3
+        cache_path.unlink()
+        assert validate_template(root, MAPPINGS, use_cache=False) == [] and not cache_path.exists()
+
+
+def test_rules_checked_on_thread_pool():
+    rules = {f'rule-{index:02d}.mdc': GOOD_RULE if index % 3 else BAD_RULES['MDC005'][0] for index in range(24)}
+    with tempfile.TemporaryDirectory(prefix='mvp-validate-') as tmp:
+        root = Path(tmp)
+        make_template(root, rules, catalog(api=dict(GOOD_ENTRY, local_rules=['rule-01.mdc'])))
+        serial = validate_template(root, MAPPINGS, jobs=1, use_cache=False)
+        assert [d['path'] for d in serial] == [f'.cursor/rules/{name}' for name in sorted(rules)
+                                               if rules[name] != GOOD_RULE]
+
+        # Two rule checks can only meet at the barrier when they run at the same time
+        barrier = threading.Barrier(2, timeout=30)
+        original = validate.check_rule
+
+        def rendezvous(rel_path, data):
+            if rel_path.endswith(('rule-01.mdc', 'rule-02.mdc')):
+                barrier.wait()
+            return original(rel_path, data)
+
+        validate.check_rule = rendezvous
+        try:
+            assert validate_template(root, MAPPINGS, jobs=4, use_cache=False) == serial
+        finally:
+            validate.check_rule = original
+        assert not barrier.broken
+
+
+if __name__ == '__main__':
+    test_rule_codes()
+    test_catalog_codes()
+    test_cache_hits_and_invalidation()
+    test_rules_checked_on_thread_pool()
+    print('✅ Validate tests passed')
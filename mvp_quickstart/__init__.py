@@ -0,0 +1,3 @@
+"""
+Support modules for the MVP Quick-Start scaffolder (quick_start.py).
+"""
@@ -0,0 +1,123 @@
+"""
+Single-file zipapp distribution of the scaffolder.
+
+build_zipapp() packs quick_start.py, this package and the template inputs
+(catalog, rules, prompts, document templates) into one executable .pyz, so
+build hosts need neither a template checkout nor a sync step:
+
+    python3 quick_start.py --build-pyz dist/mvp-quickstart.pyz
+    python3 mvp-quickstart.pyz --architecture fastapi --name api --skip-taskmaster
+
+Inside the archive the template lives in the mvp_quickstart_assets package
+and is read through importlib.resources: nothing is extracted, and each asset
+is decompressed only when a scaffold reads it. Modules ship with unchecked
+hash-based .pyc files next to their sources, so the interpreter that built the
+archive imports without compiling; other versions fall back to the sources.
+"""
+
+import hashlib
+import json
+import os
+import py_compile
+import tempfile
+import zipfile
+from importlib import resources
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+ASSET_PACKAGE = 'mvp_quickstart_assets'
+BUNDLE_INFO = 'bundle.json'
+
+# Template inputs relative to the checkout; missing ones (awesome rules are
+# downloaded on first setup) are simply not bundled
+ASSET_PATHS = ('architectures.json', '.cursor/rules', '.cursor/awesome-rules', 'dev_tools/prompts',
+               'dev_tools/templates')
+CODE_PATHS = ('quick_start.py', 'mvp_quickstart')
+
+INTERPRETER = '/usr/bin/env python3'
+MAIN = 'import sys\n\nimport quick_start\n\nsys.exit(quick_start.main())\n'
+
+# Entries carry a fixed date: checkout mtimes say nothing about the template
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+
+def bundled_root():
+    """The template bundled with a running zipapp (an importlib.resources Traversable), else None"""
+    try:
+        return resources.files(ASSET_PACKAGE)
+    except ModuleNotFoundError:
+        return None
+
+
+def bundle_id(root) -> str:
+    """Content hash of the bundled template, recorded at build time"""
+    return json.loads(root.joinpath(BUNDLE_INFO).read_text(encoding='utf-8'))['template']
+
+
+def _walk(source_root: Path, rel_path: str) -> Iterator[Tuple[str, Path]]:
+    top = source_root / rel_path
+    if top.is_file():
+        yield rel_path, top
+        return
+    for dirpath, dirnames, filenames in os.walk(top):
+        dirnames[:] = sorted(name for name in dirnames if name != '__pycache__')
+        for filename in sorted(filenames):
+            if not filename.endswith('.pyc'):
+                path = Path(dirpath) / filename
+                yield path.relative_to(source_root).as_posix(), path
+
+
+def _compiled(path: Path, rel_path: str) -> Optional[bytes]:
+    with tempfile.TemporaryDirectory(prefix='mvp-pyz-') as tmp:
+        cfile = os.path.join(tmp, 'module.pyc')
+        try:
+            py_compile.compile(str(path), cfile=cfile, dfile=rel_path, doraise=True,
+                               invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+        except py_compile.PyCompileError:
+            return None
+        with open(cfile, 'rb') as f:
+            return f.read()
+
+
+def _add(archive: zipfile.ZipFile, arcname: str, data: bytes, mode: int = 0o644):
+    info = zipfile.ZipInfo(arcname, ZIP_DATE)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = (0o100000 | mode) << 16
+    archive.writestr(info, data)
+
+
+def build_zipapp(source_root: Union[str, Path], output: Union[str, Path],
+                 interpreter: str = INTERPRETER) -> Dict:
+    """Write the executable archive; return {'path', 'files', 'bytes', 'template'}"""
+    source_root, output = Path(source_root), Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    assets = [(rel_path, path) for name in ASSET_PATHS if (source_root / name).exists()
+              for rel_path, path in _walk(source_root, name)]
+    template = hashlib.sha256()
+    for rel_path, path in assets:
+        data = path.read_bytes()
+        template.update(b'%s\0%d\0' % (rel_path.encode('utf-8'), len(data)) + data)
+    template_id = template.hexdigest()
+
+    fd, tmp_name = tempfile.mkstemp(dir=output.parent, prefix=f'.{output.name}.')
+    count = 0
+    with os.fdopen(fd, 'wb') as f:
+        f.write(f'#!{interpreter}\n'.encode('utf-8'))
+        with zipfile.ZipFile(f, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            _add(archive, '__main__.py', MAIN.encode('utf-8'))
+            for name in CODE_PATHS:
+                for rel_path, path in _walk(source_root, name):
+                    _add(archive, rel_path, path.read_bytes())
+                    count += 1
+                    compiled = _compiled(path, rel_path) if rel_path.endswith('.py') else None
+                    if compiled:
+                        _add(archive, rel_path + 'c', compiled)
+            _add(archive, f'{ASSET_PACKAGE}/__init__.py', b'')
+            _add(archive, f'{ASSET_PACKAGE}/{BUNDLE_INFO}', json.dumps({'template': template_id}).encode('utf-8'))
+            for rel_path, path in assets:
+                _add(archive, f'{ASSET_PACKAGE}/{rel_path}', path.read_bytes())
+                count += 1
+    os.chmod(tmp_name, 0o755)
+    os.replace(tmp_name, output)
+    return {'path': output, 'files': count, 'bytes': output.stat().st_size, 'template': template_id}
@@ -0,0 +1,274 @@
+"""
+GitHub Actions workflow generated from the catalog's scripts and dependencies.
+
+Every job restores its package manager's cache keyed on the lockfile (or
+requirements.txt) hash, so installs are downloads from the runner cache
+rather than the registry. Lint, test and build run as parallel jobs; Jest,
+Playwright and Cypress suites are additionally split across shards, and
+pytest spreads over the runner's cores (mvp_quickstart.testing writes the
+runner configs). ESLint and the test runners keep their caches between
+runs, as Next.js keeps its incremental build cache and Rust its target
+directory. Lint runs the cached commands from mvp_quickstart.linting.
+
+Which setup steps a job needs follows mvp_quickstart.tuning.runtimes; stacks
+like django-react set up both Python and Node.
+"""
+
+from typing import List, Mapping, Optional
+
+from mvp_quickstart.linting import ESLINT_CACHE, ESLINT_CACHE_DIRECTORY, lint_scripts
+from mvp_quickstart.testing import CYPRESS_TIMINGS_PATH, JEST_CACHE_DIRECTORY, runners
+from mvp_quickstart.tuning import runtimes, uses_python
+
+WORKFLOW_PATH = '.github/workflows/ci.yml'
+NODE_VERSION = '22'
+PYTHON_VERSION = '3.12'
+GO_VERSION = '1.23'
+JAVA_VERSION = '21'
+
+# Jest, Playwright and Cypress shards per run; each shard is its own runner
+TEST_SHARDS = 2
+SHARD_MATRIX = f"shard: [{', '.join(str(shard) for shard in range(1, TEST_SHARDS + 1))}]"
+
+# Tools commonly named in scripts but not listed as requirements
+PYTHON_TOOLS = {'flake8', 'black', 'mypy', 'ruff', 'pytest'}
+
+HEADER = '''name: CI
+
+on:
+  push:
+    branches: [main]
+  pull_request:
+
+# A new push supersedes the running workflow for the same branch
+concurrency:
+  group: ci-${{ github.workflow }}-${{ github.ref }}
+  cancel-in-progress: true
+
+jobs:
+'''
+
+
+def _setup_node() -> List[str]:
+    return [
+        '- uses: actions/setup-node@v4',
+        '  with:',
+        f"    node-version: '{NODE_VERSION}'",
+        '- name: Cache npm downloads',
+        '  uses: actions/cache@v4',
+        '  with:',
+        '    path: ~/.npm',
+        "    key: npm-${{ runner.os }}-${{ hashFiles('package-lock.json', 'package.json') }}",
+        '    restore-keys: npm-${{ runner.os }}-',
+        '- name: Install Node dependencies',
+        '  run: |',
+        '    if [ -f package-lock.json ]; then npm ci --prefer-offline --no-audit --no-fund',
+        '    else npm install --prefer-offline --no-audit --no-fund; fi',
+    ]
+
+
+def _setup_python(extra: List[str]) -> List[str]:
+    install = 'pip install -r requirements.txt' + ''.join(f' {package}' for package in extra)
+    return [
+        '- uses: actions/setup-python@v5',
+        '  with:',
+        f"    python-version: '{PYTHON_VERSION}'",
+        '    cache: pip',
+        '    cache-dependency-path: requirements.txt',
+        '- name: Install Python dependencies',
+        f'  run: {install}',
+    ]
+
+
+def _setup_go() -> List[str]:
+    return [
+        '- uses: actions/setup-go@v5',
+        '  with:',
+        f"    go-version: '{GO_VERSION}'",
+        '    cache: true',
+    ]
+
+
+def _setup_rust() -> List[str]:
+    return [
+        '- name: Cache cargo registry and build output',
+        '  uses: actions/cache@v4',
+        '  with:',
+        '    path: |',
+        '      ~/.cargo/registry',
+        '      ~/.cargo/git',
+        '      target',
+        "    key: cargo-${{ runner.os }}-${{ hashFiles('**/Cargo.lock', 'Cargo.toml') }}",
+        '    restore-keys: cargo-${{ runner.os }}-',
+    ]
+
+
+def _setup_java() -> List[str]:
+    return [
+        '- uses: actions/setup-java@v4',
+        '  with:',
+        '    distribution: temurin',
+        f"    java-version: '{JAVA_VERSION}'",
+        '    cache: maven',
+    ]
+
+
+def _next_cache() -> List[str]:
+    return [
+        '- name: Cache Next.js build',
+        '  uses: actions/cache@v4',
+        '  with:',
+        '    path: .next/cache',
+        "    key: nextjs-${{ runner.os }}-${{ hashFiles('package-lock.json', 'package.json') }}-"
+        "${{ hashFiles('**/*.js', '**/*.jsx', '**/*.ts', '**/*.tsx') }}",
+        "    restore-keys: nextjs-${{ runner.os }}-${{ hashFiles('package-lock.json', 'package.json') }}-",
+    ]
+
+
+def _result_cache(name: str, path: str, shard: bool = False) -> List[str]:
+    """Restore a test runner's cache from the latest run; saved again under this commit"""
+    prefix = f'{name}-${{{{ runner.os }}}}-' + ('${{ matrix.shard }}-' if shard else '')
+    return [
+        f'- name: Cache {name} results',
+        '  uses: actions/cache@v4',
+        '  with:',
+        f'    path: {path}',
+        f'    key: {prefix}${{{{ github.sha }}}}',
+        f'    restore-keys: {prefix}',
+    ]
+
+
+def _upload(name: str, path: str) -> List[str]:
+    return [
+        '- uses: actions/upload-artifact@v4',
+        '  if: ${{ !cancelled() }}',
+        '  with:',
+        f'    name: {name}',
+        f'    path: {path}',
+        '    retention-days: 7',
+    ]
+
+
+def _download(pattern: str, path: str, merge: bool) -> List[str]:
+    return [
+        '- uses: actions/download-artifact@v4',
+        '  with:',
+        f'    pattern: {pattern}',
+        f'    path: {path}',
+    ] + (['    merge-multiple: true'] if merge else [])
+
+
+def _python_tools(config: Mapping, command: str) -> List[str]:
+    """Tools the command runs that requirements.txt does not install"""
+    requirements = {requirement.split('[')[0].lower() for requirement in config.get('requirements', ())}
+    return sorted(tool for tool in PYTHON_TOOLS & set(command.split()) if tool not in requirements)
+
+
+def _job(name: str, steps: List[str], matrix: Optional[str] = None, timeout: int = 15,
+         needs: Optional[str] = None) -> List[str]:
+    lines = [f'  {name}:', '    runs-on: ubuntu-latest', f'    timeout-minutes: {timeout}']
+    if needs:
+        # Collects the shards' output, including from shards that failed
+        lines += [f'    needs: {needs}', '    if: ${{ !cancelled() }}']
+    if matrix:
+        lines += ['    strategy:', '      fail-fast: false', '      matrix:', f'        {matrix}']
+    lines += ['    steps:', '      - uses: actions/checkout@v4']
+    return lines + ['      ' + step for step in steps] + ['']
+
+
+def ci_workflow(architecture_key: str, config: Mapping) -> Optional[str]:
+    """The CI workflow for an architecture, or None if it has nothing to run"""
+    found = runtimes(architecture_key, config)
+    # Cached lint commands (ruff for flake8) replace the catalog's
+    scripts = {**config.get('scripts', {}), **lint_scripts(architecture_key, config)}
+    # E2E runners come as dev dependencies alone, and still get a package.json
+    node = bool(config.get('packages') or config.get('dev_dependencies'))
+    python = uses_python(architecture_key, config)
+    if not (node or python or {'go', 'rust', 'jvm'} & set(found)):
+        return None
+
+    found_runners = runners(config)
+
+    def setup(job: str) -> List[str]:
+        steps: List[str] = []
+        # npm build scripts and e2e suites only need Node, even in Python stacks
+        if python and not (job in ('build', 'test:e2e') and node):
+            steps += _setup_python(_python_tools(config, scripts.get(job, '')))
+        if node:
+            steps += _setup_node()
+        if 'go' in found:
+            steps += _setup_go()
+        if 'rust' in found:
+            steps += _setup_rust()
+        if 'jvm' in found:
+            steps += _setup_java()
+        return steps
+
+    def run(script: str, extra: str = '') -> str:
+        # package.json exists only when the architecture has npm packages or dev dependencies
+        if node:
+            command = 'npm test' if script == 'test' else f'npm run {script}'
+            return f'{command} -- {extra}' if extra else command
+        return f'{scripts[script]} {extra}'.strip()
+
+    jobs: List[str] = []
+    if scripts.get('lint'):
+        # Content-keyed, so the cache holds across checkouts; ruff is fast enough without one
+        caches = _result_cache('eslint', ESLINT_CACHE_DIRECTORY) if ESLINT_CACHE in scripts['lint'] else []
+        jobs += _job('lint', setup('lint') + caches + [f'- run: {run("lint")}'], timeout=10)
+    if scripts.get('test'):
+        test = scripts['test']
+        caches = []
+        if 'jest' in found_runners:
+            caches += _result_cache('jest', JEST_CACHE_DIRECTORY, shard=test == 'jest')
+        if 'pytest' in found_runners:
+            # Last run's failures for --ff; pytest.ini already runs xdist on every core
+            caches += _result_cache('pytest', '.pytest_cache')
+        if node and test == 'jest':
+            jobs += _job('test', setup('test') + caches + [
+                '- run: ' + run('test', '--ci --shard=${{ matrix.shard }}/${{ strategy.job-total }}')],
+                matrix=SHARD_MATRIX)
+        elif node and test == 'ng test':
+            jobs += _job('test', setup('test') + [f'- run: {run("test", "--watch=false --browsers=ChromeHeadless")}'])
+        elif not node and test.split()[-1] == 'pytest':
+            # A new project has no tests yet, and pytest exits 5 when it collects none
+            jobs += _job('test', setup('test') + caches + [f'- run: {run("test")} || [ $? -eq 5 ]'])
+        else:
+            jobs += _job('test', setup('test') + caches + [f'- run: {run("test")}'])
+    if scripts.get('test:e2e') and 'playwright' in found_runners:
+        jobs += _job('e2e', setup('test:e2e') + [
+            '- name: Install Playwright browsers',
+            '  run: npx playwright install --with-deps chromium',
+            '- run: ' + run('test:e2e', '--shard=${{ matrix.shard }}/${{ strategy.job-total }}'),
+        ] + _upload('blob-report-${{ matrix.shard }}', 'blob-report'), matrix=SHARD_MATRIX, timeout=30)
+        jobs += _job('e2e-report', setup('test:e2e') + _download('blob-report-*', 'all-blob-reports', True) + [
+            '- run: npx playwright merge-reports --reporter html ./all-blob-reports',
+        ] + _upload('playwright-report', 'playwright-report'), needs='e2e', timeout=10)
+    elif scripts.get('test:e2e') and 'cypress' in found_runners:
+        # The binary is downloaded by cypress' install script unless restored before it
+        jobs += _job('e2e', [
+            '- name: Cache Cypress binary',
+            '  uses: actions/cache@v4',
+            '  with:',
+            '    path: ~/.cache/Cypress',
+            "    key: cypress-${{ runner.os }}-${{ hashFiles('package-lock.json', 'package.json') }}",
+        ] + setup('test:e2e') + [
+            f'- run: {run("test:e2e")}',
+            '  env:',
+            '    SPLIT: ${{ strategy.job-total }}',
+            '    SPLIT_INDEX: ${{ strategy.job-index }}',
+            f'    SPLIT_FILE: {CYPRESS_TIMINGS_PATH}',
+        ] + _upload('cypress-timings-${{ matrix.shard }}', CYPRESS_TIMINGS_PATH), matrix=SHARD_MATRIX, timeout=30)
+        # Every shard records the durations of its own specs; the merged file
+        # is the artifact to commit as the next runs' balance
+        jobs += _job('e2e-timings', setup('test:e2e') + _download('cypress-timings-*', 'partial-timings', False) + [
+            '- run: npx cypress-split-merge --parent-folder partial-timings --split-file timings.json'
+            f' --output {CYPRESS_TIMINGS_PATH}',
+        ] + _upload('cypress-timings', CYPRESS_TIMINGS_PATH), needs='e2e', timeout=10)
+    build = next((name for name in ('build', 'compile') if scripts.get(name)), None)
+    if build:
+        build_setup = setup('build') + (_next_cache() if 'next' in config.get('packages', ()) else [])
+        jobs += _job('build', build_setup + [f'- run: {run(build)}'], timeout=20)
+    if not jobs:
+        return None
+    return HEADER + '\n'.join(jobs).rstrip('\n') + '\n'
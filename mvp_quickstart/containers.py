@@ -0,0 +1,244 @@
+"""
+Multi-stage container builds generated from the catalog.
+
+Each Dockerfile copies the dependency manifests (package.json and lockfile,
+requirements.txt, go.mod, pom.xml) and installs them before any source is
+copied, so a code change only rebuilds the last layers. Package managers
+download through BuildKit cache mounts that survive between builds, and the
+runtime stage carries only what the app needs to run: slim or distroless
+bases, no compilers, no dev dependencies, a non-root user.
+
+The build shape follows the runtimes read from the architecture
+(mvp_quickstart.tuning.runtimes). Serverless, mobile and tooling-only
+architectures have nothing to containerize and get no Dockerfile.
+"""
+
+import shlex
+from typing import List, Mapping, Optional
+
+from mvp_quickstart.profiles import backend_kind, python_module_name
+from mvp_quickstart.tuning import runtimes
+
+PYTHON_VERSION = '3.12'
+NODE_VERSION = '22'
+GO_VERSION = '1.23'
+JAVA_VERSION = '21'
+
+FRONTEND_PACKAGES = {'react', 'vue', 'svelte', '@angular/core'}
+
+NODE_DEPS_STAGE = '''FROM node:${NODE_VERSION}-slim AS deps
+WORKDIR /app
+# Manifests first: this layer is rebuilt only when dependencies change
+COPY package.json package-lock.json* ./
+RUN --mount=type=cache,target=/root/.npm \\
+    if [ -f package-lock.json ]; then npm ci; else npm install; fi
+'''
+
+DOCKERIGNORE_COMMON = [
+    '# Version control and editor state',
+    '.git', '.gitignore', '.github', '.cursor', '.cursorrules', '.vscode', '.idea',
+    '', '# Scaffolding leftovers',
+    'archive', '.taskmaster', 'active_prompts', '.mvp-config.json', '.mvp-base.json', '.mvp-manifest',
+    '', '# Secrets stay out of the image; pass them at run time',
+    '.env', '.env.*', '!.env.example',
+    '', '# Build definitions and logs',
+    'Dockerfile*', '.dockerignore', '*.log',
+]
+
+DOCKERIGNORE_RUNTIME = {
+    'python': ['__pycache__', '*.py[cod]', '.venv', 'venv', '.pytest_cache', '.mypy_cache', '.ruff_cache',
+               'htmlcov', '.coverage'],
+    'node': ['node_modules', 'dist', 'build', '.next', '.nuxt', '.output', 'coverage', '.npm'],
+    'go': ['bin', 'vendor'],
+    'rust': ['target'],
+    'jvm': ['target', 'build', '.gradle'],
+}
+
+
+def _header(args: List[str]) -> str:
+    return '# syntax=docker/dockerfile:1\n' + ''.join(f'ARG {arg}\n' for arg in args) + '\n'
+
+
+def _node_command(config: Mapping) -> List[str]:
+    """Production start command: run the binary directly so signals reach it"""
+    scripts = config.get('scripts', {})
+    packages = set(config.get('packages', ()))
+    if scripts.get('start'):
+        return shlex.split(scripts['start'])
+    if 'nuxt' in packages:
+        return ['node', '.output/server/index.mjs']
+    if 'next' in packages:
+        return ['next', 'start']
+    if scripts.get('server'):
+        return ['node' if part == 'nodemon' else part for part in shlex.split(scripts['server'])]
+    return ['npm', 'start']
+
+
+def _json_list(parts: List[str]) -> str:
+    return '[' + ', '.join(f'"{part}"' for part in parts) + ']'
+
+
+def node_server_dockerfile(config: Mapping) -> str:
+    build = 'npm run build && ' if config.get('scripts', {}).get('build') else ''
+    return _header([f'NODE_VERSION={NODE_VERSION}']) + NODE_DEPS_STAGE + f'''
+FROM deps AS build
+COPY . .
+# Dev dependencies are only needed to build
+RUN {build}npm prune --omit=dev
+
+FROM node:${{NODE_VERSION}}-slim AS runtime
+ENV NODE_ENV=production PATH=/app/node_modules/.bin:$PATH
+WORKDIR /app
+COPY --from=build --chown=node:node /app ./
+USER node
+EXPOSE 3000
+CMD {_json_list(_node_command(config))}
+'''
+
+
+def static_site_dockerfile(config: Mapping, project_name: str) -> str:
+    packages = set(config.get('packages', ()))
+    output = f"dist/{project_name.lower().replace(' ', '-')}/browser" if '@angular/core' in packages else 'dist'
+    return _header([f'NODE_VERSION={NODE_VERSION}']) + NODE_DEPS_STAGE + f'''
+FROM deps AS build
+COPY . .
+RUN npm run build
+
+# Only the built assets ship: no Node runtime, no node_modules
+FROM nginxinc/nginx-unprivileged:alpine AS runtime
+COPY --from=build /app/{output} /usr/share/nginx/html
+EXPOSE 8080
+'''
+
+
+def python_dockerfile(architecture_key: str, config: Mapping, project_name: str, profile: str,
+                      frontend: bool) -> str:
+    kind = backend_kind(architecture_key) or ('fastapi' if 'fastapi' in config.get('requirements', ())
+                                              else 'django')
+    requirements = [requirement.split('[')[0] for requirement in config.get('requirements', ())]
+    app = {'fastapi': 'main:app', 'flask': 'app:app',
+           'django': f'{python_module_name(project_name)}.wsgi:application'}[kind]
+    if profile == 'performance':
+        command = ['gunicorn', '-c', 'gunicorn.conf.py', app]
+        server = []
+    elif kind == 'fastapi':
+        command = ['uvicorn', app, '--host', '0.0.0.0', '--port', '8000']
+        server = [] if 'uvicorn' in requirements else ['uvicorn']
+    else:
+        command = ['gunicorn', '--bind', '0.0.0.0:8000', app]
+        server = [] if 'gunicorn' in requirements else ['gunicorn']
+
+    lines = [_header([f'PYTHON_VERSION={PYTHON_VERSION}'] + ([f'NODE_VERSION={NODE_VERSION}'] if frontend else []))]
+    if frontend:
+        lines.append(NODE_DEPS_STAGE.replace('AS deps', 'AS frontend') + '''COPY . .
+RUN npm run build
+
+''')
+    lines.append(f'''FROM python:${{PYTHON_VERSION}}-slim AS builder
+ENV PIP_DISABLE_PIP_VERSION_CHECK=1 PYTHONDONTWRITEBYTECODE=1
+RUN python -m venv /opt/venv
+ENV PATH=/opt/venv/bin:$PATH
+WORKDIR /app
+# requirements.txt first: this layer is rebuilt only when dependencies change
+COPY requirements.txt .
+RUN --mount=type=cache,target=/root/.cache/pip pip install -r requirements.txt{''.join(' ' + s for s in server)}
+
+FROM python:${{PYTHON_VERSION}}-slim AS runtime
+ENV PYTHONDONTWRITEBYTECODE=1 PYTHONUNBUFFERED=1 PATH=/opt/venv/bin:$PATH
+RUN useradd --create-home --uid 10001 app
+WORKDIR /app
+COPY --from=builder /opt/venv /opt/venv
+COPY --chown=app:app . .
+''')
+    if frontend:
+        lines.append('COPY --from=frontend --chown=app:app /app/dist ./frontend_dist\n')
+    lines.append(f'''USER app
+EXPOSE 8000
+CMD {_json_list(command)}
+''')
+    return ''.join(lines)
+
+
+def go_dockerfile() -> str:
+    return _header([f'GO_VERSION={GO_VERSION}']) + '''FROM golang:${GO_VERSION} AS build
+WORKDIR /src
+# Module files first: dependencies download again only when they change
+COPY go.mod go.sum* ./
+RUN --mount=type=cache,target=/go/pkg/mod go mod download
+COPY . .
+RUN --mount=type=cache,target=/go/pkg/mod --mount=type=cache,target=/root/.cache/go-build \\
+    CGO_ENABLED=0 go build -trimpath -ldflags="-s -w" -o /out/app .
+
+FROM gcr.io/distroless/static-debian12:nonroot AS runtime
+COPY --from=build /out/app /app
+EXPOSE 8080
+ENTRYPOINT ["/app"]
+'''
+
+
+def rust_dockerfile(project_name: str) -> str:
+    binary = project_name.lower().replace(' ', '-')
+    return _header([f'BIN_NAME={binary}']) + '''FROM rust:1-slim AS build
+ARG BIN_NAME
+WORKDIR /src
+COPY . .
+# Registry and target directory live in cache mounts, so only changed crates recompile
+RUN --mount=type=cache,target=/usr/local/cargo/registry --mount=type=cache,target=/src/target \\
+    cargo build --release && cp target/release/${BIN_NAME} /app
+
+FROM gcr.io/distroless/cc-debian12:nonroot AS runtime
+COPY --from=build /app /app
+EXPOSE 8080
+ENTRYPOINT ["/app"]
+'''
+
+
+def jvm_dockerfile() -> str:
+    return _header([f'JAVA_VERSION={JAVA_VERSION}']) + '''FROM eclipse-temurin:${JAVA_VERSION}-jdk AS build
+WORKDIR /src
+# Build definition first: dependencies resolve again only when pom.xml changes
+COPY mvnw pom.xml ./
+COPY .mvn .mvn
+RUN --mount=type=cache,target=/root/.m2 ./mvnw -q dependency:go-offline
+COPY src src
+RUN --mount=type=cache,target=/root/.m2 ./mvnw -q -DskipTests package && cp target/*.jar /app.jar
+
+FROM eclipse-temurin:${JAVA_VERSION}-jre AS runtime
+RUN useradd --create-home --uid 10001 app
+COPY --from=build /app.jar /app/app.jar
+USER app
+EXPOSE 8080
+ENTRYPOINT ["java", "-jar", "/app/app.jar"]
+'''
+
+
+def dockerfile(architecture_key: str, config: Mapping, project_name: str, profile: str = 'default') -> Optional[str]:
+    """Dockerfile for the architecture, or None if it has nothing to containerize"""
+    found = runtimes(architecture_key, config)
+    packages = set(config.get('packages', ()))
+    if 'python-sync' in found or 'python-async' in found:
+        frontend = 'node-build' in found and bool(config.get('scripts', {}).get('build'))
+        return python_dockerfile(architecture_key, config, project_name, profile, frontend)
+    if 'node-server' in found:
+        return node_server_dockerfile(config)
+    if ('node-build' in found and packages & FRONTEND_PACKAGES and 'react-native' not in packages
+            and config.get('scripts', {}).get('build')):
+        return static_site_dockerfile(config, project_name)
+    if 'go' in found:
+        return go_dockerfile()
+    if 'rust' in found:
+        return rust_dockerfile(project_name)
+    if 'jvm' in found:
+        return jvm_dockerfile()
+    return None
+
+
+def dockerignore(architecture_key: str, config: Mapping) -> str:
+    """Keep the build context to what the image needs: smaller uploads and
+    no cache busting from files the build never reads"""
+    found = runtimes(architecture_key, config)
+    lines = list(DOCKERIGNORE_COMMON)
+    for runtime, patterns in DOCKERIGNORE_RUNTIME.items():
+        if any(name.startswith(runtime) for name in found) or (runtime == 'node' and config.get('packages')):
+            lines += ['', f'# {runtime.title()} build output and caches'] + patterns
+    return '\n'.join(lines) + '\n'
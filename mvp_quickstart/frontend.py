@@ -0,0 +1,303 @@
+"""
+Performance-budgeted build configuration for Vite and Next.js frontends.
+
+Vite projects get a vite.config that splits the framework into its own
+long-cached vendor chunk, optimizes images and precompresses assets (gzip
+and brotli), plus a route table whose pages are dynamic imports, so each
+route is a separate chunk. Next.js already splits per route and vendors the
+framework; its next.config turns on AVIF/WebP images and response
+compression (or a static export for jamstack).
+
+Both get scripts/check-bundle-size.mjs, run after every build. It fails the
+build when a chunk, or all chunks of one kind, exceed the gzip limits in
+bundle-budget.json.
+"""
+
+import json
+from typing import Dict, Mapping, Optional
+
+BUDGET_PATH = 'bundle-budget.json'
+BUDGET_SCRIPT_PATH = 'scripts/check-bundle-size.mjs'
+
+# Gzip KB, what browsers actually download
+JS_CHUNK_KB = 150
+JS_TOTAL_KB = 500
+CSS_CHUNK_KB = 50
+CSS_TOTAL_KB = 100
+
+# Directories the budget is checked against, per build tool
+OUTPUT_DIRECTORIES = {
+    'vite': 'dist/assets',
+    'sveltekit': '.svelte-kit/output/client/_app/immutable',
+    'next': '.next/static',
+}
+
+# Build plugins the generated configs import
+BUILD_DEV_DEPENDENCIES = {
+    'vite-plugin-compression2': '^1.3.3',
+    'vite-plugin-image-optimizer': '^1.1.8',
+    'sharp': '^0.33.5',
+    'svgo': '^3.3.2',
+}
+FRAMEWORK_PLUGINS = {
+    'react': ("import react from '@vitejs/plugin-react'", 'react()', '@vitejs/plugin-react', '^4.3.4'),
+    'vue': ("import vue from '@vitejs/plugin-vue'", 'vue()', '@vitejs/plugin-vue', '^5.2.1'),
+    'sveltekit': ("import { sveltekit } from '@sveltejs/kit/vite'", 'sveltekit()', '@sveltejs/kit', '^2.15.0'),
+}
+
+# Framework runtime packages grouped into one vendor chunk: they change far
+# less often than app code, so browsers keep them cached across deploys
+VENDOR_CHUNKS = {
+    'react': ['react', 'react-dom', 'scheduler'],
+    'vue': ['vue', '@vue', 'vue-router', 'pinia'],
+}
+
+VITE_CONFIG = '''import {{ defineConfig }} from 'vite'
+{plugin_import}
+import {{ compression }} from 'vite-plugin-compression2'
+import {{ ViteImageOptimizer }} from 'vite-plugin-image-optimizer'
+{vendor}
+export default defineConfig({{
+  plugins: [
+    {plugin_call},
+    // Recompress images at build time; AVIF/WebP sources stay in their format
+    ViteImageOptimizer({{ jpeg: {{ quality: 80 }}, png: {{ quality: 80 }}, webp: {{ quality: 80 }}, avif: {{ quality: 70 }} }}),
+    // Precompressed .gz/.br files next to each asset, served as-is by nginx or a CDN
+    compression({{ algorithm: 'gzip' }}),
+    compression({{ algorithm: 'brotliCompress' }}),
+  ],
+  build: {{
+    target: 'es2020',
+    cssCodeSplit: true,
+    // check-bundle-size.mjs reports gzip sizes against the budget instead
+    reportCompressedSize: false,
+    // Minified kB, roughly three times the gzip chunk budget
+    chunkSizeWarningLimit: {chunk_limit},{rollup}
+  }},
+}})
+'''
+
+VITE_VENDOR = '''
+const VENDOR_CHUNKS{annotation} = {chunks}
+
+// Only the framework is pinned to a vendor chunk. Other libraries are left to
+// Rollup, which keeps code used by a single lazy route inside that route's chunk.
+function manualChunks(id{id_type}) {{
+  if (!id.includes('/node_modules/')) return undefined
+  for (const [name, packages] of Object.entries(VENDOR_CHUNKS)) {{
+    if (packages.some((pkg) => id.includes(`/node_modules/${{pkg}}/`))) return `vendor-${{name}}`
+  }}
+  return undefined
+}}
+'''
+
+VITE_ROLLUP = '''
+    rollupOptions: {
+      output: { manualChunks },
+    },'''
+
+REACT_ROUTES = '''import { lazy } from 'react'
+
+// Every page is a dynamic import, so Vite emits it as its own chunk and the
+// browser fetches it the first time the route renders. Render routes inside
+// <Suspense>; the shape matches react-router's route objects.
+export const routes = [
+  { path: '/', Component: lazy(() => import('./pages/Home')) },
+]
+'''
+
+REACT_HOME = '''export default function Home() {{
+  return <h1>{project_name}</h1>
+}}
+'''
+
+VUE_ROUTES = '''// Every page is a dynamic import, so Vite emits it as its own chunk and the
+// browser fetches it the first time the route is visited. Pass these to
+// vue-router's createRouter({ routes }).
+export const routes = [
+  { path: '/', component: () => import('./pages/Home.vue') },
+]
+'''
+
+VUE_HOME = '''<template>
+  <h1>{project_name}</h1>
+</template>
+'''
+
+NEXT_CONFIG = '''/** @type {{import('next').NextConfig}} */
+const nextConfig = {{
+  reactStrictMode: true,
+  poweredByHeader: false,
+{body}}}
+
+export default nextConfig
+'''
+
+NEXT_SERVER_BODY = '''  // gzip responses from `next start`; disable when a proxy or CDN compresses
+  compress: true,
+  images: {
+    formats: ['image/avif', 'image/webp'],
+    minimumCacheTTL: 60 * 60 * 24 * 30,
+  },
+'''
+
+NEXT_EXPORT_BODY = '''  // Static HTML export for the CDN, which compresses and caches the files.
+  // There is no image optimization server, so next/image serves sources as-is.
+  output: 'export',
+  images: { unoptimized: true },
+'''
+
+BUDGET_SCRIPT = '''#!/usr/bin/env node
+// Fails the build when a chunk, or all chunks of one kind, grow beyond the
+// gzip limits in bundle-budget.json. Runs after `npm run build` (postbuild).
+import { existsSync, readFileSync, readdirSync, statSync } from 'node:fs'
+import { join, relative } from 'node:path'
+import { gzipSync } from 'node:zlib'
+
+const config = JSON.parse(readFileSync(process.argv[2] ?? 'bundle-budget.json', 'utf8'))
+if (!existsSync(config.directory)) {
+  console.error(`❌ ${config.directory} not found - run the build first`)
+  process.exit(1)
+}
+
+function* walk(dir) {
+  for (const name of readdirSync(dir)) {
+    const path = join(dir, name)
+    if (statSync(path).isDirectory()) yield* walk(path)
+    else yield path
+  }
+}
+
+const files = [...walk(config.directory)].map((path) => ({
+  path: relative(config.directory, path),
+  kb: gzipSync(readFileSync(path)).length / 1024,
+}))
+
+let failed = false
+for (const budget of config.budgets) {
+  const pattern = new RegExp(budget.pattern)
+  const matched = files.filter((file) => pattern.test(file.path))
+  const total = matched.reduce((sum, file) => sum + file.kb, 0)
+  for (const file of matched.filter((file) => file.kb > budget.maxChunkKb)) {
+    console.error(`❌ ${budget.name}: ${file.path} is ${file.kb.toFixed(1)} KB gzip (limit ${budget.maxChunkKb} KB)`)
+    failed = true
+  }
+  if (total > budget.maxTotalKb) {
+    console.error(`❌ ${budget.name}: ${total.toFixed(1)} KB gzip in total (limit ${budget.maxTotalKb} KB)`)
+    failed = true
+  }
+  console.log(`📦 ${budget.name}: ${matched.length} files, ${total.toFixed(1)} KB gzip`)
+}
+if (failed) {
+  console.error('Split the oversized code with dynamic import() or raise the limit in bundle-budget.json')
+  process.exit(1)
+}
+console.log('✅ Bundle within budget')
+'''
+
+
+def _all_packages(config: Mapping) -> set:
+    return set(config.get('packages', ())) | set(config.get('dev_dependencies', ()))
+
+
+def build_tool(config: Mapping) -> Optional[str]:
+    """'next', 'vite' or 'sveltekit' for frontends this module configures"""
+    packages = _all_packages(config)
+    if 'next' in packages:
+        return 'next'
+    if '@sveltejs/kit' in packages:
+        return 'sveltekit'
+    uses_vite = 'vite' in packages or 'vite' in ' '.join(config.get('scripts', {}).values()).split()
+    if uses_vite and {'react', 'vue'} & packages:
+        return 'vite'
+    return None
+
+
+def _framework(config: Mapping) -> str:
+    tool = build_tool(config)
+    if tool == 'sveltekit':
+        return 'sveltekit'
+    return 'vue' if 'vue' in _all_packages(config) else 'react'
+
+
+def _typescript(config: Mapping) -> bool:
+    return 'typescript' in _all_packages(config)
+
+
+def budget(config: Mapping) -> Dict:
+    return {
+        'directory': OUTPUT_DIRECTORIES[build_tool(config)],
+        'budgets': [
+            {'name': 'JavaScript', 'pattern': r'\.m?js$', 'maxChunkKb': JS_CHUNK_KB, 'maxTotalKb': JS_TOTAL_KB},
+            {'name': 'CSS', 'pattern': r'\.css$', 'maxChunkKb': CSS_CHUNK_KB, 'maxTotalKb': CSS_TOTAL_KB},
+        ],
+    }
+
+
+def vite_config(config: Mapping) -> str:
+    framework = _framework(config)
+    plugin_import, plugin_call = FRAMEWORK_PLUGINS[framework][:2]
+    vendor, rollup = '', ''
+    # SvelteKit sets its own chunking per route; overriding it breaks the SSR build
+    if framework in VENDOR_CHUNKS:
+        typescript = _typescript(config)
+        vendor = VITE_VENDOR.format(
+            annotation=': Record<string, string[]>' if typescript else '',
+            chunks=f"{{ {framework}: [{', '.join(repr(name) for name in VENDOR_CHUNKS[framework])}] }}",
+            id_type=': string' if typescript else '')
+        rollup = VITE_ROLLUP
+    return VITE_CONFIG.format(plugin_import=plugin_import, plugin_call=plugin_call, vendor=vendor,
+                              chunk_limit=JS_CHUNK_KB * 3, rollup=rollup)
+
+
+def _static_export(config: Mapping) -> bool:
+    return 'next export' in config.get('scripts', {}).get('build', '')
+
+
+def next_config(config: Mapping) -> str:
+    static_export = _static_export(config)
+    return NEXT_CONFIG.format(body=NEXT_EXPORT_BODY if static_export else NEXT_SERVER_BODY)
+
+
+def build_files(architecture_key: str, config: Mapping, project_name: str) -> Dict[str, str]:
+    """Build config, route table and budget files by relative path; empty
+    for architectures without a Vite or Next.js frontend"""
+    tool = build_tool(config)
+    if tool is None:
+        return {}
+    files = {}
+    extension = 'ts' if _typescript(config) else 'js'
+    if tool == 'next':
+        files['next.config.mjs'] = next_config(config)
+    else:
+        files[f'vite.config.{extension}'] = vite_config(config)
+        framework = _framework(config)
+        if framework == 'react':
+            files[f'src/routes.{extension}x'] = REACT_ROUTES
+            files[f'src/pages/Home.{extension}x'] = REACT_HOME.format(project_name=project_name)
+        elif framework == 'vue':
+            files[f'src/routes.{extension}'] = VUE_ROUTES
+            files['src/pages/Home.vue'] = VUE_HOME.format(project_name=project_name)
+    files[BUDGET_PATH] = json.dumps(budget(config), indent=2) + '\n'
+    files[BUDGET_SCRIPT_PATH] = BUDGET_SCRIPT
+    return files
+
+
+def build_scripts(config: Mapping) -> Dict[str, str]:
+    """package.json scripts that check the budget after every build"""
+    if build_tool(config) is None or not config.get('scripts', {}).get('build'):
+        return {}
+    scripts = {'size': f'node {BUDGET_SCRIPT_PATH}', 'postbuild': 'npm run size'}
+    if _static_export(config):
+        # `next export` was removed in Next.js 14; output: 'export' writes out/ during next build
+        scripts['build'] = 'next build'
+    return scripts
+
+
+def build_dev_dependencies(config: Mapping) -> Dict[str, str]:
+    """devDependencies the generated build config imports"""
+    tool = build_tool(config)
+    if tool in (None, 'next'):
+        return {}
+    name, version = FRAMEWORK_PLUGINS[_framework(config)][2:]
+    return {'vite': '^6.0.0', name: version, **BUILD_DEV_DEPENDENCIES}
@@ -0,0 +1,55 @@
+"""
+Architecture generator plugins.
+
+Each architecture's specific output lives in its own module here, imported
+only when that architecture is scaffolded, so adding stacks does not add to
+the scaffolder's import time. A plugin module may define:
+
+    CATEGORY          dict recorded as 'category' in .mvp-config.json
+    ENV_VARS          .env.example entries, in the {'# comment': '', NAME: value} form
+    create_structure  function(scaffolder, project_name) writing starter files
+                      through scaffolder.write_file and scaffolder.report
+    starter           function(project_name) -> (file name, content), for
+                      backends whose minimal starter other code reuses
+
+Plugins outside this package are found through the architecture's
+"generator" entry in architectures.json, or registered at run time with
+register().
+"""
+
+import importlib
+from types import ModuleType
+from typing import Dict, Mapping, Optional
+
+# Architecture key -> plugin module; only strings, nothing is imported here
+GENERATORS: Dict[str, str] = {
+    key: f"{__name__}.{key.replace('-', '_')}" for key in (
+        # Frontend
+        'react', 'vue', 'angular', 'svelte',
+        # Full-stack
+        'nextjs', 'nuxtjs', 'remix', 't3-stack',
+        # Mobile
+        'react-native', 'flutter',
+        # Backend
+        'fastapi', 'django', 'flask', 'expressjs', 'nestjs', 'flask-api', 'django-api',
+        # Serverless
+        'vercel-functions', 'netlify-functions', 'aws-lambda',
+        # Database
+        'prisma-postgresql', 'supabase',
+        # Testing
+        'cypress', 'playwright',
+        # Blockchain
+        'solidity-hardhat', 'solidity-foundry',
+    )
+}
+
+
+def register(architecture_key: str, module: str):
+    """Use the named module as the generator plugin for an architecture"""
+    GENERATORS[architecture_key] = module
+
+
+def load(architecture_key: str, config: Optional[Mapping] = None) -> Optional[ModuleType]:
+    """The architecture's plugin module, imported on first use; None if it has none"""
+    module = (config or {}).get('generator') or GENERATORS.get(architecture_key)
+    return importlib.import_module(module) if module else None
@@ -0,0 +1,11 @@
+"""
+Angular + TypeScript generators: project category and .env.example variables.
+"""
+
+CATEGORY = {'type': 'frontend', 'framework': 'Angular'}
+
+ENV_VARS = {
+    '# API Keys': '',
+    'NG_APP_API_URL': 'http://localhost:3000/api',
+    'NG_APP_NAME': 'My Angular App',
+}
@@ -0,0 +1,10 @@
+"""
+AWS Lambda + Node.js generators: .env.example variables.
+"""
+
+ENV_VARS = {
+    '# AWS': '',
+    'AWS_REGION': 'us-east-1',
+    'AWS_ACCESS_KEY_ID': 'your-access-key',
+    'AWS_SECRET_ACCESS_KEY': 'your-secret-key',
+}
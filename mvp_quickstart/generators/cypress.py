@@ -0,0 +1,8 @@
+"""
+Cypress E2E Testing generators: .env.example variables.
+"""
+
+ENV_VARS = {
+    '# Cypress': '',
+    'CYPRESS_BASE_URL': 'http://localhost:3000',
+}
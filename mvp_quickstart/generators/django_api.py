@@ -0,0 +1,9 @@
+"""
+Django API (legacy key) generators: points at django-admin for the project layout.
+"""
+
+
+def create_structure(scaffolder, project_name: str):
+    if not (scaffolder.project_root / 'manage.py').exists():
+        scaffolder.report('📋 Django project structure needed - run: django-admin startproject {} .'.format(
+            project_name.lower().replace(' ', '_')))
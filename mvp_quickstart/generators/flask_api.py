@@ -0,0 +1,5 @@
+"""
+Flask API (legacy key) generators: the same minimal app.py starter as flask.
+"""
+
+from mvp_quickstart.generators.flask import create_structure, starter  # noqa: F401
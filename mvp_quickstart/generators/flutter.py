@@ -0,0 +1,11 @@
+"""
+Flutter + Dart generators: project category and .env.example variables.
+"""
+
+CATEGORY = {'type': 'mobile', 'framework': 'Flutter', 'platform': 'iOS/Android'}
+
+ENV_VARS = {
+    '# Flutter Environment': '',
+    'FLUTTER_ENV': 'development',
+    'API_BASE_URL': 'http://localhost:3000/api',
+}
@@ -0,0 +1,10 @@
+"""
+Netlify Functions + Node.js generators: .env.example variables.
+"""
+
+ENV_VARS = {
+    '# Netlify': '',
+    'NETLIFY_SITE_ID': 'your-site-id',
+    '# API Keys': '',
+    'API_SECRET': 'your-api-secret',
+}
@@ -0,0 +1,8 @@
+"""
+Playwright E2E Testing generators: .env.example variables.
+"""
+
+ENV_VARS = {
+    '# Playwright': '',
+    'PLAYWRIGHT_BASE_URL': 'http://localhost:3000',
+}
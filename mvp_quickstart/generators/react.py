@@ -0,0 +1,11 @@
+"""
+React + TypeScript generators: project category and .env.example variables.
+"""
+
+CATEGORY = {'type': 'frontend', 'framework': 'React'}
+
+ENV_VARS = {
+    '# API Keys': '',
+    'VITE_API_URL': 'http://localhost:3000/api',
+    'VITE_APP_NAME': 'My React App',
+}
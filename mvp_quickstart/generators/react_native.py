@@ -0,0 +1,12 @@
+"""
+React Native + Expo generators: project category and .env.example variables.
+"""
+
+CATEGORY = {'type': 'mobile', 'framework': 'React Native', 'platform': 'iOS/Android'}
+
+ENV_VARS = {
+    '# Expo': '',
+    'EXPO_PUBLIC_API_URL': 'http://localhost:3000/api',
+    '# Push Notifications': '',
+    'EXPO_PUSH_TOKEN': 'your-expo-push-token',
+}
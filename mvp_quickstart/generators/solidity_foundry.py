@@ -0,0 +1,9 @@
+"""
+Solidity + Foundry generators: .env.example variables.
+"""
+
+ENV_VARS = {
+    '# Foundry': '',
+    'PRIVATE_KEY': 'your-wallet-private-key',
+    'RPC_URL': 'https://eth-mainnet.alchemyapi.io/v2/your-key',
+}
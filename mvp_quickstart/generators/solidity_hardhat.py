@@ -0,0 +1,10 @@
+"""
+Solidity + Hardhat generators: .env.example variables.
+"""
+
+ENV_VARS = {
+    '# Hardhat': '',
+    'PRIVATE_KEY': 'your-wallet-private-key',
+    'INFURA_PROJECT_ID': 'your-infura-project-id',
+    'ETHERSCAN_API_KEY': 'your-etherscan-api-key',
+}
@@ -0,0 +1,10 @@
+"""
+Supabase + PostgreSQL generators: .env.example variables.
+"""
+
+ENV_VARS = {
+    '# Supabase': '',
+    'NEXT_PUBLIC_SUPABASE_URL': 'your-supabase-url',
+    'NEXT_PUBLIC_SUPABASE_ANON_KEY': 'your-supabase-anon-key',
+    'SUPABASE_SERVICE_ROLE_KEY': 'your-service-role-key',
+}
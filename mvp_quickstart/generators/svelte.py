@@ -0,0 +1,5 @@
+"""
+Svelte + TypeScript generators: project category.
+"""
+
+CATEGORY = {'type': 'frontend', 'framework': 'Svelte'}
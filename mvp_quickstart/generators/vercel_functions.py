@@ -0,0 +1,12 @@
+"""
+Vercel Functions + Python generators: .env.example variables.
+"""
+
+ENV_VARS = {
+    '# Vercel': '',
+    'VERCEL_URL': 'your-vercel-url',
+    '# Database': '',
+    'DATABASE_URL': 'your-database-url',
+    '# API Keys': '',
+    'API_SECRET': 'your-api-secret',
+}
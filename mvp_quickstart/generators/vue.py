@@ -0,0 +1,11 @@
+"""
+Vue 3 + TypeScript generators: project category and .env.example variables.
+"""
+
+CATEGORY = {'type': 'frontend', 'framework': 'Vue.js'}
+
+ENV_VARS = {
+    '# API Keys': '',
+    'VITE_API_URL': 'http://localhost:3000/api',
+    'VITE_APP_NAME': 'My Vue App',
+}
@@ -0,0 +1,219 @@
+"""
+Initial git history for a generated project, written in one pass.
+
+Instead of ``git init && git add -A && git commit`` (three processes that
+walk, re-read and re-hash every file, archive included), the files the
+scaffolder recorded are read once here. Each one becomes a loose blob
+(zlib level 1, git's core.looseCompression default), then the trees, the
+commit, the branch ref with its reflog, and the index are written directly.
+The index carries the files' stat data, so ``git status`` starts clean
+without hashing anything again. ``git init`` is the only process spawned, so
+hooks, templates and init.defaultBranch still apply.
+
+The objects and index written here are SHA-1 and the refs are files, so
+``git init`` is asked for exactly that format whatever GIT_DEFAULT_HASH or
+init.default* say. Should the repository still come out in another format
+(a newer git honouring an environment override), the commit is made with
+``git add`` and ``git commit`` instead.
+
+Every git process is started through a ``run`` callable (subprocess.run by
+default), so the scaffolder can count only their time as subprocess time.
+"""
+
+import hashlib
+import os
+import stat
+import struct
+import subprocess
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Used when git has no identity configured for the user
+FALLBACK_IDENT = 'MVP Quick-Start <mvp-quickstart@localhost>'
+
+LOOSE_COMPRESSION = 1
+INDEX_VERSION = 2
+MAX_NAME_LENGTH = 0xFFF
+NULL_ID = '0' * 40
+
+FILE_MODE = b'100644'
+EXECUTABLE_MODE = b'100755'
+TREE_MODE = b'40000'
+
+
+def committer_ident(project_root: Path, run: Callable = subprocess.run) -> str:
+    """'Name <email>' from the environment or git's configuration, or FALLBACK_IDENT"""
+    name, email = os.environ.get('GIT_COMMITTER_NAME'), os.environ.get('GIT_COMMITTER_EMAIL')
+    if name and email:
+        return f'{name} <{email}>'
+    try:
+        ident = run(['git', 'var', 'GIT_COMMITTER_IDENT'], cwd=project_root, capture_output=True,
+                    text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return FALLBACK_IDENT
+    # Drop the trailing '<seconds> <offset>': the commit is stamped below
+    return ident.rsplit(' ', 2)[0] if ident.count(' ') >= 2 else FALLBACK_IDENT
+
+
+def git_timestamp(moment: Optional[float] = None) -> str:
+    """'<seconds> <+hhmm>' in the local timezone, as git records dates"""
+    moment = time.time() if moment is None else moment
+    offset = time.localtime(moment).tm_gmtoff // 60
+    sign = '-' if offset < 0 else '+'
+    return f'{int(moment)} {sign}{abs(offset) // 60:02d}{abs(offset) % 60:02d}'
+
+
+def head_ref(git_dir: Path) -> str:
+    head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+    if not head.startswith('ref: '):
+        raise RuntimeError(f'unexpected HEAD in new repository: {head}')
+    return head[len('ref: '):]
+
+
+class LooseObjectWriter:
+    """Writes objects into a repository's objects/ directory, as git hash-object -w does"""
+
+    def __init__(self, git_dir: Path):
+        self.objects_dir = os.path.join(git_dir, 'objects')
+        self.fanout = set()
+
+    def write(self, kind: bytes, data: bytes) -> bytes:
+        """Store one object; return its binary id"""
+        raw = b'%s %d\0' % (kind, len(data)) + data
+        object_id = hashlib.sha1(raw).digest()
+        hex_id = object_id.hex()
+        directory = os.path.join(self.objects_dir, hex_id[:2])
+        if hex_id[:2] not in self.fanout:
+            os.makedirs(directory, exist_ok=True)
+            self.fanout.add(hex_id[:2])
+        try:
+            fd = os.open(os.path.join(directory, hex_id[2:]), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o444)
+        except FileExistsError:
+            # Identical files share one blob
+            return object_id
+        with os.fdopen(fd, 'wb') as f:
+            f.write(zlib.compress(raw, LOOSE_COMPRESSION))
+        return object_id
+
+
+def write_tree(writer: LooseObjectWriter, entries: List[Tuple[str, bytes, bytes]]) -> bytes:
+    """Write the tree objects for (path, mode, id) entries; return the root tree id"""
+    root: Dict = {}
+    for rel_path, mode, object_id in entries:
+        *parents, name = rel_path.split('/')
+        directory = root
+        for parent in parents:
+            directory = directory.setdefault(parent, {})
+        directory[name] = (mode, object_id)
+
+    def write_directory(directory: Dict) -> bytes:
+        items = []
+        for name, value in directory.items():
+            if isinstance(value, dict):
+                # Git orders subtrees as if their names ended in '/'
+                items.append((name.encode('utf-8') + b'/', TREE_MODE, name, write_directory(value)))
+            else:
+                items.append((name.encode('utf-8'), value[0], name, value[1]))
+        items.sort(key=lambda item: item[0])
+        return writer.write(b'tree', b''.join(b'%s %s\0' % (mode, name.encode('utf-8')) + object_id
+                                              for _, mode, name, object_id in items))
+
+    return write_directory(root)
+
+
+def index_entry(rel_path: str, info: os.stat_result, object_id: bytes) -> bytes:
+    name = rel_path.encode('utf-8')
+    mode = 0o100755 if info.st_mode & stat.S_IXUSR else 0o100644
+    fields = (int(info.st_ctime), info.st_ctime_ns % 10 ** 9, int(info.st_mtime), info.st_mtime_ns % 10 ** 9,
+              info.st_dev, info.st_ino, mode, info.st_uid, info.st_gid, info.st_size)
+    entry = struct.pack('>10I', *(value & 0xFFFFFFFF for value in fields))
+    entry += object_id + struct.pack('>H', min(len(name), MAX_NAME_LENGTH)) + name
+    # NUL-terminated and padded to a multiple of eight bytes
+    return entry + b'\0' * (8 - len(entry) % 8)
+
+
+def write_index(git_dir: Path, entries: List[Tuple[str, os.stat_result, bytes]]):
+    """Write a version 2 index (sorted by path bytes, checksummed) for the committed files"""
+    entries = sorted(entries, key=lambda entry: entry[0].encode('utf-8'))
+    body = b'DIRC' + struct.pack('>II', INDEX_VERSION, len(entries))
+    body += b''.join(index_entry(*entry) for entry in entries)
+    lock_path = git_dir / 'index.lock'
+    lock_path.write_bytes(body + hashlib.sha1(body).digest())
+    os.replace(lock_path, git_dir / 'index')
+
+
+def update_ref(git_dir: Path, ref: str, commit_id: str, ident: str, stamp: str, subject: str):
+    """Point a new branch at commit_id, with the reflog entries git commit would write"""
+    ref_path = git_dir / ref
+    ref_path.parent.mkdir(parents=True, exist_ok=True)
+    ref_path.write_text(commit_id + '\n', encoding='utf-8')
+    line = f'{NULL_ID} {commit_id} {ident} {stamp}\tcommit (initial): {subject}\n'
+    for log in ('HEAD', ref):
+        log_path = git_dir / 'logs' / log
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text(line, encoding='utf-8')
+
+
+def plain_format(git_dir: Path) -> bool:
+    """Whether a new repository uses SHA-1 objects and file refs: format version 0, no extensions"""
+    config = (git_dir / 'config').read_text(encoding='utf-8')
+    return 'repositoryformatversion = 0' in config and '[extensions]' not in config
+
+
+def commit_with_git(project_root: Path, paths: Iterable[Path], message: str, ident: str,
+                    run: Callable = subprocess.run) -> str:
+    """The initial commit through git add and git commit, for repositories this module cannot write"""
+    name, _, email = ident.partition(' <')
+    env = dict(os.environ, GIT_AUTHOR_NAME=name, GIT_AUTHOR_EMAIL=email.rstrip('>'),
+               GIT_COMMITTER_NAME=name, GIT_COMMITTER_EMAIL=email.rstrip('>'))
+    listed = '\0'.join(Path(path).relative_to(project_root).as_posix() for path in paths
+                       if Path(path).is_file() and Path(path).relative_to(project_root).parts[0] != '.git')
+    run(['git', 'add', '--pathspec-from-file=-', '--pathspec-file-nul'], cwd=project_root,
+        input=listed.encode('utf-8'), capture_output=True, check=True, env=env)
+    run(['git', 'commit', '--quiet', '--no-verify', '-m', message], cwd=project_root,
+        capture_output=True, check=True, env=env)
+    return run(['git', 'rev-parse', 'HEAD'], cwd=project_root, capture_output=True, text=True,
+               check=True, env=env).stdout.strip()
+
+
+def initial_commit(project_root: Path, paths: Iterable[Path], message: str,
+                   ident: Optional[str] = None, run: Callable = subprocess.run) -> str:
+    """Create a repository at project_root whose first commit holds paths; return the commit id
+
+    Raises RuntimeError if project_root is already a repository, and OSError
+    or CalledProcessError if git is missing or cannot initialize it.
+    """
+    project_root = Path(project_root)
+    git_dir = project_root / '.git'
+    if git_dir.exists():
+        raise RuntimeError(f'{project_root} is already a git repository')
+    # Older git ignores the unknown init.defaultRefFormat; it only has file refs anyway
+    run(['git', '-c', 'init.defaultRefFormat=files', 'init', '--quiet', '--object-format=sha1'],
+        cwd=project_root, capture_output=True, check=True)
+    ident = ident or committer_ident(project_root, run)
+    if not plain_format(git_dir):
+        return commit_with_git(project_root, paths, message, ident, run)
+    ref = head_ref(git_dir)
+
+    writer = LooseObjectWriter(git_dir)
+    tree_entries, index_entries = [], []
+    for path in sorted(set(map(Path, paths))):
+        rel_path = path.relative_to(project_root).as_posix()
+        if rel_path.split('/')[0] == '.git' or not path.is_file():
+            continue
+        with open(path, 'rb') as f:
+            info = os.fstat(f.fileno())
+            data = f.read()
+        object_id = writer.write(b'blob', data)
+        tree_entries.append((rel_path, EXECUTABLE_MODE if info.st_mode & stat.S_IXUSR else FILE_MODE, object_id))
+        index_entries.append((rel_path, info, object_id))
+
+    stamp = git_timestamp()
+    commit = (f'tree {write_tree(writer, tree_entries).hex()}\n'
+              f'author {ident} {stamp}\ncommitter {ident} {stamp}\n\n{message}')
+    commit_id = writer.write(b'commit', commit.encode('utf-8')).hex()
+    update_ref(git_dir, ref, commit_id, ident, stamp, message.splitlines()[0])
+    write_index(git_dir, index_entries)
+    return commit_id
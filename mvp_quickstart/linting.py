@@ -0,0 +1,142 @@
+"""
+Incremental lint and format setup.
+
+Full-tree lint scripts get the linters' own caches, so a rerun only re-reads
+files whose content changed:
+
+- ESLint runs with ``--cache --cache-strategy content`` (content hashes
+  survive fresh checkouts, where every mtime is new), cached under
+  node_modules/.cache/eslint;
+- Prettier gets ``format`` scripts with ``--cache``;
+- flake8, which has no cache, is replaced by ruff: the same pyflakes and
+  pycodestyle checks, multi-threaded and cached in .ruff_cache.
+
+.pre-commit-config.yaml runs the linters on the staged files only. ruff
+spreads its file list over threads itself; ESLint and Prettier are
+single-threaded, so pre-commit splits their files across one process per
+core. Those parallel processes run without the cache: they would all write
+the same cache file, and a staged change is small enough not to need it.
+"""
+
+from typing import Dict, List, Mapping
+
+from mvp_quickstart.tuning import uses_python
+
+PRE_COMMIT_CONFIG_PATH = '.pre-commit-config.yaml'
+RUFF_CONFIG_PATH = 'ruff.toml'
+RUFF_PRE_COMMIT_REV = 'v0.17.0'
+
+ESLINT_CACHE_DIRECTORY = 'node_modules/.cache/eslint'
+ESLINT_CACHE = f'--cache --cache-location {ESLINT_CACHE_DIRECTORY}/ --cache-strategy content'
+ESLINT_FILES = r'\.(js|jsx|ts|tsx|mjs|cjs|vue|svelte)$'
+PRETTIER_FILES = r'\.(js|jsx|ts|tsx|mjs|cjs|vue|svelte|json|css|scss|md|yml|yaml|html)$'
+
+# Generated or copied trees no hook should touch
+EXCLUDED = ('archive', 'node_modules', 'dist', 'build')
+# The scaffolder's own helper script is not project code either
+RUFF_EXCLUDED = EXCLUDED + ('add_architecture.py',)
+
+RUFF_CONFIG = '''# ruff runs the checks flake8 ran (pyflakes F, pycodestyle E and W) on every
+# core, and skips files unchanged since the last run using .ruff_cache.
+line-length = 120
+extend-exclude = [{excluded}]
+
+[lint]
+select = ["E", "F", "W"]
+'''
+
+PRE_COMMIT_HEADER = '''# Hooks run on the staged files only, so a commit costs time in proportion
+# to the change. pre-commit splits the files across one process per core
+# for hooks that are not require_serial.
+#
+#   pip install pre-commit && pre-commit install
+#   pre-commit run --from-ref origin/main --to-ref HEAD   # a whole branch
+exclude: ^({excluded})/
+repos:
+'''
+
+RUFF_HOOKS = '''  - repo: https://github.com/astral-sh/ruff-pre-commit
+    rev: {rev}
+    hooks:
+      # ruff parallelizes and caches on its own, so it takes all files in one process
+      - id: ruff
+        args: [--fix]
+      - id: ruff-format
+'''
+
+NODE_HOOKS_HEADER = '''  - repo: local
+    hooks:
+'''
+
+ESLINT_HOOK = '''      - id: eslint
+        name: eslint
+        entry: npx eslint --fix
+        language: system
+        files: {files}
+'''
+
+PRETTIER_HOOK = '''      - id: prettier
+        name: prettier
+        entry: npx prettier --write --ignore-unknown
+        language: system
+        files: {files}
+'''
+
+
+def linters(architecture_key: str, config: Mapping) -> List[str]:
+    """Linters and formatters this module configures, of ruff, eslint and prettier"""
+    lint = config.get('scripts', {}).get('lint', '').split()
+    packages = set(config.get('packages', ())) | set(config.get('dev_dependencies', ()))
+    found = []
+    if uses_python(architecture_key, config) or 'flake8' in lint:
+        found.append('ruff')
+    # ESLint needs the project's own config, which only a project linting with it has
+    if 'eslint' in lint or lint[:2] == ['next', 'lint']:
+        found.append('eslint')
+    if 'prettier' in packages:
+        found.append('prettier')
+    return found
+
+
+def lint_scripts(architecture_key: str, config: Mapping) -> Dict[str, str]:
+    """Scripts overriding or adding to the catalog's: cached lint and format commands
+
+    Only lint scripts the catalog already has are changed; a new one would
+    fail in projects that have not configured the linter yet.
+    """
+    found = linters(architecture_key, config)
+    lint = config.get('scripts', {}).get('lint', '')
+    scripts = {}
+    # `next lint` caches in .next/cache/eslint already
+    if 'eslint' in lint.split() and '--cache' not in lint.split():
+        scripts['lint'] = f'{lint} {ESLINT_CACHE}'
+    elif lint.split()[:1] == ['flake8']:
+        scripts['lint'] = 'ruff check' + lint[len('flake8'):]
+    if 'prettier' in found:
+        scripts['format'] = 'prettier --write --cache .'
+        scripts['format:check'] = 'prettier --check --cache .'
+    return scripts
+
+
+def pre_commit_config(found: List[str]) -> str:
+    text = PRE_COMMIT_HEADER.format(excluded='|'.join(EXCLUDED))
+    if 'ruff' in found:
+        text += RUFF_HOOKS.format(rev=RUFF_PRE_COMMIT_REV)
+    if {'eslint', 'prettier'} & set(found):
+        text += NODE_HOOKS_HEADER
+        if 'eslint' in found:
+            text += ESLINT_HOOK.format(files=ESLINT_FILES)
+        if 'prettier' in found:
+            text += PRETTIER_HOOK.format(files=PRETTIER_FILES)
+    return text
+
+
+def lint_files(architecture_key: str, config: Mapping) -> Dict[str, str]:
+    """Lint config by relative path; empty for architectures without a linter configured here"""
+    found = linters(architecture_key, config)
+    if not found:
+        return {}
+    files = {PRE_COMMIT_CONFIG_PATH: pre_commit_config(found)}
+    if 'ruff' in found:
+        files[RUFF_CONFIG_PATH] = RUFF_CONFIG.format(excluded=', '.join(f'"{name}"' for name in RUFF_EXCLUDED))
+    return files
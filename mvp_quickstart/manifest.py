@@ -0,0 +1,129 @@
+"""
+Hash manifest of the files a scaffold generated, for cheap drift detection.
+
+.mvp-manifest records each generated file's size, mtime and SHA-256. Verifying
+a project stats every listed file and re-hashes only those whose size or mtime
+no longer match, so checking an untouched project reads no file contents.
+Like git's index, entries whose mtime is not older than the manifest itself
+are "racily clean": a write in the same timestamp tick would not show in the
+stat data, so they are always re-hashed. Refreshing the manifest after a
+verify moves such entries, and files that were touched but not changed, back
+onto the stat-only path.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional
+
+MANIFEST_NAME = '.mvp-manifest'
+MANIFEST_VERSION = 1
+HASH_CHUNK = 1 << 20
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_entry(path: Path, digest: Optional[str] = None) -> Dict:
+    """Manifest entry for one file; digest skips reading it when the caller already knows the hash"""
+    info = os.stat(path)
+    return {'size': info.st_size, 'mtime_ns': info.st_mtime_ns, 'sha256': digest or file_hash(path)}
+
+
+def build_manifest(root: Path, paths: Iterable[Path], digests: Optional[Mapping[Path, str]] = None) -> Dict:
+    """Manifest of the given files under root; files that no longer exist are left out"""
+    root = Path(root)
+    digests = digests or {}
+    files = {}
+    for path in paths:
+        rel_path = Path(path).relative_to(root).as_posix()
+        if rel_path == MANIFEST_NAME or not os.path.isfile(path):
+            continue
+        files[rel_path] = file_entry(path, digests.get(path))
+    return {'version': MANIFEST_VERSION, 'files': dict(sorted(files.items()))}
+
+
+def manifest_text(manifest: Mapping) -> str:
+    return json.dumps(manifest, indent=1, sort_keys=True) + '\n'
+
+
+def load_manifest(root: Path) -> Optional[Dict]:
+    try:
+        return json.loads((Path(root) / MANIFEST_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def save_manifest(root: Path, manifest: Mapping):
+    """Replace the manifest atomically"""
+    fd, tmp_name = tempfile.mkstemp(dir=root, prefix=f'{MANIFEST_NAME}.')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(manifest_text(manifest))
+    os.chmod(tmp_name, 0o644)
+    os.replace(tmp_name, Path(root) / MANIFEST_NAME)
+
+
+def verify(root: Path, refresh: bool = True) -> Dict[str, List[str]]:
+    """Compare a project with its manifest.
+
+    Returns {'modified': [...], 'missing': [...], 'rehashed': [...]}: files
+    whose content changed, files that were deleted, and the files that had to
+    be read to tell. With refresh, entries that were re-hashed and found
+    unchanged get their new stat data saved. Raises FileNotFoundError when the
+    project has no manifest.
+    """
+    root = Path(root)
+    manifest_path = root / MANIFEST_NAME
+    manifest = load_manifest(root)
+    if manifest is None:
+        raise FileNotFoundError(f'no readable {MANIFEST_NAME} in {root}')
+    racy_after = os.stat(manifest_path).st_mtime_ns
+
+    report = {'modified': [], 'missing': [], 'rehashed': []}
+    refreshed = False
+    for rel_path, entry in manifest['files'].items():
+        path = os.path.join(root, rel_path)
+        try:
+            info = os.stat(path)
+        except FileNotFoundError:
+            report['missing'].append(rel_path)
+            continue
+        if info.st_size != entry['size']:
+            report['modified'].append(rel_path)
+            continue
+        if info.st_mtime_ns == entry['mtime_ns'] and info.st_mtime_ns < racy_after:
+            continue
+
+        report['rehashed'].append(rel_path)
+        if file_hash(path) != entry['sha256']:
+            report['modified'].append(rel_path)
+        elif refresh:
+            entry['mtime_ns'] = info.st_mtime_ns
+            refreshed = True
+
+    if refreshed:
+        save_manifest(root, manifest)
+    return report
+
+
+def update_entries(root: Path, rel_paths: Iterable[str]):
+    """Re-record files the scaffolder has rewritten (e.g. by an upgrade); no-op without a manifest"""
+    root = Path(root)
+    manifest = load_manifest(root)
+    if manifest is None:
+        return
+    for rel_path in rel_paths:
+        path = root / rel_path
+        if path.is_file():
+            manifest['files'][rel_path] = file_entry(path)
+        else:
+            manifest['files'].pop(rel_path, None)
+    manifest['files'] = dict(sorted(manifest['files'].items()))
+    save_manifest(root, manifest)
@@ -0,0 +1,191 @@
+"""
+Metrics export for scaffold runs.
+
+A run record (ScaffoldResult.metrics) is written two ways:
+
+- as JSON lines, one event per step plus one per run, appended to an event log;
+- as an OpenMetrics text file holding cumulative counters and latency
+  histograms per architecture, suitable for the node exporter textfile
+  collector. Aggregates live in a sidecar <textfile>.state.json and are
+  updated under a file lock so concurrent scaffolds on one host don't race.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to unlocked updates
+    fcntl = None
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+STATE_VERSION = 1
+
+
+def jsonl_events(run: Dict) -> List[Dict]:
+    """Flatten a run record into step events followed by one run event"""
+    common = {key: run[key] for key in ('run_id', 'timestamp', 'architecture')}
+    events = [dict(common, event='step', **step) for step in run.get('steps', [])]
+    events.append(dict({key: value for key, value in run.items() if key != 'steps'}, event='run'))
+    return events
+
+
+def append_jsonl(path: Path, run: Dict):
+    """Append the run's events to a JSON-lines file with a single O_APPEND write"""
+    payload = ''.join(json.dumps(event, sort_keys=True) + '\n' for event in jsonl_events(run))
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, payload.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _locked(lock_path: Path):
+    with open(lock_path, 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _empty_histogram() -> Dict:
+    return {'buckets': [0] * len(DURATION_BUCKETS), 'sum': 0.0, 'count': 0}
+
+
+def _observe(histogram: Dict, value: float):
+    for index, bound in enumerate(DURATION_BUCKETS):
+        if value <= bound:
+            histogram['buckets'][index] += 1
+    histogram['sum'] += value
+    histogram['count'] += 1
+
+
+def _label_key(*values: str) -> str:
+    return json.dumps(list(values))
+
+
+def update_state(state: Dict, run: Dict) -> Dict:
+    """Fold one run record into the cumulative aggregates"""
+    arch = run['architecture']
+    result = 'success' if run['success'] else 'failure'
+
+    def bump(section: str, key: str, amount=1):
+        state.setdefault(section, {})
+        state[section][key] = state[section].get(key, 0) + amount
+
+    bump('runs', _label_key(arch, result))
+    bump('bytes_written', _label_key(arch), run['bytes_written'])
+    bump('files_written', _label_key(arch), run['files_written'])
+    bump('subprocess_seconds', _label_key(arch), run['subprocess_seconds'])
+    _observe(state.setdefault('run_duration', {}).setdefault(_label_key(arch), _empty_histogram()),
+             run['duration_seconds'])
+
+    for step in run.get('steps', []):
+        step_key = _label_key(arch, step['step'])
+        _observe(state.setdefault('step_duration', {}).setdefault(step_key, _empty_histogram()),
+                 step['duration_seconds'])
+        if not step['success']:
+            bump('step_failures', step_key)
+
+    for kind, count in run.get('rules', {}).items():
+        state.setdefault('rules', {})[_label_key(arch, kind)] = count
+    return state
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names: List[str], key: str, extra: Optional[Dict[str, str]] = None) -> str:
+    pairs = list(zip(names, json.loads(key))) + list((extra or {}).items())
+    return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + '}'
+
+
+def _format_number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_openmetrics(state: Dict) -> str:
+    """Render cumulative aggregates in the OpenMetrics text format"""
+    lines = []
+
+    def family(name: str, metric_type: str, help_text: str):
+        lines.append(f'# TYPE {name} {metric_type}')
+        lines.append(f'# HELP {name} {help_text}')
+
+    def counter(name: str, help_text: str, section: str, label_names: List[str], unit: str = ''):
+        family(name, 'counter', help_text)
+        if unit:
+            lines.append(f'# UNIT {name} {unit}')
+        for key, value in sorted(state.get(section, {}).items()):
+            lines.append(f'{name}_total{_labels(label_names, key)} {_format_number(value)}')
+
+    def histogram(name: str, help_text: str, section: str, label_names: List[str]):
+        family(name, 'histogram', help_text)
+        lines.append(f'# UNIT {name} seconds')
+        for key, data in sorted(state.get(section, {}).items()):
+            for bound, count in zip(DURATION_BUCKETS, data['buckets']):
+                lines.append(f'{name}_bucket{_labels(label_names, key, {"le": repr(bound)})} {count}')
+            lines.append(f'{name}_bucket{_labels(label_names, key, {"le": "+Inf"})} {data["count"]}')
+            lines.append(f'{name}_sum{_labels(label_names, key)} {_format_number(float(data["sum"]))}')
+            lines.append(f'{name}_count{_labels(label_names, key)} {data["count"]}')
+
+    counter('mvp_scaffold_runs', 'Scaffold runs by architecture and result', 'runs', ['architecture', 'result'])
+    histogram('mvp_scaffold_duration_seconds', 'End-to-end scaffold latency', 'run_duration', ['architecture'])
+    histogram('mvp_scaffold_step_duration_seconds', 'Latency of each scaffold step', 'step_duration',
+              ['architecture', 'step'])
+    counter('mvp_scaffold_step_failures', 'Scaffold steps that failed', 'step_failures', ['architecture', 'step'])
+    counter('mvp_scaffold_written_bytes', 'Bytes written into generated projects', 'bytes_written',
+            ['architecture'], unit='bytes')
+    counter('mvp_scaffold_written_files', 'Files written into generated projects', 'files_written', ['architecture'])
+    counter('mvp_scaffold_subprocess_seconds', 'Time spent waiting on subprocesses', 'subprocess_seconds',
+            ['architecture'], unit='seconds')
+
+    family('mvp_scaffold_rules', 'gauge', 'Rules activated by the most recent run')
+    for key, value in sorted(state.get('rules', {}).items()):
+        lines.append(f'mvp_scaffold_rules{_labels(["architecture", "kind"], key)} {value}')
+
+    lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
+
+
+def update_openmetrics(path: Path, run: Dict):
+    """Fold a run into the aggregates and atomically rewrite the text file"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    state_path = path.with_name(path.name + '.state.json')
+
+    with _locked(path.with_name(path.name + '.lock')):
+        state = {}
+        if state_path.exists():
+            try:
+                state = json.loads(state_path.read_text(encoding='utf-8'))
+            except ValueError:
+                state = {}
+        if state.get('version') != STATE_VERSION:
+            state = {'version': STATE_VERSION}
+
+        update_state(state, run)
+
+        for target, content in ((state_path, json.dumps(state, sort_keys=True)),
+                                (path, render_openmetrics(state))):
+            tmp_path = target.with_name(f'.{target.name}.{os.getpid()}.tmp')
+            tmp_path.write_text(content, encoding='utf-8')
+            os.replace(tmp_path, target)
+
+
+def record_run(run: Dict, jsonl_path: Optional[Path] = None, textfile_path: Optional[Path] = None):
+    """Export a run record to whichever sinks are configured"""
+    if jsonl_path:
+        append_jsonl(jsonl_path, run)
+    if textfile_path:
+        update_openmetrics(textfile_path, run)
@@ -0,0 +1,159 @@
+"""
+Deduplicated, compressed pack for archived template files.
+
+archive/archive.pack holds each distinct file content once, compressed on its
+own so any entry can be read with a single seek. archive/manifest.json holds
+the index (digest -> offset, length, codec, size) and one snapshot per archive
+run mapping archived paths to digests and file modes. The pack is append-only;
+the manifest is replaced atomically after new objects are written, so an
+interrupted run never leaves the index pointing at a partial object.
+"""
+
+import fnmatch
+import hashlib
+import json
+import lzma
+import os
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+PACK_NAME = 'archive.pack'
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# zlib wins on small files (less framing overhead), lzma on large ones
+LZMA_THRESHOLD = 4096
+
+
+def compress(data: bytes) -> Tuple[str, bytes]:
+    """Return (codec, payload), storing data raw when compression does not help"""
+    if len(data) >= LZMA_THRESHOLD:
+        codec, payload = 'lzma', lzma.compress(data, preset=6)
+    else:
+        codec, payload = 'zlib', zlib.compress(data, 9)
+    if len(payload) >= len(data):
+        return 'raw', data
+    return codec, payload
+
+
+def decompress(codec: str, payload: bytes) -> bytes:
+    if codec == 'lzma':
+        return lzma.decompress(payload)
+    if codec == 'zlib':
+        return zlib.decompress(payload)
+    if codec == 'raw':
+        return payload
+    raise ValueError(f'Unknown pack codec: {codec}')
+
+
+class ArchivePack:
+    def __init__(self, archive_dir: Union[str, Path]):
+        self.archive_dir = Path(archive_dir)
+        self.pack_path = self.archive_dir / PACK_NAME
+        self.manifest_path = self.archive_dir / MANIFEST_NAME
+        self.manifest = {'version': MANIFEST_VERSION, 'objects': {}, 'snapshots': []}
+        if self.manifest_path.exists():
+            self.manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+        self._pending: Dict[str, bytes] = {}
+        self._entries: Dict[str, Dict] = {}
+
+    @property
+    def objects(self) -> Dict[str, Dict]:
+        return self.manifest['objects']
+
+    @property
+    def snapshots(self) -> List[Dict]:
+        return self.manifest['snapshots']
+
+    def _stage(self, path: Path) -> Dict:
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self.objects:
+            self._pending.setdefault(digest, data)
+        return {'digest': digest, 'mode': path.stat().st_mode & 0o777, 'size': len(data)}
+
+    def add_file(self, path: Path, arcname: str):
+        """Stage one file under arcname for the next snapshot"""
+        self._entries[arcname] = self._stage(Path(path))
+
+    def add_tree(self, root: Path, arcname: str):
+        """Stage every file under root; nothing is staged if any file fails to read"""
+        root = Path(root)
+        entries = {f'{arcname}/{path.relative_to(root).as_posix()}': self._stage(path)
+                   for path in sorted(root.rglob('*')) if path.is_file()}
+        self._entries.update(entries)
+
+    def commit(self, **info) -> Dict:
+        """Append staged objects to the pack and record a snapshot of staged paths"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.pack_path, 'ab') as pack:
+            for digest, data in self._pending.items():
+                codec, payload = compress(data)
+                offset = pack.tell()
+                pack.write(payload)
+                self.objects[digest] = {'offset': offset, 'length': len(payload),
+                                        'codec': codec, 'size': len(data)}
+            pack.flush()
+            os.fsync(pack.fileno())
+
+        snapshot = dict(info, files=self._entries)
+        self.snapshots.append(snapshot)
+        tmp_path = self.manifest_path.with_name(f'.{MANIFEST_NAME}.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps(self.manifest, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp_path, self.manifest_path)
+
+        self._pending, self._entries = {}, {}
+        return snapshot
+
+    def read(self, digest: str) -> bytes:
+        """Read and verify one object, touching only its bytes in the pack"""
+        entry = self.objects[digest]
+        with open(self.pack_path, 'rb') as pack:
+            pack.seek(entry['offset'])
+            data = decompress(entry['codec'], pack.read(entry['length']))
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f'Corrupted pack object {digest}')
+        return data
+
+    def latest_files(self) -> Dict[str, Dict]:
+        """Every archived path with its entry from the most recent snapshot containing it"""
+        files = {}
+        for snapshot in self.snapshots:
+            files.update(snapshot['files'])
+        return files
+
+    def read_path(self, arcname: str) -> Optional[bytes]:
+        """Content of the most recently archived version of arcname, or None"""
+        for snapshot in reversed(self.snapshots):
+            if arcname in snapshot['files']:
+                return self.read(snapshot['files'][arcname]['digest'])
+        return None
+
+    def restore(self, target: Path, patterns: Optional[Iterable[str]] = None,
+                overwrite: bool = False) -> List[str]:
+        """Write archived paths matching any glob in patterns under target; return those written"""
+        patterns = list(patterns or ['*'])
+        restored = []
+        for arcname, entry in sorted(self.latest_files().items()):
+            if not any(fnmatch.fnmatch(arcname, p) or arcname.startswith(p.rstrip('/') + '/') for p in patterns):
+                continue
+            path = Path(target) / arcname
+            if path.exists() and not overwrite:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.exists() or path.is_symlink():
+                # Never write through a store hardlink (or a symlink) into files other projects share
+                path.unlink()
+            path.write_bytes(self.read(entry['digest']))
+            os.chmod(path, entry['mode'])
+            restored.append(arcname)
+        return restored
+
+    def stats(self) -> Dict[str, int]:
+        """Archived bytes before and after deduplication and compression"""
+        return {
+            'original_bytes': sum(entry['size'] for snapshot in self.snapshots
+                                  for entry in snapshot['files'].values()),
+            'packed_bytes': sum(obj['length'] for obj in self.objects.values()),
+        }
@@ -0,0 +1,207 @@
+"""
+Golden-snapshot cache of fully rendered projects.
+
+For a given architecture, options and template version, every generated
+project is the same tree apart from the project name and the generation
+timestamps. The cache renders that tree once under a placeholder name
+(GOLDEN_NAME), stores its files in a content store and records which of them
+mention the name or a timestamp. New projects are then instantiated from
+the store, rewriting only the name- and time-dependent files. Rule and
+prompt files, which the content store shares anyway, are linked (reflink,
+else hardlink, else copy); every other file is the project's own to edit,
+so it is a reflink or a private copy, never a hardlink that an in-place
+write would carry into the cache and every sibling project.
+
+Snapshots are keyed on a fingerprint of the template inputs (catalog, rules,
+prompts, the scaffolder's own code), so editing any of them invalidates the
+cache without explicit flushing. Hardlinked rule and prompt files are
+read-only like other store links; ``quick_start.py --detach`` gives them
+private copies. A snapshot whose objects no longer match their hashes (one
+written through such a link) is treated as a miss and rendered again.
+"""
+
+import hashlib
+import json
+import os
+import re
+import stat
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from mvp_quickstart.manifest import MANIFEST_NAME
+from mvp_quickstart.profiles import python_module_name
+from mvp_quickstart.store import ContentStore
+
+CACHE_VERSION = 1
+
+# Placeholder project name: its raw, slug, snake and module forms all differ,
+# so each can be replaced by the matching form of the real name
+GOLDEN_NAME = 'Mvp Golden-Name'
+
+# Names whose forms appear verbatim in every output format (JSON, Python,
+# YAML, Markdown): no quoting or escaping can differ from a direct render
+CACHEABLE_NAME = re.compile(r'[A-Za-z0-9][A-Za-z0-9 _-]*')
+
+# Template inputs whose change invalidates every snapshot
+TEMPLATE_INPUTS = ('architectures.json', 'quick_start.py', '.cursor/rules', '.cursor/awesome-rules',
+                   'dev_tools/prompts', 'mvp_quickstart')
+
+PROJECT_CONFIG = '.mvp-config.json'
+# The files --store links: the only ones instantiated projects may share by hardlink
+SHARED_PREFIXES = ('.cursor/rules/', 'active_prompts/')
+ARCHIVE_INFO_PATTERN = 'archive/*_archive_info.json'
+
+
+def name_forms(project_name: str) -> Dict[str, str]:
+    """Every way the scaffolder spells the project name"""
+    return {
+        'raw': project_name,
+        'slug': project_name.lower().replace(' ', '-'),
+        'snake': project_name.lower().replace(' ', '_'),
+        'module': python_module_name(project_name),
+    }
+
+
+def time_forms(moment: datetime) -> Dict[str, str]:
+    """Every way the scaffolder records when it ran"""
+    return {'created_at': moment.isoformat(), 'last_modified': moment.isoformat(),
+            'archived_at': moment.strftime('%Y%m%d_%H%M%S')}
+
+
+def cacheable(project_name: str) -> bool:
+    return bool(CACHEABLE_NAME.fullmatch(project_name))
+
+
+def template_fingerprint(source_root: Path) -> str:
+    """Hash of the path, size and mtime of every template input: one stat per file
+
+    A zipapp's bundled template is identified by the content hash recorded
+    when it was built.
+    """
+    digest = hashlib.sha256(f'v{CACHE_VERSION}'.encode())
+    if not isinstance(source_root, (str, os.PathLike)):
+        from mvp_quickstart.bundle import bundle_id
+        digest.update(f'bundle\0{bundle_id(source_root)}'.encode())
+        return digest.hexdigest()
+    root = os.fspath(source_root)
+    for name in TEMPLATE_INPUTS:
+        top = os.path.join(root, name)
+        paths = [top] if os.path.isfile(top) else sorted(
+            os.path.join(dirpath, filename)
+            for dirpath, dirnames, filenames in os.walk(top)
+            if '__pycache__' not in dirpath
+            for filename in filenames)
+        for path in paths:
+            info = os.stat(path)
+            digest.update(f'{path[len(root):]}\0{info.st_size}\0{info.st_mtime_ns}\n'.encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.store = ContentStore(self.root)
+        self.snapshots_dir = self.root / 'snapshots'
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, source_root: Path, architecture_key: str, options: Mapping) -> str:
+        payload = json.dumps({'architecture': architecture_key, 'options': options,
+                              'template': template_fingerprint(source_root)}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def snapshot_path(self, key: str) -> Path:
+        return self.snapshots_dir / f'{key}.json'
+
+    def load(self, key: str) -> Optional[Dict]:
+        try:
+            snapshot = json.loads(self.snapshot_path(key).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        # An object written through a project's hardlink is a miss: the golden render puts it back
+        if not all(self.store.intact(entry['digest']) for entry in snapshot['files'].values()):
+            return None
+        return snapshot
+
+    def save(self, key: str, golden_root: Path, result: Mapping) -> Dict:
+        """Store the golden tree rendered under GOLDEN_NAME; result holds its steps, rules and messages"""
+        golden_root = Path(golden_root)
+        tokens = {value: role for role, value in name_forms(GOLDEN_NAME).items()}
+        config = json.loads((golden_root / PROJECT_CONFIG).read_text(encoding='utf-8'))
+        tokens.update({config[field]: field for field in ('created_at', 'last_modified')})
+        for info_path in golden_root.glob(ARCHIVE_INFO_PATTERN):
+            archived_at = json.loads(info_path.read_text(encoding='utf-8'))['archived_at']
+            tokens[archived_at] = 'archived_at'
+
+        files, dirs = {}, []
+        for dirpath, dirnames, filenames in os.walk(golden_root):
+            directory = Path(dirpath)
+            dirs += [(directory / name).relative_to(golden_root).as_posix() for name in dirnames]
+            for filename in filenames:
+                path = directory / filename
+                rel_path = path.relative_to(golden_root).as_posix()
+                if rel_path == MANIFEST_NAME:
+                    # Stat data is per project: written after instantiation
+                    continue
+                data = path.read_bytes()
+                text = data.decode('utf-8', errors='replace')
+                files[rel_path] = {
+                    'digest': self.store.put(data).name,
+                    'mode': stat.S_IMODE(path.stat().st_mode),
+                    'templated': any(token in rel_path or token in text for token in tokens),
+                }
+
+        snapshot = {'version': CACHE_VERSION, 'tokens': tokens, 'dirs': sorted(dirs), 'files': files,
+                    'result': dict(result)}
+        fd, tmp_name = tempfile.mkstemp(dir=self.snapshots_dir, prefix='.tmp-')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, sort_keys=True)
+        os.replace(tmp_name, self.snapshot_path(key))
+        return snapshot
+
+    @staticmethod
+    def replacements(snapshot: Mapping, project_name: str, moment: datetime) -> List[Tuple[str, str]]:
+        """(golden, new) pairs, longest golden string first so none clobbers a longer one"""
+        forms = dict(name_forms(project_name), **time_forms(moment))
+        return sorted(((token, forms[role]) for token, role in snapshot['tokens'].items()),
+                      key=lambda pair: -len(pair[0]))
+
+    @staticmethod
+    def substitute(text: str, replacements: List[Tuple[str, str]]) -> str:
+        for old, new in replacements:
+            text = text.replace(old, new)
+        return text
+
+    def instantiate(self, snapshot: Mapping, target: Path, project_name: str,
+                    moment: Optional[datetime] = None) -> List[Tuple[Path, int, str]]:
+        """Create the project at target; return (path, size, sha256) for each file"""
+        target = Path(target)
+        replacements = self.replacements(snapshot, project_name, moment or datetime.now())
+        dirs = snapshot['dirs']
+        # makedirs on the leaves creates every parent; one call per branch of the tree
+        leaves = [rel_path for index, rel_path in enumerate(dirs)
+                  if index + 1 == len(dirs) or not dirs[index + 1].startswith(rel_path + '/')]
+        target.mkdir(parents=True, exist_ok=True)
+        for rel_path in leaves:
+            os.makedirs(target / self.substitute(rel_path, replacements), exist_ok=True)
+
+        written = []
+        for rel_path, entry in snapshot['files'].items():
+            path = target / self.substitute(rel_path, replacements)
+            if entry['templated'] or entry['mode'] & 0o111:
+                # Private copy: rewritten content, or a mode the shared object cannot carry
+                data, digest = self.store.object_path(entry['digest']).read_bytes(), entry['digest']
+                if entry['templated']:
+                    data = self.substitute(data.decode('utf-8'), replacements).encode('utf-8')
+                    digest = hashlib.sha256(data).hexdigest()
+                path.write_bytes(data)
+                os.chmod(path, entry['mode'])
+                written.append((path, len(data), digest))
+            else:
+                if rel_path.startswith(SHARED_PREFIXES):
+                    self.store.link(entry['digest'], path)
+                else:
+                    self.store.clone(entry['digest'], path)
+                written.append((path, path.stat().st_size, entry['digest']))
+        return written
@@ -0,0 +1,228 @@
+"""
+Helpers for reading .mdc rule files.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+FrontmatterValue = Union[str, List[str]]
+
+# Cross-references between rules: markdown links to mdc:path.mdc and Cursor's
+# @rule.mdc mentions
+REFERENCE_PATTERN = re.compile(r'mdc:([\w./-]+\.mdc)|(?<![\w/@])@([\w./-]+\.mdc)')
+
+# Catalog rules list the other rules rather than depend on them
+CATALOG_RULES = frozenset({'index.mdc'})
+
+
+def content_hash(data: bytes) -> str:
+    """Return the hex sha256 digest used to key rule caches"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_frontmatter(text: str) -> Tuple[Dict[str, FrontmatterValue], Dict[str, int], int]:
+    """Parse the frontmatter block of an .mdc file.
+
+    Returns (fields, field_lines, body_start_line). Values are kept raw (quotes
+    and brackets preserved) so callers can validate the formatting; block lists
+    (``key:`` followed by ``  - item`` lines) become lists. body_start_line is 0
+    when the file has no frontmatter block.
+    """
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != '---':
+        return {}, {}, 0
+
+    fields: Dict[str, FrontmatterValue] = {}
+    field_lines: Dict[str, int] = {}
+    current_key = None
+    for index, line in enumerate(lines[1:], start=2):
+        if line.strip() == '---':
+            return fields, field_lines, index + 1
+
+        stripped = line.strip()
+        if current_key and stripped.startswith('- ') and line[:1] in (' ', '\t', '-'):
+            value = fields.get(current_key)
+            if not isinstance(value, list):
+                value = []
+            value.append(stripped[2:].strip())
+            fields[current_key] = value
+            continue
+
+        if ':' in line and not line[:1].isspace():
+            key, _, value = line.partition(':')
+            current_key = key.strip()
+            fields[current_key] = value.strip()
+            field_lines[current_key] = index
+
+    # Opening marker without a closing one
+    return fields, field_lines, -1
+
+
+def parse_references(text: str) -> List[str]:
+    """Rule paths referenced from text, as written, in order of first mention"""
+    references = []
+    for match in REFERENCE_PATTERN.finditer(text):
+        target = match.group(1) or match.group(2)
+        if target not in references:
+            references.append(target)
+    return references
+
+
+def _always_applies(text: str) -> bool:
+    fields, _, _ = parse_frontmatter(text)
+    return str(fields.get('alwaysApply', '')).strip().lower() == 'true'
+
+
+def _resolve(rule: str, target: str, rules: FrozenSet[str]) -> Optional[str]:
+    """Map a reference from rule to a rule id (path relative to the rules directory)"""
+    target = target[2:] if target.startswith('./') else target
+    if target.startswith('.cursor/rules/'):
+        return target[len('.cursor/rules/'):] if target[len('.cursor/rules/'):] in rules else None
+    relative = os.path.normpath(os.path.join(os.path.dirname(rule), target)).replace(os.sep, '/')
+    for candidate in (relative, target):
+        if candidate in rules:
+            return candidate
+    return None
+
+
+class RuleGraph:
+    """Dependency graph of the rules in one directory.
+
+    ``edges`` maps every rule id (``name.mdc`` or ``subdir/name.mdc``) to the
+    rules it references; catalog rules (CATALOG_RULES, e.g. index.mdc) have no
+    edges, since activating the index must not activate everything it lists.
+    ``always_apply`` holds rules whose frontmatter sets ``alwaysApply: true``.
+    """
+
+    def __init__(self, edges: Dict[str, Tuple[str, ...]], always_apply: FrozenSet[str]):
+        self.edges = edges
+        self.always_apply = always_apply
+        self._closures: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def closure(self, selected: Iterable[str]) -> Tuple[str, ...]:
+        """Selected rules plus everything they transitively reference, dependencies first
+
+        Cycles are broken at the edge that closes them; order is otherwise
+        deterministic (selection order, then reference order).
+        """
+        key = tuple(rule for rule in selected if rule in self.edges)
+        with self._lock:
+            cached = self._closures.get(key)
+        if cached is not None:
+            return cached
+
+        ordered: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+        for root in key:
+            if root in state:
+                continue
+            stack = [(root, iter(self.edges[root]))]
+            state[root] = 1
+            while stack:
+                rule, dependencies = stack[-1]
+                dependency = next(dependencies, None)
+                if dependency is None:
+                    stack.pop()
+                    state[rule] = 2
+                    ordered.append(rule)
+                elif dependency not in state:
+                    state[dependency] = 1
+                    stack.append((dependency, iter(self.edges[dependency])))
+
+        result = tuple(ordered)
+        with self._lock:
+            self._closures[key] = result
+        return result
+
+
+# Parsed references by rule content hash, and the resolved graph per directory
+# keyed by the (path, mtime, size) signature of its files
+_references_by_hash: Dict[str, Tuple[Tuple[str, ...], bool]] = {}
+_graphs: Dict[Union[Path, str], Tuple[FrozenSet[Tuple[str, int, int]], RuleGraph]] = {}
+_graph_lock = threading.Lock()
+
+
+def _scan(rules_dir: str) -> Dict[str, Tuple[int, int]]:
+    files = {}
+    prefix = len(rules_dir) + 1
+    pending = [rules_dir]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append(entry.path)
+                elif entry.name.endswith('.mdc'):
+                    stat = entry.stat()
+                    files[entry.path[prefix:].replace(os.sep, '/')] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def _walk(rules_dir) -> Dict[str, Tuple[int, int]]:
+    """_scan for an importlib.resources Traversable, e.g. a zipapp's bundled rules"""
+    files = {}
+    pending = [(rules_dir, '')]
+    while pending:
+        directory, prefix = pending.pop()
+        for entry in directory.iterdir():
+            if entry.is_dir():
+                pending.append((entry, f'{prefix}{entry.name}/'))
+            elif entry.name.endswith('.mdc'):
+                # Bundled files cannot change while the process runs
+                files[prefix + entry.name] = (0, 0)
+    return files
+
+
+def rule_graph(rules_dir: Path) -> RuleGraph:
+    """Return the dependency graph for rules_dir, rebuilt only when a rule file changes
+
+    Unchanged directories cost one scandir pass; changed files are re-parsed
+    only if their content hash has not been seen before. rules_dir may also be
+    a Traversable such as a zipapp's bundled rules.
+    """
+    if isinstance(rules_dir, (str, os.PathLike)):
+        rules_dir = Path(rules_dir).resolve()
+        files = _scan(str(rules_dir))
+        key = rules_dir
+    else:
+        files = _walk(rules_dir)
+        key = str(rules_dir)
+    signature = frozenset((rel_path, *stat) for rel_path, stat in files.items())
+    with _graph_lock:
+        cached = _graphs.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    parsed = {}
+    for rel_path in files:
+        data = rules_dir.joinpath(rel_path).read_bytes()
+        digest = content_hash(data)
+        with _graph_lock:
+            entry = _references_by_hash.get(digest)
+        if entry is None:
+            text = data.decode('utf-8', errors='replace')
+            entry = (tuple(parse_references(text)), _always_applies(text))
+            with _graph_lock:
+                _references_by_hash[digest] = entry
+        parsed[rel_path] = entry
+
+    rules = frozenset(files)
+    edges = {}
+    for rel_path, (references, _) in parsed.items():
+        if rel_path.rsplit('/', 1)[-1] in CATALOG_RULES:
+            references = ()
+        resolved = []
+        for target in references:
+            dependency = _resolve(rel_path, target, rules)
+            if dependency and dependency != rel_path and dependency not in resolved:
+                resolved.append(dependency)
+        edges[rel_path] = tuple(resolved)
+
+    graph = RuleGraph(edges, frozenset(rel_path for rel_path, (_, always) in parsed.items() if always))
+    with _graph_lock:
+        _graphs[key] = (signature, graph)
+    return graph
@@ -0,0 +1,91 @@
+"""
+Glob scopes for rules that do not declare their own.
+
+Awesome-cursor-rules files are plain prompts with no frontmatter, so their
+globs are inferred: first from the languages and frameworks named in the rule
+key, then from the architecture the rule was selected for (its key, packages
+and requirements). Only when neither names anything is the rule scoped to
+every file.
+"""
+
+from typing import Iterable, List, Mapping
+
+ALL_FILES = ('**/*',)
+
+# Words in rule keys, architecture keys and package names -> file globs
+KEYWORD_GLOBS = {
+    'python': ('**/*.py',),
+    'django': ('**/*.py', '**/templates/**/*.html'),
+    'fastapi': ('**/*.py',),
+    'flask': ('**/*.py', '**/templates/**/*.html'),
+    'typescript': ('**/*.ts', '**/*.tsx'),
+    'javascript': ('**/*.js', '**/*.jsx', '**/*.mjs', '**/*.cjs'),
+    'node': ('**/*.js', '**/*.ts'),
+    'express': ('**/*.js', '**/*.ts'),
+    'nestjs': ('**/*.ts',),
+    'trpc': ('**/*.ts', '**/*.tsx'),
+    'react': ('**/*.jsx', '**/*.tsx'),
+    'next': ('**/*.ts', '**/*.tsx', '**/*.js', '**/*.jsx', 'next.config.*'),
+    'nextjs': ('**/*.ts', '**/*.tsx', '**/*.js', '**/*.jsx', 'next.config.*'),
+    'remix': ('**/*.ts', '**/*.tsx', 'app/**/*'),
+    'expo': ('**/*.ts', '**/*.tsx', '**/*.js', '**/*.jsx', 'app.json'),
+    'native': ('**/*.ts', '**/*.tsx', '**/*.js', '**/*.jsx'),
+    'vue': ('**/*.vue', '**/*.ts'),
+    'nuxt': ('**/*.vue', '**/*.ts', 'nuxt.config.*'),
+    'angular': ('**/*.ts', '**/*.html', '**/*.scss'),
+    'svelte': ('**/*.svelte', '**/*.ts'),
+    'shadcn': ('**/*.tsx', 'components/**/*'),
+    'flutter': ('**/*.dart', 'pubspec.yaml'),
+    'swift': ('**/*.swift',),
+    'swiftui': ('**/*.swift',),
+    'uikit': ('**/*.swift',),
+    'android': ('**/*.kt', '**/*.kts', '**/*.xml'),
+    'compose': ('**/*.kt',),
+    'java': ('**/*.java', '**/*.gradle', 'pom.xml'),
+    'spring': ('**/*.java', '**/*.kt', '**/application*.properties', '**/application*.yml'),
+    'go': ('**/*.go', 'go.mod'),
+    'rust': ('**/*.rs', 'Cargo.toml'),
+    'ruby': ('**/*.rb', '**/*.erb', 'Gemfile'),
+    'rails': ('**/*.rb', '**/*.erb', 'Gemfile'),
+    'laravel': ('**/*.php', '**/*.blade.php', 'composer.json'),
+    'solidity': ('**/*.sol',),
+    'hardhat': ('**/*.sol', 'hardhat.config.*', 'scripts/**/*', 'test/**/*'),
+    'foundry': ('**/*.sol', 'foundry.toml'),
+    'prisma': ('**/*.prisma', 'prisma/**/*'),
+    'supabase': ('supabase/**/*', '**/*.sql'),
+    'cypress': ('cypress/**/*', '**/*.cy.*', 'cypress.config.*'),
+    'playwright': ('tests/**/*', 'e2e/**/*', '**/*.spec.*', 'playwright.config.*'),
+    'lambda': ('**/handler.*', 'functions/**/*', 'serverless.yml'),
+    'netlify': ('netlify/functions/**/*', 'netlify.toml'),
+    'vercel': ('api/**/*', 'vercel.json'),
+}
+
+
+def _keyword_globs(words: Iterable[str]) -> List[str]:
+    globs: List[str] = []
+    for word in words:
+        for glob in KEYWORD_GLOBS.get(word, ()):
+            if glob not in globs:
+                globs.append(glob)
+    return globs
+
+
+def _words(name: str) -> List[str]:
+    return [word for word in name.lower().replace('@', '').replace('/', '-').replace('_', '-').split('-') if word]
+
+
+def architecture_globs(architecture_key: str, config: Mapping) -> List[str]:
+    """Globs for the languages and file types an architecture uses"""
+    words = _words(architecture_key)
+    for package in list(config.get('packages', ())) + list(config.get('dev_dependencies', ())):
+        words += _words(package)
+    if config.get('requirements'):
+        words.append('python')
+    return _keyword_globs(words)
+
+
+def infer_globs(rule_key: str, architecture_key: str = '', config: Mapping = None) -> List[str]:
+    """Globs for an awesome rule: from its key, else the architecture, else every file"""
+    return (_keyword_globs(_words(rule_key))
+            or architecture_globs(architecture_key, config or {})
+            or list(ALL_FILES))
@@ -0,0 +1,187 @@
+"""
+Content-addressed store for generated rule and prompt files.
+
+Objects live at <store>/objects/<aa>/<sha256> and are read-only. Project files
+are materialized from them with, in order of preference:
+
+- a reflink (FICLONE), a private copy-on-write clone on btrfs/XFS;
+- a hardlink, which shares the inode and its page cache across projects. The
+  link is read-only; editors that save by writing a new file and renaming it
+  over the old one break the link naturally, and ``detach`` gives a file its
+  own writable copy for tools that write in place;
+- a plain copy, when the store is on another filesystem.
+
+A hardlink is not copy-on-write: its 0o444 mode is the only protection, and
+it stops neither root nor a tool that chmods the file and writes in place.
+Such a write changes the store object and every project linked to it. The
+store therefore re-hashes an object the first time each instance uses it:
+put() replaces a corrupted object with a fresh inode, and link() and clone()
+refuse one rather than spread it. Projects already linked to the old inode
+keep the changed bytes; ``detach`` them before editing in place.
+"""
+
+import errno
+import hashlib
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Set, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+FICLONE = 0x40049409
+UNSUPPORTED_REFLINK = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV}
+OBJECT_MODE = 0o444
+
+
+class ContentStore:
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.link_counts: Dict[str, int] = {'reflink': 0, 'hardlink': 0, 'copy': 0}
+        self.reflinks = True
+        # Objects this instance has hashed and found intact
+        self.verified: Set[str] = set()
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def intact(self, digest: str) -> bool:
+        """Whether the object exists and still hashes to its name; checked once per instance"""
+        if digest not in self.verified:
+            try:
+                data = self.object_path(digest).read_bytes()
+            except FileNotFoundError:
+                return False
+            if hashlib.sha256(data).hexdigest() != digest:
+                return False
+            self.verified.add(digest)
+        return True
+
+    def put(self, data: bytes) -> Path:
+        """Store data (idempotent, safe across concurrent writers) and return its object path"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        if self.intact(digest):
+            return path
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_name, OBJECT_MODE)
+            # A new inode: projects linked to a corrupted object keep it, new links get these bytes
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        self.verified.add(digest)
+        return path
+
+    def checked_path(self, digest: str) -> Path:
+        """The object's path, or ValueError when it is missing or was written through a link"""
+        if not self.intact(digest):
+            raise ValueError(f'Store object {digest} is missing or no longer matches its hash')
+        return self.object_path(digest)
+
+    def materialize(self, data: Union[bytes, str], target: Path) -> str:
+        """Place data at target via the store; return 'reflink', 'hardlink' or 'copy'"""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return self.link(self.put(data).name, target)
+
+    def link(self, digest: str, target: Path) -> str:
+        """Place a stored object at target; return 'reflink', 'hardlink' or 'copy'"""
+        source = self.checked_path(digest)
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists() or target.is_symlink():
+            target.unlink()
+
+        method = self._reflink(source, target) or self._hardlink(source, target) or self._copy(source, target)
+        self.link_counts[method] += 1
+        return method
+
+    def clone(self, digest: str, target: Path) -> str:
+        """Place a private copy of a stored object at target; return 'reflink' or 'copy'
+
+        For files the project is expected to edit: never a hardlink, whose
+        in-place writes would reach the store and every project sharing it.
+        """
+        source = self.checked_path(digest)
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists() or target.is_symlink():
+            target.unlink()
+
+        method = self._reflink(source, target) or self._copy(source, target)
+        self.link_counts[method] += 1
+        return method
+
+    def _reflink(self, source: Path, target: Path) -> str:
+        if fcntl is None or not self.reflinks:
+            return ''
+        try:
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            os.chmod(target, 0o644)
+            return 'reflink'
+        except OSError as e:
+            if target.exists():
+                target.unlink()
+            if e.errno in UNSUPPORTED_REFLINK:
+                # The filesystem cannot clone at all: stop trying for this store
+                self.reflinks = False
+            return ''
+
+    @staticmethod
+    def _hardlink(source: Path, target: Path) -> str:
+        try:
+            os.link(source, target)
+            return 'hardlink'
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                raise
+            return ''
+
+    @staticmethod
+    def _copy(source: Path, target: Path) -> str:
+        target.write_bytes(source.read_bytes())
+        os.chmod(target, 0o644)
+        return 'copy'
+
+    def verify(self) -> List[Path]:
+        """Return objects whose content no longer matches their hash"""
+        corrupted = []
+        for path in self.objects_dir.glob('*/*'):
+            if path.name.startswith('.tmp-'):
+                continue
+            if hashlib.sha256(path.read_bytes()).hexdigest() != path.name:
+                corrupted.append(path)
+        return corrupted
+
+
+def detach(path: Union[str, Path]) -> bool:
+    """Replace a hardlinked store file with a private writable copy.
+
+    Returns True if the file was shared and has been detached.
+    """
+    path = Path(path)
+    info = path.stat()
+    if info.st_nlink <= 1 and info.st_mode & stat.S_IWUSR:
+        return False
+
+    data = path.read_bytes()
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.chmod(tmp_name, 0o644)
+    os.replace(tmp_name, path)
+    return True
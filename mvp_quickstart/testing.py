@@ -0,0 +1,176 @@
+"""
+Test runner configuration sized for parallel runs.
+
+Each runner the architecture's scripts use gets a config that spreads tests
+over the machine's cores and keeps the runner's own result cache:
+
+- Jest: every core on CI runners, all but one locally, with the cache
+  directory (transform results and per-file timings, which Jest uses to start
+  the slowest files first) under node_modules/.cache where CI restores it;
+- pytest: pytest-xdist with one worker per core and work stealing, and the
+  previous run's failures first from .pytest_cache;
+- Playwright: test-level parallelism, so workers and CI shards get even
+  shares, blob reports that CI merges across shards, and ``--last-failed``;
+- Cypress: cypress-split, which assigns specs to CI shards by the durations
+  in cypress/timings.json. CI merges each shard's timings into an artifact
+  to commit, so the balance follows the suite as it grows.
+
+The CI side (shard matrices and cache steps) is in mvp_quickstart.ci.
+"""
+
+import json
+from typing import Dict, List, Mapping
+
+from mvp_quickstart.profiles import backend_kind, python_module_name
+
+JEST_CONFIG_PATH = 'jest.config.cjs'
+JEST_CACHE_DIRECTORY = 'node_modules/.cache/jest'
+PYTEST_CONFIG_PATH = 'pytest.ini'
+PLAYWRIGHT_CONFIG_PATH = 'playwright.config.ts'
+PLAYWRIGHT_TEST_DIR = 'e2e'
+CYPRESS_CONFIG_PATH = 'cypress.config.js'
+CYPRESS_TIMINGS_PATH = 'cypress/timings.json'
+
+# Plugins the generated configs load
+RUNNER_DEV_DEPENDENCIES = {
+    'cypress': {'cypress-split': '^1.24.0'},
+}
+
+# Directories pytest must not collect; archive/ holds the template's own tests
+PYTEST_IGNORED = ('.*', 'archive', 'build', 'dist', 'node_modules', 'venv', '*.egg')
+
+JEST_CONFIG = '''const os = require('node:os')
+
+const cores = typeof os.availableParallelism === 'function' ? os.availableParallelism() : os.cpus().length
+
+/** @type {{import('jest').Config}} */
+module.exports = {{
+  // CI runners are dedicated to the run; locally one core stays free for the editor and dev server
+  maxWorkers: process.env.CI ? cores : Math.max(1, cores - 1),
+  // Transform cache and per-file timings: Jest starts the slowest files first. CI restores this directory.
+  cacheDirectory: '<rootDir>/{cache_directory}',
+  // Restart a worker that has grown past this instead of letting it slow down every later file
+  workerIdleMemoryLimit: '512MB',
+  testPathIgnorePatterns: {ignored},
+}}
+'''
+
+PYTEST_CONFIG = '''[pytest]
+# -n auto: one pytest-xdist worker per CPU core; worksteal moves queued tests
+# from busy workers to idle ones, so a few slow tests do not hold up the run.
+# --ff: the failures .pytest_cache recorded last time run first (--lf runs only them).
+addopts = -n auto --dist worksteal --ff
+norecursedirs = {ignored}
+{django}'''
+
+PLAYWRIGHT_CONFIG = '''import {{ defineConfig, devices }} from '@playwright/test'
+
+export default defineConfig({{
+  testDir: './{test_dir}',
+  // Split by test rather than by file, so workers and CI shards get even shares
+  fullyParallel: true,
+  forbidOnly: !!process.env.CI,
+  retries: process.env.CI ? 2 : 0,
+  // Percentages of the CPU cores; locally half of them are left to the app under test
+  workers: process.env.CI ? '100%' : '50%',
+  // Each CI shard writes a blob report, merged into one HTML report after all shards finish
+  reporter: process.env.CI ? [['blob'], ['github']] : [['html', {{ open: 'never' }}]],
+  use: {{
+    baseURL: process.env.PLAYWRIGHT_BASE_URL ?? 'http://localhost:3000',
+    trace: 'on-first-retry',
+  }},
+  projects: [{{ name: 'chromium', use: {{ ...devices['Desktop Chrome'] }} }}],
+}})
+'''
+
+CYPRESS_CONFIG = '''const {{ defineConfig }} = require('cypress')
+const cypressSplit = require('cypress-split')
+
+module.exports = defineConfig({{
+  e2e: {{
+    baseUrl: 'http://localhost:3000',
+    setupNodeEvents(on, config) {{
+      // With SPLIT and SPLIT_INDEX set (the CI shard matrix sets them) only this
+      // shard's specs run, balanced by the durations in SPLIT_FILE ({timings}).
+      // Without them every spec runs.
+      cypressSplit(on, config)
+      return config
+    }},
+  }},
+}})
+'''
+
+
+def runners(config: Mapping) -> List[str]:
+    """Test runners this module configures, of jest, pytest, playwright and cypress"""
+    scripts = config.get('scripts', {})
+    packages = set(config.get('packages', ())) | set(config.get('dev_dependencies', ()))
+    test = scripts.get('test', '').split()
+    found = []
+    if 'jest' in test:
+        found.append('jest')
+    # pytest.ini adds xdist options, so pytest-xdist has to land in requirements.txt
+    if 'pytest' in test and config.get('requirements'):
+        found.append('pytest')
+    if '@playwright/test' in packages:
+        found.append('playwright')
+    if 'cypress' in packages:
+        found.append('cypress')
+    return found
+
+
+def jest_config() -> str:
+    ignored = ['/node_modules/', '/archive/', '/dist/', f'/{PLAYWRIGHT_TEST_DIR}/', '/cypress/']
+    return JEST_CONFIG.format(cache_directory=JEST_CACHE_DIRECTORY,
+                              ignored='[' + ', '.join(f"'{pattern}'" for pattern in ignored) + ']')
+
+
+def pytest_config(settings_module: str = '') -> str:
+    django = f'DJANGO_SETTINGS_MODULE = {settings_module}\n' if settings_module else ''
+    return PYTEST_CONFIG.format(ignored=' '.join(PYTEST_IGNORED), django=django)
+
+
+def runner_files(architecture_key: str, config: Mapping, project_name: str,
+                 profile: str = 'default') -> Dict[str, str]:
+    """Runner configs by relative path; empty for architectures without a runner configured here"""
+    files = {}
+    found = runners(config)
+    if 'jest' in found:
+        files[JEST_CONFIG_PATH] = jest_config()
+    if 'pytest' in found:
+        settings_module = ''
+        if profile == 'performance' and backend_kind(architecture_key) == 'django':
+            # Only the performance starter writes a settings module
+            settings_module = f'{python_module_name(project_name)}.settings'
+        files[PYTEST_CONFIG_PATH] = pytest_config(settings_module)
+    if 'playwright' in found:
+        files[PLAYWRIGHT_CONFIG_PATH] = PLAYWRIGHT_CONFIG.format(test_dir=PLAYWRIGHT_TEST_DIR)
+    if 'cypress' in found:
+        files[CYPRESS_CONFIG_PATH] = CYPRESS_CONFIG.format(timings=CYPRESS_TIMINGS_PATH)
+        # Specs missing from the timings are spread by count until a CI run records them
+        files[CYPRESS_TIMINGS_PATH] = json.dumps({'durations': []}, indent=2) + '\n'
+    return files
+
+
+def runner_scripts(config: Mapping) -> Dict[str, str]:
+    """package.json scripts that rerun only what the runner's cache marks as affected or failed"""
+    found = runners(config)
+    scripts = {}
+    if 'jest' in found:
+        scripts['test:changed'] = 'jest --onlyChanged'
+    if 'playwright' in found:
+        scripts['test:e2e:failed'] = 'playwright test --last-failed'
+    return scripts
+
+
+def runner_dev_dependencies(config: Mapping) -> Dict[str, str]:
+    dependencies = {}
+    for runner in runners(config):
+        dependencies.update(RUNNER_DEV_DEPENDENCIES.get(runner, {}))
+    return dependencies
+
+
+def runner_requirements(config: Mapping) -> List[str]:
+    """Requirements the generated pytest.ini needs beyond the catalog's"""
+    listed = {requirement.split('[')[0].lower() for requirement in config.get('requirements', ())}
+    return ['pytest-xdist'] if 'pytest' in runners(config) and 'pytest-xdist' not in listed else []
@@ -0,0 +1,222 @@
+"""
+Performance defaults for .env.example, sized for a deployment.
+
+Frameworks ship defaults for the smallest machine they might run on: one
+Gunicorn worker, a 4-thread libuv pool, V8's heap limit, connection pools
+sized without regard to how many processes share the database. The values
+here are computed from a deployment size (CPUs and memory): by default the
+scaffolding host's, including container cgroup limits, or a declared target
+such as "2x4g" or "large".
+
+Which variables apply depends on the runtimes an architecture uses, read
+from its key, packages and requirements; a stack like django-react gets both
+the Python server and the Node build variables.
+"""
+
+import math
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# Named target sizes: (CPUs, memory in MB)
+SIZE_PRESETS = {
+    'small': (1, 1024),
+    'medium': (2, 4096),
+    'large': (4, 8192),
+    'xlarge': (8, 16384),
+}
+SIZE_PATTERN = re.compile(r'^(\d+)\s*x\s*(\d+(?:\.\d+)?)\s*(g|gb|gi|m|mb|mi)?$', re.IGNORECASE)
+
+# Used when the platform does not report physical memory
+DEFAULT_MEMORY_MB = 4096
+
+# Connections all processes may hold together: PostgreSQL's default
+# max_connections (100) less headroom for migrations and admin sessions
+DB_CONNECTION_BUDGET = 80
+
+# Resident memory to plan per server process
+WORKER_MEMORY_MB = {'python': 200, 'node': 300}
+
+NODE_SERVER_PACKAGES = {'express', '@nestjs/core', 'next', 'nuxt', '@remix-run/node', 'fastify', 'koa',
+                        '@trpc/server'}
+PYTHON_ASYNC_SERVERS = {'fastapi', 'starlette', 'uvicorn'}
+SERVERLESS_WORDS = {'lambda', 'vercel', 'netlify', 'functions', 'serverless'}
+
+
+@dataclass(frozen=True)
+class DeploymentSize:
+    cpus: int
+    memory_mb: int
+    source: str = 'host'
+
+    @property
+    def spec(self) -> str:
+        """The size as a --target-size value"""
+        return f'{self.cpus}x{self.memory_mb}m'
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _cgroup_value(path: str) -> Optional[str]:
+    try:
+        return Path(path).read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+
+
+def detect_host() -> DeploymentSize:
+    """CPUs and memory available to this process, honouring cgroup v2 limits"""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+    quota = (_cgroup_value('/sys/fs/cgroup/cpu.max') or 'max').split()
+    if quota[0] != 'max' and len(quota) == 2:
+        cpus = min(cpus, max(1, math.ceil(int(quota[0]) / int(quota[1]))))
+
+    try:
+        memory_mb = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        memory_mb = DEFAULT_MEMORY_MB
+    limit = _cgroup_value('/sys/fs/cgroup/memory.max')
+    if limit and limit.isdigit():
+        memory_mb = min(memory_mb, int(limit) // (1024 * 1024))
+    return DeploymentSize(cpus, max(256, memory_mb), 'host')
+
+
+def parse_size(spec: str) -> DeploymentSize:
+    """'2x4g', '4x8192m', a preset name ('small' .. 'xlarge') or 'host'"""
+    spec = spec.strip().lower()
+    if spec == 'host':
+        return detect_host()
+    if spec in SIZE_PRESETS:
+        return DeploymentSize(*SIZE_PRESETS[spec], source=spec)
+    match = SIZE_PATTERN.match(spec)
+    if not match or int(match.group(1)) < 1:
+        raise ValueError(f"Invalid target size '{spec}': use CPUSxMEMORY (e.g. 2x4g, 4x8192m) "
+                         f"or one of {', '.join(SIZE_PRESETS)}")
+    memory = float(match.group(2))
+    memory_mb = int(memory * 1024) if (match.group(3) or 'g').startswith('g') else int(memory)
+    return DeploymentSize(int(match.group(1)), memory_mb, 'target')
+
+
+def resolve_size(target_size: Optional[str] = None) -> DeploymentSize:
+    return parse_size(target_size) if target_size else detect_host()
+
+
+def _words(architecture_key: str) -> set:
+    return set(re.split(r'[-_]', architecture_key.lower()))
+
+
+def requirement_names(config: Mapping) -> set:
+    return {re.split(r'[\[<>=~]', requirement)[0].lower() for requirement in config.get('requirements', ())}
+
+
+def runtimes(architecture_key: str, config: Mapping) -> List[str]:
+    """Runtimes to tune: python-async, python-sync, node-server, node-build,
+    serverless, go, rust, jvm, ruby"""
+    words = _words(architecture_key)
+    packages = set(config.get('packages', ()))
+    requirements = requirement_names(config)
+
+    if words & SERVERLESS_WORDS:
+        return ['serverless']
+    found = []
+    if requirements & {'django', 'flask'} or ('gunicorn' in requirements and not requirements & PYTHON_ASYNC_SERVERS):
+        found.append('python-sync')
+    elif requirements & PYTHON_ASYNC_SERVERS:
+        found.append('python-async')
+    if packages & NODE_SERVER_PACKAGES or words & {'expressjs', 'nestjs'}:
+        found.append('node-server')
+    elif packages:
+        found.append('node-build')
+    for word, runtime in (('go', 'go'), ('rust', 'rust'), ('springboot', 'jvm'), ('rails', 'ruby')):
+        if word in words:
+            found.append(runtime)
+    return found
+
+
+def uses_python(architecture_key: str, config: Mapping) -> bool:
+    """Whether the project runs Python code, servers and serverless functions alike"""
+    scripts = ' '.join(config.get('scripts', {}).values())
+    # Requirements alone are not enough: flutter lists its SDK there
+    return any(runtime.startswith('python') for runtime in runtimes(architecture_key, config)) or (
+        bool(config.get('requirements')) and 'python' in scripts)
+
+
+def _clamp(value: float, low: int, high: int) -> int:
+    return int(max(low, min(high, value)))
+
+
+def db_pool(workers: int, per_worker_concurrency: int) -> Tuple[int, int]:
+    """Pool size and overflow per process so all processes fit the connection budget"""
+    share = max(2, DB_CONNECTION_BUDGET // workers)
+    pool = min(per_worker_concurrency, share)
+    return pool, max(0, min(pool, share - pool))
+
+
+def node_workers(size: DeploymentSize) -> int:
+    """Node server processes (cluster workers or replicas) the size has cores and memory for"""
+    return min(size.cpus, max(1, int(size.memory_mb * 0.8) // WORKER_MEMORY_MB['node']))
+
+
+def performance_env(architecture_key: str, config: Mapping, size: DeploymentSize) -> Dict[str, str]:
+    """Tuning variables for .env.example, in the {'# comment': '', NAME: value} form"""
+    found = runtimes(architecture_key, config)
+    if not found:
+        return {}
+    cpus = f"{size.cpus} CPU{'' if size.cpus == 1 else 's'}"
+    env = {f'# Performance tuning (sized for {cpus} / {size.memory_mb} MB; see --target-size)': ''}
+
+    if 'python-async' in found or 'python-sync' in found:
+        by_memory = max(1, int(size.memory_mb * 0.8) // WORKER_MEMORY_MB['python'])
+        if 'python-async' in found:
+            workers, concurrency = min(size.cpus, by_memory), 10
+        else:
+            workers, concurrency = min(2 * size.cpus + 1, by_memory), 4
+            env['GUNICORN_THREADS'] = str(concurrency)
+        pool, overflow = db_pool(workers, concurrency)
+        env.update({
+            'WEB_CONCURRENCY': str(workers),
+            'DB_POOL_SIZE': str(pool),
+            'DB_MAX_OVERFLOW': str(overflow),
+            'REQUEST_TIMEOUT_SECONDS': '30',
+            'KEEPALIVE_SECONDS': '5',
+        })
+        if 'django' in requirement_names(config):
+            env['CONN_MAX_AGE'] = '600'
+
+    if 'node-server' in found:
+        workers = node_workers(size)
+        heap = _clamp(size.memory_mb * 0.75 / workers, 256, 8192)
+        pool, _ = db_pool(workers, 10)
+        env.setdefault('WEB_CONCURRENCY', str(workers))
+        env.update({
+            'NODE_OPTIONS': f'--max-old-space-size={heap}',
+            'UV_THREADPOOL_SIZE': str(_clamp(size.cpus * 2, 4, 128)),
+            'DB_POOL_MAX': str(pool),
+            'REQUEST_TIMEOUT_MS': '30000',
+            # Above load balancers' 60s idle timeout, so they never reuse a closed socket
+            'KEEP_ALIVE_TIMEOUT_MS': '65000',
+            'HEADERS_TIMEOUT_MS': '66000',
+        })
+    elif 'node-build' in found:
+        env['NODE_OPTIONS'] = f'--max-old-space-size={_clamp(size.memory_mb // 2, 1024, 8192)}'
+
+    if 'serverless' in found:
+        # Each concurrent invocation is its own instance: one connection apiece
+        env.update({'DB_POOL_SIZE': '1', 'DB_MAX_OVERFLOW': '0', 'REQUEST_TIMEOUT_SECONDS': '10'})
+    if 'go' in found:
+        env.update({'GOMAXPROCS': str(size.cpus), 'GOMEMLIMIT': f'{int(size.memory_mb * 0.9)}MiB'})
+    if 'rust' in found:
+        env['TOKIO_WORKER_THREADS'] = str(size.cpus)
+    if 'jvm' in found:
+        env.update({
+            'JAVA_TOOL_OPTIONS': f'-XX:ActiveProcessorCount={size.cpus} -XX:MaxRAMPercentage=75.0',
+            'SERVER_TOMCAT_THREADS_MAX': str(_clamp(size.cpus * 50, 50, 400)),
+            'SPRING_DATASOURCE_HIKARI_MAXIMUM_POOL_SIZE': str(min(DB_CONNECTION_BUDGET, size.cpus * 2 + 1)),
+        })
+    if 'ruby' in found:
+        workers = min(size.cpus, max(1, int(size.memory_mb * 0.8) // 400))
+        env.update({'WEB_CONCURRENCY': str(workers), 'RAILS_MAX_THREADS': '5'})
+    return env
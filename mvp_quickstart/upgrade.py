@@ -0,0 +1,134 @@
+"""
+Three-way merge of regenerated template output into an existing project.
+
+The base is what the scaffolder generated last time (the .mvp-base.json
+snapshot), "ours" is the project's current file and "theirs" is what the
+current template renders. Files whose rendered output did not change are never
+read or written, so upgrading a project only costs the files the template
+actually touched.
+"""
+
+import difflib
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CONFLICT_START = '<<<<<<< local\n'
+CONFLICT_SEPARATOR = '=======\n'
+CONFLICT_END = '>>>>>>> template\n'
+
+
+def _hunks(base: List[str], other: List[str]) -> List[Tuple[int, int, List[str]]]:
+    """(base_start, base_end, replacement_lines) for each change from base to other"""
+    matcher = difflib.SequenceMatcher(None, base, other, autojunk=False)
+    return [(i1, i2, other[j1:j2]) for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal']
+
+
+def _apply(base: List[str], hunks: List[Tuple[int, int, List[str]]], start: int, end: int) -> List[str]:
+    lines, position = [], start
+    for hunk_start, hunk_end, replacement in hunks:
+        lines += base[position:hunk_start] + replacement
+        position = hunk_end
+    return lines + base[position:end]
+
+
+def _terminated(lines: List[str]) -> List[str]:
+    if lines and not lines[-1].endswith('\n'):
+        return lines[:-1] + [lines[-1] + '\n']
+    return lines
+
+
+def merge3(base: str, ours: str, theirs: str) -> Tuple[str, int]:
+    """Line-based three-way merge; return the merged text and the number of conflicts
+
+    Changes to the same or adjacent base lines conflict unless both sides made
+    the same change; conflicts are written with git-style markers.
+    """
+    base_lines = base.splitlines(keepends=True)
+    pending = sorted([(s, e, r, 'ours') for s, e, r in _hunks(base_lines, ours.splitlines(keepends=True))] +
+                     [(s, e, r, 'theirs') for s, e, r in _hunks(base_lines, theirs.splitlines(keepends=True))],
+                     key=lambda hunk: (hunk[0], hunk[1]))
+
+    merged, conflicts, position, index = [], 0, 0, 0
+    while index < len(pending):
+        region_start, region_end = pending[index][0], pending[index][1]
+        region = {'ours': [], 'theirs': []}
+        while index < len(pending) and pending[index][0] <= region_end:
+            start, end, replacement, side = pending[index]
+            region[side].append((start, end, replacement))
+            region_end = max(region_end, end)
+            index += 1
+
+        merged += base_lines[position:region_start]
+        ours_lines = _apply(base_lines, region['ours'], region_start, region_end)
+        theirs_lines = _apply(base_lines, region['theirs'], region_start, region_end)
+        if not region['theirs']:
+            merged += ours_lines
+        elif not region['ours'] or ours_lines == theirs_lines:
+            merged += theirs_lines
+        else:
+            conflicts += 1
+            merged += ([CONFLICT_START] + _terminated(ours_lines) + [CONFLICT_SEPARATOR] +
+                       _terminated(theirs_lines) + [CONFLICT_END])
+        position = region_end
+
+    merged += base_lines[position:]
+    return ''.join(merged), conflicts
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _replace(path: Path, content: str):
+    """Atomically replace path, keeping its mode; also detaches store hardlinks"""
+    mode = (path.stat().st_mode & 0o777) | 0o200 if path.exists() else 0o644
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def apply_upgrade(project_root: Path, base: Dict[str, str], rendered: Dict[str, str],
+                  dry_run: bool = False) -> List[Dict]:
+    """Merge rendered template output into project_root; return one entry per touched file
+
+    Statuses: added, updated, merged, conflict, current (already matches),
+    deleted-locally (left deleted) and obsolete (no longer generated, left in place).
+    """
+    results = []
+    for rel_path in sorted(set(base) | set(rendered)):
+        theirs, ancestor = rendered.get(rel_path), base.get(rel_path)
+        if theirs == ancestor:
+            continue
+
+        path = project_root / rel_path
+        ours = _read(path) if path.exists() else None
+        content, conflicts = theirs, 0
+        if theirs is None:
+            status = 'obsolete'
+        elif ours == theirs:
+            status = 'current'
+        elif ours is None:
+            status = 'added' if ancestor is None else 'deleted-locally'
+        elif ours == ancestor:
+            status = 'updated'
+        else:
+            content, conflicts = merge3(ancestor or '', ours, theirs)
+            status = 'conflict' if conflicts else 'merged'
+
+        if status in ('added', 'updated', 'merged', 'conflict') and not dry_run:
+            _replace(path, content)
+        results.append({'path': rel_path, 'status': status, 'conflicts': conflicts})
+    return results
@@ -0,0 +1,236 @@
+"""
+Validation for .mdc rule files and architectures.json cross-references.
+
+Rules are checked against the requirements in .cursor/rules/mdc-validator.mdc and
+the catalog is checked against the rules, prompts and awesome-rule mappings it
+refers to. Results are cached by content hash so re-running over an unchanged
+tree only stats the files.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .rules import content_hash, parse_frontmatter
+
+CACHE_VERSION = 1
+CACHE_FILENAME = '.validate-cache.json'
+
+Diagnostic = Dict[str, object]
+
+
+def _diagnostic(path: str, line: int, severity: str, code: str, message: str) -> Diagnostic:
+    return {'path': path, 'line': line, 'severity': severity, 'code': code, 'message': message}
+
+
+def check_rule(rel_path: str, data: bytes) -> List[Diagnostic]:
+    """Check a single .mdc file against the MDC validator guidelines"""
+    if len(data.strip()) <= 1:
+        return [_diagnostic(rel_path, 1, 'error', 'MDC008', 'Rule file is empty or corrupted')]
+
+    text = data.decode('utf-8', errors='replace')
+    fields, field_lines, body_start = parse_frontmatter(text)
+    diagnostics = []
+
+    if body_start == 0:
+        return [_diagnostic(rel_path, 1, 'error', 'MDC001', 'Missing frontmatter block (expected leading ---)')]
+    if body_start < 0:
+        diagnostics.append(_diagnostic(rel_path, 1, 'error', 'MDC002', 'Frontmatter block is not closed with ---'))
+
+    description = fields.get('description', '')
+    if not isinstance(description, str) or not description.strip('"\' '):
+        diagnostics.append(_diagnostic(rel_path, field_lines.get('description', 1), 'error', 'MDC003',
+                                       'description field is missing or empty'))
+
+    always_apply = fields.get('alwaysApply', '')
+    if isinstance(always_apply, str) and always_apply and always_apply not in ('true', 'false'):
+        diagnostics.append(_diagnostic(rel_path, field_lines['alwaysApply'], 'error', 'MDC006',
+                                       f'alwaysApply must be true or false, got {always_apply!r}'))
+
+    globs = fields.get('globs', '')
+    if not globs and always_apply != 'true':
+        diagnostics.append(_diagnostic(rel_path, field_lines.get('globs', field_lines.get('alwaysApply', 1)),
+                                       'error', 'MDC004', 'Rule needs a globs pattern or alwaysApply: true'))
+
+    patterns = globs if isinstance(globs, list) else [globs] if globs else []
+    if isinstance(globs, list) or any(p[:1] in ('"', "'", '[') for p in patterns):
+        diagnostics.append(_diagnostic(rel_path, field_lines.get('globs', 1), 'error', 'MDC005',
+                                       'globs must be a plain comma-separated pattern without brackets or quotes'))
+
+    if not data.endswith(b'\n'):
+        diagnostics.append(_diagnostic(rel_path, text.count('\n') + 1, 'warning', 'MDC007',
+                                       'File should end with a newline'))
+
+    return diagnostics
+
+
+def _catalog_line(text: str, key: str, occurrence: int = 0) -> int:
+    """Best-effort line number of the nth '"key": {' entry in architectures.json"""
+    needle = f'"{key}": {{'
+    offset = -1
+    for _ in range(occurrence + 1):
+        offset = text.find(needle, offset + 1)
+        if offset < 0:
+            return 1
+    return text.count('\n', 0, offset) + 1
+
+
+def _iter_catalog_entries(data: Dict) -> Iterable[Tuple[str, Dict]]:
+    """Yield (key, config) pairs in the same order flatten_architectures uses"""
+    for category_data in data.get('categories', {}).values():
+        yield from category_data.get('architectures', {}).items()
+    yield from data.get('popular_stacks', {}).get('stacks', {}).items()
+    yield from data.get('presets', {}).items()
+
+
+def check_catalog(root: Path, arch_text: str, mappings: Dict[str, str]) -> List[Diagnostic]:
+    """Check architectures.json entries against rules, prompts and mappings"""
+    rel_path = 'architectures.json'
+    try:
+        data = json.loads(arch_text)
+    except json.JSONDecodeError as e:
+        return [_diagnostic(rel_path, e.lineno, 'error', 'CAT001', f'Invalid JSON: {e.msg}')]
+
+    rules_dir = root / '.cursor' / 'rules'
+    prompts_dir = root / 'dev_tools' / 'prompts'
+    awesome_rules_dir = root / '.cursor' / 'awesome-rules'
+
+    diagnostics = []
+    seen: Dict[str, int] = {}
+    for arch_key, config in _iter_catalog_entries(data):
+        occurrence = seen.get(arch_key, 0)
+        seen[arch_key] = occurrence + 1
+        line = _catalog_line(arch_text, arch_key, occurrence)
+
+        if occurrence:
+            diagnostics.append(_diagnostic(rel_path, line, 'warning', 'CAT006',
+                                           f'Duplicate architecture key {arch_key!r} overrides an earlier entry'))
+        if not config.get('name'):
+            diagnostics.append(_diagnostic(rel_path, line, 'error', 'CAT002',
+                                           f'{arch_key}: missing name'))
+
+        for rule in config.get('local_rules', config.get('rules', [])):
+            if not (rules_dir / rule).is_file():
+                diagnostics.append(_diagnostic(rel_path, line, 'error', 'CAT003',
+                                               f'{arch_key}: local rule {rule!r} not found in .cursor/rules'))
+
+        for awesome_rule in config.get('awesome_rules', []):
+            if awesome_rule not in mappings:
+                diagnostics.append(_diagnostic(rel_path, line, 'error', 'CAT004',
+                                               f'{arch_key}: awesome rule {awesome_rule!r} has no rule mapping'))
+            elif awesome_rules_dir.exists() and not (awesome_rules_dir / mappings[awesome_rule]).is_file():
+                diagnostics.append(_diagnostic(rel_path, line, 'warning', 'CAT007',
+                                               f'{arch_key}: mapped file {mappings[awesome_rule]!r} '
+                                               'not found in .cursor/awesome-rules'))
+
+        for prompt in config.get('prompts', []):
+            if not (prompts_dir / prompt).is_file():
+                diagnostics.append(_diagnostic(rel_path, line, 'error', 'CAT005',
+                                               f'{arch_key}: prompt {prompt!r} not found in dev_tools/prompts'))
+
+    return diagnostics
+
+
+def _catalog_cache_key(root: Path, arch_bytes: bytes, mappings: Dict[str, str]) -> str:
+    """Hash everything check_catalog depends on besides the catalog itself"""
+    rules_dir = root / '.cursor' / 'rules'
+    prompts_dir = root / 'dev_tools' / 'prompts'
+    awesome_rules_dir = root / '.cursor' / 'awesome-rules'
+    inputs = {
+        'catalog': content_hash(arch_bytes),
+        'mappings': sorted(mappings.items()),
+        'rules': sorted(p.name for p in rules_dir.glob('*.mdc')) if rules_dir.exists() else [],
+        'prompts': sorted(str(p.relative_to(prompts_dir)) for p in prompts_dir.rglob('*'))
+        if prompts_dir.exists() else [],
+        'awesome': sorted(target for target in mappings.values() if (awesome_rules_dir / target).is_file())
+        if awesome_rules_dir.exists() else None,
+    }
+    return content_hash(json.dumps(inputs, sort_keys=True).encode('utf-8'))
+
+
+def _load_cache(cache_path: Optional[Path]) -> Dict:
+    if cache_path and cache_path.exists():
+        try:
+            cache = json.loads(cache_path.read_text(encoding='utf-8'))
+            if cache.get('version') == CACHE_VERSION:
+                return cache
+        except (OSError, ValueError):
+            pass
+    return {'version': CACHE_VERSION, 'rules': {}, 'catalog': {}}
+
+
+def _save_cache(cache_path: Optional[Path], cache: Dict):
+    if not cache_path:
+        return
+    try:
+        tmp_path = cache_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(cache, sort_keys=True), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _validate_rule_file(root: Path, path: Path, cached: Optional[Dict]) -> Tuple[str, Dict]:
+    """Validate one rule file, reusing the cached result when stat or hash match"""
+    rel_path = path.relative_to(root).as_posix()
+    stat = path.stat()
+    signature = [stat.st_mtime_ns, stat.st_size]
+    if cached and cached.get('stat') == signature:
+        return rel_path, cached
+
+    data = path.read_bytes()
+    digest = content_hash(data)
+    if cached and cached.get('hash') == digest:
+        return rel_path, dict(cached, stat=signature)
+
+    return rel_path, {'hash': digest, 'stat': signature, 'diagnostics': check_rule(rel_path, data)}
+
+
+def validate_template(root: Path, mappings: Dict[str, str], jobs: Optional[int] = None,
+                      use_cache: bool = True) -> List[Diagnostic]:
+    """Validate every rule file and the architecture catalog under root.
+
+    Rule files are checked concurrently; results are cached in
+    .cursor/.validate-cache.json keyed by content hash.
+    """
+    root = Path(root)
+    rules_dir = root / '.cursor' / 'rules'
+    arch_file = root / 'architectures.json'
+    cache_path = root / '.cursor' / CACHE_FILENAME if use_cache and rules_dir.parent.exists() else None
+    cache = _load_cache(cache_path)
+
+    rule_files = sorted(rules_dir.rglob('*.mdc')) if rules_dir.exists() else []
+
+    def catalog_task() -> Dict:
+        if not arch_file.exists():
+            return {'key': None, 'diagnostics': [
+                _diagnostic('architectures.json', 1, 'error', 'CAT001', 'architectures.json not found')]}
+        arch_bytes = arch_file.read_bytes()
+        key = _catalog_cache_key(root, arch_bytes, mappings)
+        if cache['catalog'].get('key') == key:
+            return cache['catalog']
+        return {'key': key, 'diagnostics': check_catalog(
+            root, arch_bytes.decode('utf-8', errors='replace'), mappings)}
+
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        catalog_future = pool.submit(catalog_task)
+        rule_results = list(pool.map(
+            lambda path: _validate_rule_file(root, path, cache['rules'].get(path.relative_to(root).as_posix())),
+            rule_files))
+        catalog_result = catalog_future.result()
+
+    new_cache = {
+        'version': CACHE_VERSION,
+        'rules': dict(rule_results),
+        'catalog': catalog_result,
+    }
+    if new_cache != cache:
+        _save_cache(cache_path, new_cache)
+
+    diagnostics = []
+    for _, result in rule_results:
+        diagnostics.extend(result['diagnostics'])
+    diagnostics.extend(catalog_result['diagnostics'])
+    return diagnostics